@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 import os
+from datetime import timedelta
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -49,10 +50,14 @@ INSTALLED_APPS = [
     'drf_spectacular',
     'user',
     'book',
+    'benchmark',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.MetricsMiddleware',
+    'core.middleware.CompressionMiddleware',
+    'core.middleware.ServerTimingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -80,24 +85,93 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'app.wsgi.application'
 
+# Serve the book and page reads with async views, set by app.asgi.
+ASYNC_READ_VIEWS = bool(int(os.environ.get('ASYNC_READ_VIEWS', 0)))
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# With DB_POOL, connections are returned to a per-process pool at the end of
+# each request instead of being closed. Otherwise each thread keeps its
+# connection for DB_CONN_MAX_AGE seconds.
+DB_POOL = bool(int(os.environ.get('DB_POOL', 0)))
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
+        'ENGINE': (
+            'core.db.backends.mysql' if DB_POOL else 'django.db.backends.mysql'
+        ),
         'NAME': os.environ.get('DB_NAME'),
         'USER': os.environ.get('DB_USER'),
         'PASSWORD': os.environ.get('DB_PASS'),
         'HOST': os.environ.get('DB_HOST'),
         'PORT': os.environ.get('DB_PORT', '3306'),
+        'CONN_MAX_AGE': (
+            0 if DB_POOL else int(os.environ.get('DB_CONN_MAX_AGE', 60))
+        ),
+        'CONN_HEALTH_CHECKS': bool(
+            int(os.environ.get('DB_CONN_HEALTH_CHECKS', 1))
+        ),
+        'POOL': {
+            'SIZE': int(os.environ.get('DB_POOL_SIZE', 5)),
+            'MAX_OVERFLOW': int(os.environ.get('DB_POOL_MAX_OVERFLOW', 10)),
+            # Seconds before a connection is replaced, below wait_timeout.
+            'RECYCLE': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+            # Seconds a request waits for a connection when all are in use.
+            'TIMEOUT': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        },
         'TEST': {
             'NAME': f"test_{os.environ.get('DB_NAME')}",
         },
     }
 }
 
+# Read replicas, as comma separated hosts sharing the primary credentials.
+# Safe requests of the book and page APIs read from them, except for clients
+# that wrote within the last DB_REPLICA_PIN_SECONDS.
+DATABASE_REPLICAS = []
+for index, host in enumerate(
+    filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(',')), start=1
+):
+    DATABASES[f'replica{index}'] = {
+        **DATABASES['default'],
+        'HOST': host.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica{index}')
+
+DATABASE_ROUTERS = ['core.db.routers.ReplicaRouter']
+DATABASE_REPLICA_PIN_SECONDS = int(
+    os.environ.get('DB_REPLICA_PIN_SECONDS', 10)
+)
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        'disabled': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        },
+    }
+
+# Cache alias and lifetime in seconds of the serialized book and page payloads.
+# The versions are bumped in the cache, so it must be shared by the workers:
+# without Redis nothing is cached.
+BOOK_CACHE_ALIAS = 'default' if os.environ.get('REDIS_URL') else 'disabled'
+BOOK_CACHE_TIMEOUT = int(os.environ.get('BOOK_CACHE_TIMEOUT', 300))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -129,9 +203,65 @@ USE_I18N = True
 USE_TZ = True
 
 
+# Response compression, brotli is used when installed and preferred.
+COMPRESSION_MIN_LENGTH = int(os.environ.get('COMPRESSION_MIN_LENGTH', 512))
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', 4))
+
+# Server-Timing header with the SQL, serialization and view times: sent to
+# all, staff or off. The times can also be logged, one line per request.
+SERVER_TIMING = os.environ.get('SERVER_TIMING', 'staff')
+SERVER_TIMING_LOG = bool(int(os.environ.get('SERVER_TIMING_LOG', 0)))
+
+# Page read events are buffered per worker and written in batches of
+# READ_EVENTS_BATCH_SIZE, or every READ_EVENTS_FLUSH_INTERVAL seconds.
+READ_EVENTS_BUFFER_SIZE = int(os.environ.get('READ_EVENTS_BUFFER_SIZE', 10000))
+READ_EVENTS_BATCH_SIZE = int(os.environ.get('READ_EVENTS_BATCH_SIZE', 500))
+READ_EVENTS_FLUSH_INTERVAL = float(
+    os.environ.get('READ_EVENTS_FLUSH_INTERVAL', 1.0)
+)
+
+# Reading progress updates are debounced per worker: the latest page per
+# user and book is written every READING_PROGRESS_FLUSH_INTERVAL seconds.
+READING_PROGRESS_BUFFER_SIZE = int(
+    os.environ.get('READING_PROGRESS_BUFFER_SIZE', 10000)
+)
+READING_PROGRESS_FLUSH_INTERVAL = float(
+    os.environ.get('READING_PROGRESS_FLUSH_INTERVAL', 5.0)
+)
+
+# Prometheus metrics at /metrics behind a bearer token, the endpoint is
+# disabled until METRICS_TOKEN is set.
+METRICS_ENABLED = bool(int(os.environ.get('METRICS_ENABLED', 1)))
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'core.middleware': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    # Writes a .gz next to each text asset for nginx `gzip_static`.
+    'staticfiles': {
+        'BACKEND': 'core.storage.GzipStaticFilesStorage',
+    },
+}
+
 STATIC_URL = '/static/static/'
 MEDIA_URL = '/static/media/'
 
@@ -145,9 +275,43 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'core.User'
 
+# Authenticate from the token claims without loading the user row, and
+# optionally reject tokens issued before a role change or deactivation. The
+# revocations must be kept in a cache shared by the workers.
+JWT_STATELESS_AUTH = bool(int(os.environ.get('JWT_STATELESS_AUTH', 0)))
+JWT_REVOCATION_CHECK = bool(int(os.environ.get('JWT_REVOCATION_CHECK', 0)))
+JWT_REVOCATION_CACHE_ALIAS = 'default'
+
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # JSON through orjson, MessagePack for `Accept: application/msgpack`.
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.ORJSONRenderer',
+        'core.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.ORJSONParser',
+        'core.parsers.MessagePackParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    'TEST_REQUEST_RENDERER_CLASSES': (
+        'rest_framework.renderers.MultiPartRenderer',
+        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.MessagePackRenderer',
+    ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
+        'user.authentication.StatelessJWTAuthentication'
+        if JWT_STATELESS_AUTH else
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     )
 }
+
+SIMPLE_JWT = {
+    # Also the longest a stateless token may carry a stale role.
+    'ACCESS_TOKEN_LIFETIME': timedelta(
+        minutes=int(os.environ.get('JWT_ACCESS_TOKEN_MINUTES', 5))
+    ),
+    'TOKEN_USER_CLASS': 'user.authentication.RoleTokenUser',
+}
@@ -18,6 +18,8 @@ from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from django.contrib import admin
 from django.urls import path, include
 
+from core.views import DatabasePoolStatsView, MetricsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/schema/', SpectacularAPIView.as_view(), name='api-schema'),
@@ -28,4 +30,10 @@ urlpatterns = [
     ),
     path('api/user/', include('user.urls')),
     path('api/book/', include('book.urls')),
+    path(
+        'api/db/pool/',
+        DatabasePoolStatsView.as_view(),
+        name='db-pool-stats'
+    ),
+    path('metrics', MetricsView.as_view(), name='metrics'),
 ]
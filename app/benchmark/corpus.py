@@ -0,0 +1,105 @@
+"""
+Synthetic corpus of users, books and pages for the benchmarks.
+"""
+import random
+from dataclasses import dataclass, field
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from core.constants.roles_enum import Roles
+from core.models import Book, Page
+
+from book.signals import suppress_book_touch
+
+PASSWORD = 'benchmark-password'
+WORDS = (
+    'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod '
+    'tempor incididunt ut labore et dolore magna aliqua'
+).split()
+
+
+@dataclass
+class Corpus:
+    """Identifiers of the seeded objects the scenarios pick from."""
+    prefix: str
+    emails: list = field(default_factory=list)
+    editor_emails: list = field(default_factory=list)
+    book_uuids: list = field(default_factory=list)
+    page_uuids: list = field(default_factory=list)
+    pages_per_book: int = 0
+    password: str = PASSWORD
+
+
+def make_content(rng, length):
+    """Return `length` characters of words."""
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)[:length]
+
+
+def seed_corpus(
+    books, pages, users, prefix='bench', content_length=1024, seed=0,
+    batch_size=1000,
+):
+    """
+    Create `users` users, half of them editors, and `books` books of
+    `pages` pages each. Return the `Corpus`.
+    """
+    rng = random.Random(seed)
+    corpus = Corpus(prefix=prefix, pages_per_book=pages)
+    password = make_password(PASSWORD)
+    User = get_user_model()
+
+    with transaction.atomic(), suppress_book_touch():
+        User.objects.bulk_create(
+            User(
+                email=f'{prefix}-{i}@example.com',
+                name=f'{prefix} {i}',
+                password=password,
+                role=Roles.EDITOR if i % 2 == 0 else Roles.READER,
+            )
+            for i in range(users)
+        )
+        corpus.emails = [f'{prefix}-{i}@example.com' for i in range(users)]
+        corpus.editor_emails = corpus.emails[::2]
+
+        created = Book.objects.bulk_create(
+            (
+                Book(title=f'{prefix} book {i}', author=f'{prefix} author')
+                for i in range(books)
+            ),
+            batch_size=batch_size,
+        )
+        corpus.book_uuids = [book.uuid for book in created]
+        book_ids = Book.objects.filter(
+            uuid__in=corpus.book_uuids
+        ).values_list('id', flat=True)
+
+        for book_id in book_ids:
+            created = Page.objects.bulk_create(
+                (
+                    Page(
+                        book_id=book_id, number=number,
+                        content=make_content(rng, content_length),
+                    )
+                    for number in range(1, pages + 1)
+                ),
+                batch_size=batch_size,
+            )
+            corpus.page_uuids.extend(page.uuid for page in created)
+    return corpus
+
+
+def delete_corpus(prefix='bench'):
+    """Delete the users and books seeded with the prefix."""
+    with suppress_book_touch():
+        Book.objects.filter(author=f'{prefix} author').delete()
+    get_user_model().objects.filter(
+        email__startswith=f'{prefix}-', email__endswith='@example.com'
+    ).delete()
@@ -0,0 +1,126 @@
+"""
+Django command to load test the API routes.
+"""
+import json
+import platform
+import subprocess
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+
+from benchmark.corpus import delete_corpus, seed_corpus
+from benchmark.runner import run_benchmark
+from benchmark.scenarios import SCENARIOS
+
+
+def git_revision():
+    """Return the current git commit, if available."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True, cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    """
+    Seed N books x M pages x K users, drive the API routes from concurrent
+    threads and report latency percentiles, throughput and SQL queries per
+    request.
+    """
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument('--books', type=int, default=100)
+        parser.add_argument('--pages', type=int, default=50)
+        parser.add_argument('--users', type=int, default=10)
+        parser.add_argument('--content-length', type=int, default=1024)
+        parser.add_argument(
+            '--requests', type=int, default=200,
+            help='Requests per scenario.',
+        )
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument(
+            '--scenarios', nargs='+', choices=list(SCENARIOS),
+            default=list(SCENARIOS),
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--prefix', default='bench',
+            help='Prefix of the seeded users and books.',
+        )
+        parser.add_argument(
+            '--output', help='Write the results to this JSON file.',
+        )
+        parser.add_argument(
+            '--keep', action='store_true',
+            help='Keep the seeded corpus.',
+        )
+
+    def handle(self, *args, **options):
+        if options['users'] < 2 or options['books'] < 1:
+            raise CommandError('Seed at least 2 users and 1 book.')
+        if options['pages'] < 1:
+            raise CommandError('Seed at least 1 page per book.')
+
+        delete_corpus(options['prefix'])
+        started = time.perf_counter()
+        corpus = seed_corpus(
+            options['books'], options['pages'], options['users'],
+            prefix=options['prefix'],
+            content_length=options['content_length'],
+            seed=options['seed'],
+        )
+        self.stdout.write(
+            f'Seeded {options["books"]} books x {options["pages"]} pages x '
+            f'{options["users"]} users in '
+            f'{time.perf_counter() - started:.1f}s.'
+        )
+
+        try:
+            with override_settings(ALLOWED_HOSTS=['testserver']):
+                results = run_benchmark(
+                    corpus, options['scenarios'], options['requests'],
+                    options['concurrency'], options['seed'],
+                )
+        finally:
+            if not options['keep']:
+                delete_corpus(options['prefix'])
+
+        for scenario, summary in results.items():
+            latency = summary['latency_ms']
+            self.stdout.write(
+                f'{scenario:>14}: {summary["rps"]:9.1f} req/s  '
+                f'p50 {latency["p50"]:8.2f} ms  '
+                f'p95 {latency["p95"]:8.2f} ms  '
+                f'p99 {latency["p99"]:8.2f} ms  '
+                f'{summary["queries_per_request"]:5.1f} queries  '
+                f'{summary["errors"]} errors'
+            )
+
+        if options['output']:
+            report = {
+                'created_at': time.strftime(
+                    '%Y-%m-%dT%H:%M:%SZ', time.gmtime()
+                ),
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'database': connection.vendor,
+                'parameters': {
+                    name: options[name] for name in (
+                        'books', 'pages', 'users', 'content_length',
+                        'requests', 'concurrency', 'seed',
+                    )
+                },
+                'results': results,
+            }
+            with open(options['output'], 'w') as output:
+                json.dump(report, output, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(
+                f'Results written to {options["output"]}.'
+            ))
@@ -0,0 +1,161 @@
+"""
+Django command to compare the sync and async read paths under a slow
+database.
+"""
+import asyncio
+import importlib
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import ThreadSensitiveContext
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import clear_url_caches, reverse
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.models import Book, Page
+
+from benchmark.stats import percentile
+
+
+class Command(BaseCommand):
+    """
+    Run the same GETs through the WSGI path with a fixed number of workers
+    and through the async views, adding a fixed latency to every query.
+    """
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument(
+            '--concurrency', type=int, default=50,
+            help='Requests in flight for the async run.',
+        )
+        parser.add_argument(
+            '--workers', type=int, default=4,
+            help='Sync workers, as started by scripts/run.sh.',
+        )
+        parser.add_argument(
+            '--db-latency-ms', type=float, default=20,
+            help='Latency added to every SQL query.',
+        )
+
+    def handle(self, *args, **options):
+        latency = options['db_latency_ms'] / 1000
+
+        def slow_query(execute, sql, params, many, context):
+            time.sleep(latency)
+            return execute(sql, params, many, context)
+
+        def add_latency(sender, connection, **kwargs):
+            connection.execute_wrappers.append(slow_query)
+
+        user = get_user_model().objects.create_user(
+            email='benchmark-async@example.com', password=None
+        )
+        book = Book.objects.create(title='Benchmark', author='Benchmark')
+        Page.objects.bulk_create(
+            Page(book=book, number=i, content='x' * 1024)
+            for i in range(1, 31)
+        )
+        headers = {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+        paths = [
+            reverse('book:book-list'),
+            f"{reverse('book:page-list')}?book_uuid={book.uuid}",
+        ]
+        # Threads open their own connections, only new ones get the wrapper.
+        connections.close_all()
+        connection_created.connect(add_latency)
+        try:
+            results = {
+                'sync': self.run_sync(paths, headers, options),
+                'async': self.run_async(paths, headers, options),
+            }
+        finally:
+            connection_created.disconnect(add_latency)
+            connections.close_all()
+            book.delete()
+            user.delete()
+
+        for mode, (elapsed, latencies, statuses) in results.items():
+            self.stdout.write(
+                f'{mode:>5}: {len(latencies) / elapsed:8.1f} req/s  '
+                f'p50 {statistics.median(latencies) * 1000:7.1f} ms  '
+                f'p95 {percentile(latencies, 95) * 1000:7.1f} ms  '
+                f'statuses {sorted(set(statuses))}'
+            )
+        speedup = results['sync'][0] / results['async'][0]
+        self.stdout.write(self.style.SUCCESS(
+            f'Async throughput gain: {speedup:.1f}x'
+        ))
+
+    def run_sync(self, paths, headers, options):
+        """Run the requests through WSGI with a pool of workers."""
+        def fetch(i):
+            started = time.perf_counter()
+            response = Client(headers=headers).get(paths[i % len(paths)])
+            connection.close()
+            return time.perf_counter() - started, response.status_code
+
+        with settings_for(async_reads=False):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(options['workers']) as executor:
+                rows = list(executor.map(fetch, range(options['requests'])))
+            elapsed = time.perf_counter() - started
+        return elapsed, [row[0] for row in rows], [row[1] for row in rows]
+
+    def run_async(self, paths, headers, options):
+        """Run the requests through the async views."""
+        semaphore = asyncio.Semaphore(options['concurrency'])
+
+        async def fetch(i):
+            async with semaphore, ThreadSensitiveContext():
+                started = time.perf_counter()
+                response = await AsyncClient().get(
+                    paths[i % len(paths)], headers=headers
+                )
+                return time.perf_counter() - started, response.status_code
+
+        async def run():
+            return await asyncio.gather(
+                *(fetch(i) for i in range(options['requests']))
+            )
+
+        with settings_for(async_reads=True):
+            started = time.perf_counter()
+            rows = asyncio.run(run())
+            elapsed = time.perf_counter() - started
+        return elapsed, [row[0] for row in rows], [row[1] for row in rows]
+
+
+class settings_for(override_settings):
+    """Switch the read views, reloading the URLconf."""
+
+    def __init__(self, async_reads):
+        super().__init__(
+            ASYNC_READ_VIEWS=async_reads, ALLOWED_HOSTS=['testserver']
+        )
+
+    def enable(self):
+        super().enable()
+        reload_urls()
+
+    def disable(self):
+        super().disable()
+        reload_urls()
+
+
+def reload_urls():
+    """Rebuild the URLconf, which reads `ASYNC_READ_VIEWS` on import."""
+    for module in ('book.urls', 'app.urls'):
+        if module in sys.modules:
+            importlib.reload(sys.modules[module])
+    clear_url_caches()
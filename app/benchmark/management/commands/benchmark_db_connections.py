@@ -0,0 +1,66 @@
+"""
+Django command to measure the connection cost of each request.
+"""
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.utils import load_backend
+
+from core.db.pool import close_pools
+
+
+class Command(BaseCommand):
+    """
+    Run a query per simulated request, connecting for every request,
+    keeping a persistent connection and using the pool.
+    """
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        settings_dict = connections[options['database']].settings_dict
+        modes = {
+            'connect': {'CONN_MAX_AGE': 0},
+            'persistent': {'CONN_MAX_AGE': None},
+        }
+        if settings_dict['ENGINE'].endswith('.mysql'):
+            modes['pool'] = {
+                'ENGINE': 'core.db.backends.mysql', 'CONN_MAX_AGE': 0,
+            }
+        else:
+            self.stdout.write('The pool needs MySQL, skipping it.')
+
+        for mode, overrides in modes.items():
+            wrapper = load_backend(
+                overrides.get('ENGINE', settings_dict['ENGINE'])
+            ).DatabaseWrapper(
+                {**settings_dict, **overrides}, alias=f'benchmark-{mode}'
+            )
+            try:
+                latencies = self.run(wrapper, options['requests'])
+            finally:
+                wrapper.close()
+            self.stdout.write(
+                f'{mode:>10}: '
+                f'p50 {statistics.median(latencies) * 1000:6.2f} ms  '
+                f'mean {statistics.mean(latencies) * 1000:6.2f} ms'
+            )
+        close_pools()
+
+    def run(self, wrapper, requests):
+        """Return the latency of each simulated request."""
+        latencies = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            with wrapper.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+            # What the request_finished signal does.
+            wrapper.close_if_unusable_or_obsolete()
+            latencies.append(time.perf_counter() - started)
+        return latencies
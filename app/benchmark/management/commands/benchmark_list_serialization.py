@@ -0,0 +1,100 @@
+"""
+Django command to compare the model and values() serialization of lists.
+"""
+import statistics
+import time
+
+from rest_framework.renderers import JSONRenderer
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Book, Page
+
+from book import serializers
+
+
+class Command(BaseCommand):
+    """
+    Render page and book lists through the model serializers and through
+    the values serializers used by the list endpoints.
+    """
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', type=int, nargs='+', default=[15, 100, 1000],
+        )
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        largest = max(options['sizes'])
+        books = Book.objects.bulk_create(
+            Book(title=f'Benchmark {i}', author='Benchmark')
+            for i in range(largest)
+        )
+        book = books[0]
+        Page.objects.bulk_create(
+            Page(book=book, number=i, content='x' * 1024)
+            for i in range(1, largest + 1)
+        )
+        try:
+            for size in options['sizes']:
+                self.compare(
+                    'pages', size, options['repeat'],
+                    lambda: serializers.PageSerializer(
+                        Page.objects.filter(book__uuid=book.uuid)
+                        .order_by('number')[:size], many=True,
+                    ).data,
+                    lambda: serializers.PageValuesSerializer(
+                        Page.objects.filter(book__uuid=book.uuid)
+                        .order_by('number').values(
+                            *serializers.PageValuesSerializer.values_fields()
+                        )[:size], many=True,
+                    ).data,
+                )
+                self.compare(
+                    'books', size, options['repeat'],
+                    lambda: serializers.BookSerializer(
+                        Book.objects.order_by('-created_at', 'id')[:size],
+                        many=True,
+                    ).data,
+                    lambda: serializers.BookValuesSerializer(
+                        Book.objects.order_by('-created_at', 'id').values(
+                            *serializers.BookValuesSerializer.values_fields()
+                        )[:size], many=True,
+                    ).data,
+                )
+        finally:
+            Book.objects.filter(id__in=[item.id for item in books]).delete()
+
+    def compare(self, name, size, repeat, model_path, values_path):
+        """Print the timings of both paths for a list size."""
+        results = {
+            path: self.measure(function, repeat)
+            for path, function in (
+                ('model', model_path), ('values', values_path)
+            )
+        }
+        for path, (median, queries) in results.items():
+            self.stdout.write(
+                f'{name:>5} x{size:<5} {path:>6}: {median * 1000:8.2f} ms '
+                f'({queries} queries)'
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'{name:>5} x{size:<5} speedup: '
+            f'{results["model"][0] / results["values"][0]:.1f}x'
+        ))
+
+    def measure(self, function, repeat):
+        """Return the median time to serialize and render, and queries."""
+        renderer = JSONRenderer()
+        with CaptureQueriesContext(connection) as queries:
+            renderer.render(function())
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            renderer.render(function())
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings), len(queries)
@@ -0,0 +1,84 @@
+"""
+Concurrent runner of the benchmark scenarios.
+"""
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.test import Client
+
+from benchmark.scenarios import PageNumbers, SCENARIOS
+from benchmark.stats import summarize
+
+
+class QueryCounter:
+    """Execute wrapper counting the SQL queries of the current thread."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def issue_tokens(corpus):
+    """Return an access token for every user of the corpus."""
+    users = get_user_model().objects.filter(email__in=corpus.emails)
+    return {user.email: str(AccessToken.for_user(user)) for user in users}
+
+
+def run_scenario(scenario, corpus, tokens, requests, concurrency, seed=0):
+    """
+    Issue `requests` requests of a scenario from `concurrency` threads.
+
+    Return the (latency, status code, SQL queries) samples and the elapsed
+    wall time.
+    """
+    function = SCENARIOS[scenario]
+    numbers = PageNumbers(corpus)
+    shares = [
+        requests // concurrency + (1 if i < requests % concurrency else 0)
+        for i in range(concurrency)
+    ]
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        client = Client()
+        counter = QueryCounter()
+        samples = []
+        try:
+            with connections['default'].execute_wrapper(counter):
+                for _ in range(shares[index]):
+                    counter.count = 0
+                    started = time.perf_counter()
+                    response = function(client, corpus, tokens, rng, numbers)
+                    samples.append((
+                        time.perf_counter() - started,
+                        response.status_code,
+                        counter.count,
+                    ))
+        finally:
+            connections.close_all()
+        return samples
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return [sample for samples in results for sample in samples], elapsed
+
+
+def run_benchmark(corpus, scenarios, requests, concurrency, seed=0):
+    """Run the scenarios one after the other and return their summaries."""
+    tokens = issue_tokens(corpus)
+    return {
+        scenario: summarize(*run_scenario(
+            scenario, corpus, tokens, requests, concurrency, seed
+        ))
+        for scenario in scenarios
+    }
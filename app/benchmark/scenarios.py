@@ -0,0 +1,82 @@
+"""
+Requests issued by the benchmark, one scenario per API route.
+
+Each scenario takes a `Client`, the `Corpus`, the access tokens by email,
+a random generator and a `PageNumbers` source, and returns the response.
+"""
+import itertools
+import threading
+
+from django.urls import reverse
+
+
+class PageNumbers:
+    """Thread safe source of unused page numbers per book."""
+
+    def __init__(self, corpus):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.start = corpus.pages_per_book + 1
+
+    def next(self, book_uuid):
+        with self.lock:
+            counter = self.counters.setdefault(
+                book_uuid, itertools.count(self.start)
+            )
+            return next(counter)
+
+
+def auth(tokens, email):
+    return {'HTTP_AUTHORIZATION': f'Bearer {tokens[email]}'}
+
+
+def token(client, corpus, tokens, rng, numbers):
+    return client.post(
+        reverse('user:token'),
+        {'email': rng.choice(corpus.emails), 'password': corpus.password},
+        content_type='application/json',
+    )
+
+
+def book_list(client, corpus, tokens, rng, numbers):
+    return client.get(
+        reverse('book:book-list'), **auth(tokens, rng.choice(corpus.emails))
+    )
+
+
+def page_list(client, corpus, tokens, rng, numbers):
+    return client.get(
+        reverse('book:page-list'),
+        {'book_uuid': rng.choice(corpus.book_uuids)},
+        **auth(tokens, rng.choice(corpus.emails)),
+    )
+
+
+def page_retrieve(client, corpus, tokens, rng, numbers):
+    return client.get(
+        reverse('book:page-detail', args=[rng.choice(corpus.page_uuids)]),
+        **auth(tokens, rng.choice(corpus.emails)),
+    )
+
+
+def page_create(client, corpus, tokens, rng, numbers):
+    book_uuid = rng.choice(corpus.book_uuids)
+    return client.post(
+        reverse('book:page-list'),
+        {
+            'book': str(book_uuid),
+            'number': numbers.next(book_uuid),
+            'content': 'Benchmark page.',
+        },
+        content_type='application/json',
+        **auth(tokens, rng.choice(corpus.editor_emails)),
+    )
+
+
+SCENARIOS = {
+    'token': token,
+    'book_list': book_list,
+    'page_list': page_list,
+    'page_retrieve': page_retrieve,
+    'page_create': page_create,
+}
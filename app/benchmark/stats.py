@@ -0,0 +1,45 @@
+"""
+Statistics of the benchmark measurements.
+"""
+import statistics
+
+
+def percentile(values, q):
+    """Return the q percentile (0-100) of the values, interpolated."""
+    values = sorted(values)
+    if not values:
+        return None
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (
+        position - lower
+    )
+
+
+def summarize(samples, elapsed):
+    """
+    Return the summary of a scenario run.
+
+    `samples` are (latency in seconds, status code, SQL queries) tuples.
+    """
+    latencies = [latency for latency, _, _ in samples]
+    queries = [count for _, _, count in samples if count is not None]
+    errors = sum(1 for _, status, _ in samples if status >= 400)
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'elapsed_s': round(elapsed, 4),
+        'rps': round(len(samples) / elapsed, 2) if elapsed else None,
+        'latency_ms': {
+            name: round(percentile(latencies, q) * 1000, 3)
+            for name, q in (('p50', 50), ('p95', 95), ('p99', 99))
+        } if latencies else {},
+        'mean_latency_ms': (
+            round(statistics.mean(latencies) * 1000, 3)
+            if latencies else None
+        ),
+        'queries_per_request': (
+            round(statistics.mean(queries), 2) if queries else None
+        ),
+    }
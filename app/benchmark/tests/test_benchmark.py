@@ -0,0 +1,88 @@
+"""
+Tests for the benchmark suite.
+"""
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+from core.models import Book, Page
+
+from benchmark.corpus import delete_corpus, seed_corpus
+from benchmark.stats import percentile, summarize
+
+
+class StatsTests(SimpleTestCase):
+    """Tests for the benchmark statistics."""
+
+    def test_percentile_interpolated(self):
+        """Test percentiles are interpolated between samples."""
+        values = [4, 1, 3, 2]
+
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertEqual(percentile(values, 100), 4)
+
+    def test_summary(self):
+        """Test the summary of a scenario run."""
+        samples = [(0.010, 200, 2), (0.020, 200, 4), (0.030, 500, 3)]
+
+        summary = summarize(samples, elapsed=0.5)
+
+        self.assertEqual(summary['requests'], 3)
+        self.assertEqual(summary['errors'], 1)
+        self.assertEqual(summary['rps'], 6.0)
+        self.assertEqual(summary['latency_ms']['p50'], 20.0)
+        self.assertEqual(summary['queries_per_request'], 3)
+
+
+class CorpusTests(TestCase):
+    """Tests for the synthetic corpus."""
+
+    def test_seed_and_delete(self):
+        """Test the corpus is seeded at scale and deleted by prefix."""
+        corpus = seed_corpus(books=3, pages=4, users=5, prefix='test')
+
+        self.assertEqual(Book.objects.count(), 3)
+        self.assertEqual(Page.objects.count(), 12)
+        self.assertEqual(len(corpus.page_uuids), 12)
+        self.assertEqual(len(corpus.editor_emails), 3)
+        user = get_user_model().objects.get(email=corpus.emails[0])
+        self.assertTrue(user.check_password(corpus.password))
+
+        delete_corpus('test')
+
+        self.assertFalse(Book.objects.exists())
+        self.assertFalse(get_user_model().objects.exists())
+
+
+class BenchmarkCommandTests(TransactionTestCase):
+    """Tests for the benchmark command."""
+
+    def test_results_written(self):
+        """Test every scenario runs without errors and is reported."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        output = Path(directory.name) / 'results.json'
+
+        call_command(
+            'benchmark', books=2, pages=3, users=2, requests=4,
+            concurrency=2, output=str(output), stdout=StringIO(),
+        )
+
+        report = json.loads(output.read_text())
+        self.assertEqual(report['parameters']['books'], 2)
+        self.assertEqual(
+            set(report['results']),
+            {'token', 'book_list', 'page_list', 'page_retrieve',
+             'page_create'},
+        )
+        for summary in report['results'].values():
+            self.assertEqual(summary['requests'], 4)
+            self.assertEqual(summary['errors'], 0)
+            self.assertGreater(summary['queries_per_request'], 0)
+        self.assertFalse(Book.objects.exists())
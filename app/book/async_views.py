@@ -0,0 +1,269 @@
+"""
+Async views for the book and page read APIs.
+
+Used when the app is served over ASGI (`ASYNC_READ_VIEWS`). Plain GETs of
+the book and page lists and details are answered with the async ORM, so a
+request waiting on the database does not hold a worker thread. Requests
+using anything else (writes, filters, ordering, cursors, formats other
+than JSON, failed authentication, ...) are handed to the synchronous
+viewsets, which keeps their behaviour identical.
+"""
+import uuid
+
+from asgiref.sync import sync_to_async
+
+from rest_framework.exceptions import APIException, NotAcceptable
+from rest_framework.request import Request
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.decorators import classonlymethod
+from django.utils.http import http_date
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from core.db import routers
+from core.models import Book, Page
+from core.renderers import ORJSONRenderer
+
+from book import pagination, serializers
+from book.mixins import make_etag
+from book.views import BookViewSet, PageViewSet
+
+
+class AsyncReadView(View):
+    """
+    Serve GET requests asynchronously, delegate the rest to a viewset.
+    """
+    viewset = None
+    actions = None
+    sync_view = None
+    page_size = None
+    # Query parameters the async implementation understands.
+    query_params = frozenset()
+    media_type = 'application/json'
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        initkwargs.setdefault('sync_view', cls.viewset.as_view(cls.actions))
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def delegate(self, request, *args, **kwargs):
+        """Answer the request with the synchronous viewset."""
+        return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+
+    post = put = patch = delete = options = delegate
+
+    def authenticate(self, request):
+        """Return the authenticated user, or None."""
+        drf_request = Request(request, authenticators=[
+            authentication() for authentication
+            in self.viewset.authentication_classes
+        ])
+        try:
+            user = drf_request.user
+        except APIException:
+            return None
+        return user if user and user.is_authenticated else None
+
+    def negotiate(self, request):
+        """Return True if the viewset would answer with plain JSON."""
+        negotiator = self.viewset.content_negotiation_class()
+        try:
+            renderer, media_type = negotiator.select_renderer(
+                Request(request),
+                [renderer() for renderer in self.viewset.renderer_classes],
+            )
+        except NotAcceptable:
+            return False
+        return media_type == self.media_type
+
+    async def get(self, request, *args, **kwargs):
+        if not set(request.GET) <= self.query_params:
+            return await self.delegate(request, *args, **kwargs)
+        if not self.negotiate(request):
+            return await self.delegate(request, *args, **kwargs)
+        user = await sync_to_async(self.authenticate)(request)
+        if user is None:
+            return await self.delegate(request, *args, **kwargs)
+
+        if routers.primary_pinned(request):
+            response = await self.read(request, *args, **kwargs)
+        else:
+            with routers.replica_reads():
+                response = await self.read(request, *args, **kwargs)
+        if response is None:
+            return await self.delegate(request, *args, **kwargs)
+        return response
+
+    async def read(self, request, *args, **kwargs):
+        """Return the response, or None to let the viewset answer."""
+        raise NotImplementedError
+
+    def render(self, data):
+        response = HttpResponse(
+            ORJSONRenderer().render(data), content_type=self.media_type
+        )
+        response.headers['Vary'] = 'Accept'
+        return response
+
+    def conditional(self, request, last_modified, response=None):
+        """
+        Return a 304 for a fresh client copy, or add the validators to the
+        response. Matches the ETags of `ConditionalGetMixin`.
+        """
+        etag = make_etag(
+            last_modified, request.get_full_path(), self.media_type
+        )
+        timestamp = int(last_modified.timestamp())
+        if response is None:
+            response = get_conditional_response(
+                request, etag=etag, last_modified=timestamp
+            )
+            if response is None:
+                return None
+        response.headers['ETag'] = etag
+        response.headers['Last-Modified'] = http_date(timestamp)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    async def paginate(self, request, queryset):
+        """
+        Return the page number pagination payload, or None if the page is
+        invalid.
+        """
+        try:
+            number = int(request.GET.get('page', 1))
+        except ValueError:
+            return None
+        count = await queryset.acount()
+        if number < 1 or (number - 1) * self.page_size >= max(count, 1):
+            return None
+
+        offset = (number - 1) * self.page_size
+        rows = [row async for row in queryset[offset:offset + self.page_size]]
+
+        url = request.build_absolute_uri()
+        next_link = previous_link = None
+        if offset + self.page_size < count:
+            next_link = replace_query_param(url, 'page', number + 1)
+        if number == 2:
+            previous_link = remove_query_param(url, 'page')
+        elif number > 2:
+            previous_link = replace_query_param(url, 'page', number - 1)
+        return count, next_link, previous_link, rows
+
+
+def parse_uuid(value):
+    """Return the UUID of the value, or None if it is not one."""
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+class AsyncBookListView(AsyncReadView):
+    viewset = BookViewSet
+    actions = {'get': 'list', 'post': 'create'}
+    page_size = pagination.BookPagination.page_size
+    query_params = frozenset(['page'])
+
+    async def read(self, request):
+        serializer_class = serializers.BookValuesSerializer
+        queryset = Book.objects.order_by('-created_at', 'id').values(
+            *serializer_class.values_fields()
+        )
+        page = await self.paginate(request, queryset)
+        if page is None:
+            return None
+        count, next_link, previous_link, books = page
+        return self.render({
+            'count': count,
+            'next': next_link,
+            'previous': previous_link,
+            'results': serializer_class(books, many=True).data,
+        })
+
+
+class AsyncBookDetailView(AsyncReadView):
+    viewset = BookViewSet
+    actions = {
+        'get': 'retrieve',
+        'put': 'update',
+        'patch': 'partial_update',
+        'delete': 'destroy',
+    }
+
+    async def read(self, request, uuid):
+        book_uuid = parse_uuid(uuid)
+        if book_uuid is None:
+            return None
+        book = await Book.objects.filter(uuid=book_uuid).afirst()
+        if book is None:
+            return None
+
+        response = self.conditional(request, book.updated_at)
+        if response is not None:
+            return response
+        return self.conditional(
+            request, book.updated_at,
+            self.render(serializers.BookSerializer(book).data),
+        )
+
+
+class AsyncPageListView(AsyncReadView):
+    viewset = PageViewSet
+    actions = {'get': 'list', 'post': 'create'}
+    page_size = pagination.PagePagination.page_size
+    query_params = frozenset(['book_uuid', 'page'])
+
+    async def read(self, request):
+        book_uuid = parse_uuid(request.GET.get('book_uuid'))
+        if book_uuid is None:
+            return None
+        book = await Book.objects.only('id', 'uuid', 'updated_at').filter(
+            uuid=book_uuid
+        ).afirst()
+        if book is None:
+            return None
+
+        response = self.conditional(request, book.updated_at)
+        if response is not None:
+            return response
+
+        serializer_class = serializers.PageValuesSerializer
+        queryset = Page.objects.filter(book_id=book.id).order_by(
+            'number'
+        ).values(*serializer_class.values_fields())
+        page = await self.paginate(request, queryset)
+        if page is None:
+            return None
+        count, next_link, previous_link, pages = page
+        return self.conditional(request, book.updated_at, self.render({
+            'count': count,
+            'next': next_link,
+            'previous': previous_link,
+            'results': serializer_class(pages, many=True).data,
+        }))
+
+
+class AsyncPageDetailView(AsyncReadView):
+    viewset = PageViewSet
+    actions = {
+        'get': 'retrieve',
+        'put': 'update',
+        'patch': 'partial_update',
+        'delete': 'destroy',
+    }
+
+    async def read(self, request, uuid):
+        page_uuid = parse_uuid(uuid)
+        if page_uuid is None:
+            return None
+        page = await Page.objects.filter(
+            uuid=page_uuid, book__deleted_at__isnull=True
+        ).afirst()
+        if page is None:
+            return None
+        return self.render(serializers.PageDetailSerializer(page).data)
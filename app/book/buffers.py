@@ -0,0 +1,130 @@
+"""
+Buffers written to the database by a background thread of each worker.
+
+Requests only add to a buffer, so frequent small writes cost no query on
+the request path. The thread writes a batch when the buffer says it is
+ready, and at least every `interval` seconds.
+"""
+import atexit
+import logging
+import os
+import threading
+
+from django.db import close_old_connections, connections
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundBuffer:
+    """
+    Base class of the buffers.
+
+    Subclasses keep the pending items under `lock`, and implement `take`
+    to remove a batch of them and `write` to store it.
+    """
+    thread_name = 'buffer'
+
+    def __init__(self, interval, autostart=True):
+        self.interval = interval
+        self.autostart = autostart
+        self.lock = threading.Lock()
+        self.wakeup = threading.Condition(self.lock)
+        self.flush_lock = threading.Lock()
+        self.thread = None
+        self.closed = False
+
+    def is_ready(self):
+        """Return whether to write before the interval, with the lock."""
+        return False
+
+    def notify_if_ready(self):
+        """Wake the thread up when ready, called with the lock."""
+        if self.is_ready():
+            self.wakeup.notify()
+
+    def take(self):
+        """Remove and return the next batch, empty when there is none."""
+        raise NotImplementedError
+
+    def write(self, batch):
+        """Store a batch, return the number of items written."""
+        raise NotImplementedError
+
+    def failed(self, batch):
+        """Account for a batch that could not be written."""
+
+    def flush(self):
+        """Write every pending item, return the number written."""
+        written = 0
+        with self.flush_lock:
+            while batch := self.take():
+                try:
+                    written += self.write(batch)
+                except Exception:
+                    # Any error, connection ones included, loses the
+                    # batch but must not stop the background thread.
+                    logger.exception(
+                        'Could not write %d items of %s.',
+                        len(batch), self.thread_name,
+                    )
+                    self.failed(batch)
+        return written
+
+    def run(self):
+        while not self.closed:
+            with self.lock:
+                self.wakeup.wait_for(
+                    lambda: self.closed or self.is_ready(),
+                    timeout=self.interval,
+                )
+            close_old_connections()
+            self.flush()
+        connections.close_all()
+
+    def start(self):
+        """Start the background thread, unless it is running."""
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(
+                target=self.run, name=self.thread_name, daemon=True
+            )
+        self.thread.start()
+
+    def ensure_started(self):
+        """Start the thread, or restart it if it died."""
+        if self.autostart and not self.closed and (
+            self.thread is None or not self.thread.is_alive()
+        ):
+            self.start()
+
+    def close(self):
+        """Stop the background thread and write the pending items."""
+        with self.lock:
+            self.closed = True
+            self.wakeup.notify()
+        if self.thread is not None:
+            self.thread.join()
+        self.flush()
+
+
+_buffers = {}
+_buffers_lock = threading.Lock()
+
+
+def get_process_buffer(name, factory):
+    """
+    Return the buffer `name` of the current process, built by `factory`.
+
+    Workers forked from a process that had the buffer get their own, its
+    thread did not survive the fork. Buffers are flushed on exit.
+    """
+    pid = os.getpid()
+    buffer = _buffers.get((name, pid))
+    if buffer is None:
+        with _buffers_lock:
+            buffer = _buffers.get((name, pid))
+            if buffer is None:
+                buffer = _buffers[name, pid] = factory()
+                atexit.register(buffer.close)
+    return buffer
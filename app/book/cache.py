@@ -0,0 +1,83 @@
+"""
+Shared cache of serialized book and page payloads.
+
+Every book has a version counter in the cache and every cached payload of
+the book is stored under the current version. Writing the book or one of
+its pages bumps the counter, which orphans all the old entries at once
+without scanning keys; they simply expire.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from core.models import Book
+
+
+def get_cache():
+    """Return the cache configured for the book payloads."""
+    return caches[getattr(settings, 'BOOK_CACHE_ALIAS', 'default')]
+
+
+def get_timeout():
+    """Return the lifetime of the cached payloads in seconds."""
+    return getattr(settings, 'BOOK_CACHE_TIMEOUT', 300)
+
+
+def version_key(book_uuid):
+    return f'book:{book_uuid}:version'
+
+
+def page_book_key(page_uuid):
+    return f'page:{page_uuid}:book'
+
+
+def payload_key(book_uuid, version, *parts):
+    return ':'.join(['book', str(book_uuid), f'v{version}', *map(str, parts)])
+
+
+def get_book_version(book_uuid):
+    """Return the current cache version of the book."""
+    cache = get_cache()
+    key = version_key(book_uuid)
+    version = cache.get(key)
+    if version is None:
+        # Start from the clock so a counter lost to eviction never reuses
+        # the version of entries that may still be cached.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_book_versions(book_uuids):
+    """Invalidate every cached payload of the given books."""
+    cache = get_cache()
+    for book_uuid in book_uuids:
+        key = version_key(book_uuid)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_books(book_ids):
+    """Invalidate the cached payloads of the books with the given ids."""
+    book_uuids = Book.objects.filter(id__in=book_ids).values_list(
+        'uuid', flat=True
+    )
+    bump_book_versions(book_uuids)
+
+
+def get_page_book(page_uuid):
+    """Return the uuid of the book of a page, if known to the cache."""
+    return get_cache().get(page_book_key(page_uuid))
+
+
+def set_page_book(page_uuid, book_uuid):
+    """Remember the book of a page."""
+    get_cache().set(page_book_key(page_uuid), book_uuid, get_timeout())
+
+
+def forget_page_book(page_uuid):
+    """Forget the book of a page."""
+    get_cache().delete(page_book_key(page_uuid))
@@ -0,0 +1,69 @@
+"""
+Fast deletion of books.
+
+Deleting a book through the ORM collects and deletes its pages one by
+one, firing the page signals for each. Instead a book is only marked
+deleted, which hides it at once, and `purge_deleted_books` later removes
+its rows in short batches of raw deletes.
+"""
+from functools import partial
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import (
+    Book,
+    BookReadRollup,
+    Page,
+    PageReadCount,
+    ReadingProgress,
+)
+
+from book import cache
+
+
+def soft_delete_book(book):
+    """Mark a book deleted with a single UPDATE."""
+    Book.objects.filter(pk=book.pk).update(deleted_at=timezone.now())
+    transaction.on_commit(
+        partial(cache.bump_book_versions, [book.uuid])
+    )
+
+
+def delete_in_batches(queryset, batch_size):
+    """
+    Delete the rows of a queryset in batches, return how many.
+
+    No signal is sent and no relation is collected, so the rows depending
+    on them must already be gone.
+    """
+    model = queryset.model
+    deleted = 0
+    while ids := list(queryset.values_list('pk', flat=True)[:batch_size]):
+        # Each batch commits on its own so locks are held briefly.
+        deleted += model._base_manager.filter(pk__in=ids)._raw_delete(
+            queryset.db
+        )
+    return deleted
+
+
+def purge_book(book_id, batch_size=1000):
+    """Delete a deleted book and everything of it, return the page count."""
+    for model in (PageReadCount, BookReadRollup, ReadingProgress):
+        delete_in_batches(
+            model.objects.filter(book_id=book_id), batch_size
+        )
+    pages = delete_in_batches(
+        Page.objects.filter(book_id=book_id), batch_size
+    )
+    Book.all_objects.filter(pk=book_id)._raw_delete(Book.all_objects.db)
+    return pages
+
+
+def purge_deleted_books(batch_size=1000):
+    """Purge every deleted book, return the book and page counts."""
+    book_ids = list(Book.all_objects.filter(
+        deleted_at__isnull=False
+    ).values_list('id', flat=True))
+    pages = sum(purge_book(book_id, batch_size) for book_id in book_ids)
+    return len(book_ids), pages
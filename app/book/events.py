@@ -0,0 +1,120 @@
+"""
+In process buffer of the page read events.
+
+Requests only append to the buffer, see `book.buffers`. A background
+thread of each worker writes the events with `bulk_create` once
+`READ_EVENTS_BATCH_SIZE` of them are waiting or every
+`READ_EVENTS_FLUSH_INTERVAL` seconds. When the buffer holds
+`READ_EVENTS_BUFFER_SIZE` events, new ones are refused so clients back
+off instead of the worker running out of memory.
+"""
+from collections import deque
+
+from prometheus_client import Counter, Gauge
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.models import Page, ReadEvent
+
+from book.buffers import BackgroundBuffer, get_process_buffer
+
+READ_EVENTS = Counter(
+    'read_events_total',
+    'Page read events by outcome: accepted, dropped (buffer full), '
+    'written, invalid (unknown page) or failed (write error).',
+    ['result'],
+)
+READ_EVENTS_BUFFERED = Gauge(
+    'read_events_buffered',
+    'Page read events waiting to be written.',
+    multiprocess_mode='livesum',
+)
+
+
+class ReadEventBuffer(BackgroundBuffer):
+    """
+    Bounded buffer of `(user id, page uuid, read at)` events.
+
+    Pages are resolved by uuid when the batch is written, with one query
+    for the whole batch, so recording an event does not touch the
+    database.
+    """
+    thread_name = 'read-events'
+
+    def __init__(self, capacity, batch_size, interval, autostart=True):
+        super().__init__(interval, autostart)
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.events = deque()
+        self.counts = dict.fromkeys(
+            ('accepted', 'dropped', 'written', 'invalid', 'failed'), 0
+        )
+
+    def count(self, result, amount=1):
+        self.counts[result] += amount
+        READ_EVENTS.labels(result).inc(amount)
+
+    def add(self, user_id, page_uuid, read_at):
+        """Buffer an event, return False if the buffer is full."""
+        with self.lock:
+            if len(self.events) >= self.capacity:
+                self.count('dropped')
+                return False
+            self.events.append((user_id, page_uuid, read_at))
+            self.count('accepted')
+            READ_EVENTS_BUFFERED.inc()
+            self.notify_if_ready()
+        self.ensure_started()
+        return True
+
+    def is_ready(self):
+        return len(self.events) >= self.batch_size
+
+    def take(self):
+        """Remove and return the next batch of events."""
+        with self.lock:
+            batch = [
+                self.events.popleft()
+                for _ in range(min(self.batch_size, len(self.events)))
+            ]
+        READ_EVENTS_BUFFERED.dec(len(batch))
+        return batch
+
+    def write(self, batch):
+        """Write a batch of events, return the number written."""
+        pages = {
+            page_uuid: (page_id, book_id)
+            for page_uuid, page_id, book_id in Page.objects.filter(
+                uuid__in={page_uuid for _, page_uuid, _ in batch}
+            ).values_list('uuid', 'id', 'book_id')
+        }
+        events = [
+            ReadEvent(
+                user_id=user_id, page_id=pages[page_uuid][0],
+                book_id=pages[page_uuid][1], read_at=read_at,
+            )
+            for user_id, page_uuid, read_at in batch
+            if page_uuid in pages
+        ]
+        ReadEvent.objects.bulk_create(events, batch_size=self.batch_size)
+        self.count('invalid', len(batch) - len(events))
+        self.count('written', len(events))
+        return len(events)
+
+    def failed(self, batch):
+        self.count('failed', len(batch))
+
+
+def get_buffer():
+    """Return the read event buffer of the current process."""
+    return get_process_buffer('read-events', lambda: ReadEventBuffer(
+        getattr(settings, 'READ_EVENTS_BUFFER_SIZE', 10000),
+        getattr(settings, 'READ_EVENTS_BATCH_SIZE', 500),
+        getattr(settings, 'READ_EVENTS_FLUSH_INTERVAL', 1.0),
+    ))
+
+
+def record_read(user_id, page_uuid):
+    """Buffer a page read, return False if the buffer is full."""
+    return get_buffer().add(user_id, page_uuid, timezone.now())
@@ -0,0 +1,50 @@
+"""
+Streaming exports of the pages of a book.
+"""
+import json
+
+from core.models import Page
+
+
+EXPORT_CHUNK_SIZE = 500
+
+
+def iter_book_pages(book, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield the given fields of every page of the book, in page order.
+
+    Pages are read in keyset chunks over the `(book_id, number)` index, so
+    neither the database driver nor the worker holds more than one chunk
+    in memory, whatever the size of the book.
+    """
+    queryset = Page.objects.filter(book=book).order_by('number')
+    last_number = None
+    while True:
+        chunk = queryset
+        if last_number is not None:
+            chunk = chunk.filter(number__gt=last_number)
+        rows = list(chunk.values(*fields)[:chunk_size])
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        last_number = rows[-1]['number']
+
+
+def export_ndjson(book):
+    """Yield the pages of the book as newline delimited JSON."""
+    for page in iter_book_pages(book, ['uuid', 'number', 'content']):
+        page['uuid'] = str(page['uuid'])
+        yield json.dumps(page, ensure_ascii=False) + '\n'
+
+
+def export_txt(book):
+    """Yield the pages of the book as plain text, one block per page."""
+    yield f'{book.title}\n{book.author}\n\n'
+    for page in iter_book_pages(book, ['number', 'content']):
+        yield f'[{page["number"]}]\n{page["content"]}\n\n'
+
+
+EXPORTERS = {
+    'ndjson': export_ndjson,
+    'txt': export_txt,
+}
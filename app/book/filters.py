@@ -0,0 +1,84 @@
+"""
+Filter backends for the book APIs.
+"""
+import datetime
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.translation import gettext_lazy as _
+
+
+class BookFilterBackend(BaseFilterBackend):
+    """
+    Filter books by exact author, title prefix and date ranges.
+
+    Every filter is backed by an index of `core_book`.
+    """
+    lookups = {
+        'author': 'author',
+        'title': 'title__istartswith',
+    }
+    date_lookups = {
+        'created_after': 'created_at__gte',
+        'created_before': 'created_at__lt',
+        'updated_after': 'updated_at__gte',
+        'updated_before': 'updated_at__lt',
+    }
+    descriptions = {
+        'author': _('Exact author of the books.'),
+        'title': _('Start of the title of the books.'),
+        'created_after': _('Books created at or after this date.'),
+        'created_before': _('Books created before this date.'),
+        'updated_after': _('Books modified at or after this date.'),
+        'updated_before': _('Books modified before this date.'),
+    }
+
+    def parse_date_param(self, name, value):
+        """Return the aware datetime of an ISO date or datetime value."""
+        try:
+            parsed = parse_datetime(value)
+            if parsed is None:
+                date = parse_date(value)
+                if date is not None:
+                    parsed = datetime.datetime.combine(date, datetime.time.min)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError(
+                {name: _('Enter a valid date or datetime.')}
+            )
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        filters = {
+            lookup: params[name]
+            for name, lookup in self.lookups.items()
+            if params.get(name)
+        }
+        filters.update({
+            lookup: self.parse_date_param(name, params[name])
+            for name, lookup in self.date_lookups.items()
+            if params.get(name)
+        })
+        return queryset.filter(**filters)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': name,
+                'required': False,
+                'in': 'query',
+                'description': str(self.descriptions[name]),
+                'schema': (
+                    {'type': 'string', 'format': 'date-time'}
+                    if name in self.date_lookups else {'type': 'string'}
+                ),
+            }
+            for name in [*self.lookups, *self.date_lookups]
+        ]
@@ -0,0 +1,291 @@
+"""
+Mixins for the book and page viewsets.
+"""
+import hashlib
+import uuid
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import gettext_lazy as _
+
+from core import metrics
+from core.db import routers
+from core.models import Book
+
+from book import cache
+
+
+def make_etag(last_modified, full_path, media_type):
+    """
+    Return the ETag of a representation of a book at a point in time.
+    """
+    key = '|'.join([last_modified.isoformat(), full_path, media_type or ''])
+    return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+
+class ReplicaReadMixin:
+    """
+    Answer safe requests from the read replicas.
+
+    Clients that wrote through the view within the pin window read from
+    the primary, see `core.db.routers`.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            if routers.primary_pinned(request):
+                return super().dispatch(request, *args, **kwargs)
+            with routers.replica_reads():
+                return super().dispatch(request, *args, **kwargs)
+
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code < 400:
+            routers.pin_to_primary(response)
+        return response
+
+
+class ValuesListMixin:
+    """
+    Read the list action as `.values()` rows.
+
+    The serializer of the action must use `ValuesSerializerMixin`. The
+    primary key is always selected for the cursor pagination.
+    """
+
+    def get_values_fields(self):
+        """Return the names of the values read by the list."""
+        return self.get_serializer_class().values_fields()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.values(
+                *dict.fromkeys(['id', *self.get_values_fields()])
+            )
+        return queryset
+
+
+class SparseFieldsMixin:
+    """
+    Output only the fields listed in `?fields=` on the read actions.
+
+    The columns of the other fields are not read either: the list selects
+    only their `.values()`, see `ValuesListMixin` which must follow this
+    mixin, and the detail defers them with `.only()`. The columns in
+    `get_sparse_required_fields` are always read.
+    """
+    sparse_actions = ('list', 'retrieve')
+    sparse_required_fields = ()
+
+    def get_sparse_fields(self):
+        """Return the requested field names, or None for all of them."""
+        if self.action not in self.sparse_actions:
+            return None
+        value = self.request.query_params.get('fields')
+        if value is None:
+            return None
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = set(names) - set(self.get_serializer_class()().fields)
+        if unknown:
+            raise ValidationError({
+                'fields': _('Unknown fields: %(fields)s.') % {
+                    'fields': ', '.join(sorted(unknown))
+                }
+            })
+        return names
+
+    def get_sparse_required_fields(self):
+        """Return the columns read whatever the requested fields."""
+        return list(self.sparse_required_fields)
+
+    def get_values_fields(self):
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return super().get_values_fields()
+        return [
+            *self.get_serializer_class().values_fields(fields),
+            *self.get_sparse_required_fields(),
+        ]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_sparse_fields()
+        if self.action == 'retrieve' and fields is not None:
+            serializer_fields = self.get_serializer_class()().fields
+            queryset = queryset.only(*dict.fromkeys([
+                *(serializer_fields[name].source for name in fields),
+                *self.get_sparse_required_fields(),
+            ]))
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_sparse_fields()
+        return context
+
+
+class BookScopedMixin:
+    """
+    Resolve the book a request reads from.
+    """
+
+    def get_request_book_uuid(self):
+        """Return the uuid of the book the response depends on."""
+        return self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+
+    def get_book_uuid(self):
+        """Return the normalized book uuid, or None if missing or invalid."""
+        book_uuid = self.get_request_book_uuid()
+        if not book_uuid:
+            return None
+        try:
+            return str(uuid.UUID(str(book_uuid)))
+        except ValueError:
+            return None
+
+    def get_book_updated_at(self, book_uuid):
+        """Return the updated_at of the book with a single lookup."""
+        return Book.objects.filter(uuid=book_uuid).values_list(
+            'updated_at', flat=True
+        ).first()
+
+
+class ConditionalGetMixin(BookScopedMixin):
+    """
+    Answer conditional GETs from the book's updated_at timestamp.
+
+    `Book.updated_at` changes whenever the book or one of its pages is
+    written, so it validates both. Requests carrying a matching
+    `If-None-Match` or `If-Modified-Since` get a `304 Not Modified` after
+    a single lookup, without loading or serializing anything.
+    """
+    conditional_actions = ('retrieve',)
+
+    def get_last_modified(self):
+        """Return the updated_at of the book, or None if unknown."""
+        book_uuid = self.get_book_uuid()
+        if not book_uuid:
+            return None
+        return self.get_book_updated_at(book_uuid)
+
+    def get_etag(self, last_modified):
+        """Return the ETag for the current request and timestamp."""
+        return make_etag(
+            last_modified,
+            self.request.get_full_path(),
+            self.request.accepted_media_type,
+        )
+
+    def conditional_response(self, view, request, *args, **kwargs):
+        """Return a 304 when the client copy is fresh, else call the view."""
+        if self.action not in self.conditional_actions:
+            return view(request, *args, **kwargs)
+        last_modified = self.get_last_modified()
+        if last_modified is None:
+            return view(request, *args, **kwargs)
+
+        etag = self.get_etag(last_modified)
+        timestamp = int(last_modified.timestamp())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        if response is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        response.headers['ETag'] = etag
+        response.headers['Last-Modified'] = http_date(timestamp)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+
+class CachedReadMixin(BookScopedMixin):
+    """
+    Serve read actions from the shared book cache.
+
+    Payloads are stored under the version of the book they were read
+    from, see `book.cache`. The version is read before the database so a
+    write committed in between can never be cached as current.
+    """
+    cached_actions = ('retrieve',)
+
+    def get_cache_key(self, book_uuid, version):
+        """Return the cache key of the payload for the current request."""
+        request = self.request
+        return cache.payload_key(
+            book_uuid, version, self.action,
+            hashlib.md5(request.build_absolute_uri().encode()).hexdigest(),
+            request.accepted_media_type or '',
+        )
+
+    def get_cache_timeout(self):
+        """
+        Return the lifetime of the payloads read by the current request.
+
+        A replica may not have caught up with the write that bumped the
+        version yet, so its payloads are only kept for the pin window.
+        """
+        if routers.reads_from_replicas():
+            return min(cache.get_timeout(), routers.get_pin_seconds())
+        return cache.get_timeout()
+
+    def get_book_updated_at(self, book_uuid):
+        version = cache.get_book_version(book_uuid)
+        key = cache.payload_key(book_uuid, version, 'updated_at')
+        updated_at = cache.get_cache().get(key)
+        metrics.observe_cache('updated_at', updated_at is not None)
+        if updated_at is None:
+            updated_at = super().get_book_updated_at(book_uuid)
+            if updated_at is not None:
+                cache.get_cache().set(
+                    key, updated_at, self.get_cache_timeout()
+                )
+        return updated_at
+
+    def cached_response(self, view, request, *args, **kwargs):
+        """Return the cached payload, or call the view and cache it."""
+        if self.action not in self.cached_actions:
+            return view(request, *args, **kwargs)
+        book_uuid = self.get_book_uuid()
+        if not book_uuid:
+            return view(request, *args, **kwargs)
+
+        key = self.get_cache_key(
+            book_uuid, cache.get_book_version(book_uuid)
+        )
+        data = cache.get_cache().get(key)
+        metrics.observe_cache('payload', data is not None)
+        if data is not None:
+            return Response(data)
+
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.get_cache().set(
+                key, response.data, self.get_cache_timeout()
+            )
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(
+            super().retrieve, request, *args, **kwargs
+        )
@@ -0,0 +1,129 @@
+"""
+Pagination classes for the book and page APIs.
+"""
+from rest_framework.pagination import (
+    BasePagination,
+    CursorPagination,
+    PageNumberPagination,
+)
+
+from django.utils.translation import gettext_lazy as _
+
+
+class BookPagination(PageNumberPagination):
+    page_size = 10
+
+
+class PagePagination(PageNumberPagination):
+    page_size = 15
+    invalid_page_message = _('Invalid page number.')
+    invalid_page_message_detail = _('Please provide a valid page number.')
+
+
+class BookCursorPagination(CursorPagination):
+    """
+    Keyset pagination for books, newest first.
+    """
+    page_size = BookPagination.page_size
+    ordering = ('-created_at', 'id')
+
+
+class PageCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the pages of a book.
+
+    Page lists are always filtered by book, so seeking on `number` walks
+    the `(book_id, number)` unique index directly.
+    """
+    page_size = PagePagination.page_size
+    ordering = ('number',)
+    invalid_cursor_message = _('Invalid cursor.')
+
+
+class SearchCursorPagination(CursorPagination):
+    """
+    Cursor pagination for search hits, ordered by the search backend.
+    """
+    page_size = 20
+
+    def get_ordering(self, request, queryset, view):
+        return view.search_backend.ordering
+
+
+class SwitchablePagination(BasePagination):
+    """
+    Pagination that serves page numbers by default and switches to
+    cursor (keyset) pagination on request.
+
+    Cursor mode is enabled with `?pagination=cursor`; the opaque `cursor`
+    parameter carried by the next/previous links keeps it enabled.
+    """
+    page_number_class = None
+    cursor_class = None
+    mode_query_param = 'pagination'
+    cursor_mode = 'cursor'
+
+    def __init__(self):
+        self.paginator = None
+
+    def use_cursor(self, request):
+        """Return True if the request asks for cursor pagination."""
+        query_params = request.query_params
+        return (
+            query_params.get(self.mode_query_param) == self.cursor_mode or
+            self.cursor_class.cursor_query_param in query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(request):
+            self.paginator = self.cursor_class()
+        else:
+            self.paginator = self.page_number_class()
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.page_number_class().get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = [{
+            'name': self.mode_query_param,
+            'required': False,
+            'in': 'query',
+            'description': str(_(
+                'Set to "cursor" to use cursor pagination.'
+            )),
+            'schema': {
+                'type': 'string',
+                'enum': [self.cursor_mode],
+            },
+        }]
+        page_number_paginator = self.page_number_class()
+        parameters += page_number_paginator.get_schema_operation_parameters(
+            view
+        )
+        parameters += [
+            parameter for parameter in
+            self.cursor_class().get_schema_operation_parameters(view)
+            if parameter['name'] == self.cursor_class.cursor_query_param
+        ]
+        return parameters
+
+    def to_html(self):
+        return self.paginator.to_html()
+
+    @property
+    def display_page_controls(self):
+        return getattr(self.paginator, 'display_page_controls', False)
+
+
+class BookListPagination(SwitchablePagination):
+    page_number_class = BookPagination
+    cursor_class = BookCursorPagination
+
+
+class PageListPagination(SwitchablePagination):
+    page_number_class = PagePagination
+    cursor_class = PageCursorPagination
@@ -0,0 +1,125 @@
+"""
+Reading progress of the users, debounced in process.
+
+Apps report the page a user is on as often as pages turn. Each worker
+keeps only the latest page per user and book and a background thread
+upserts them every `READING_PROGRESS_FLUSH_INTERVAL` seconds, see
+`book.buffers`, so rapid updates cost one row write per interval.
+"""
+from prometheus_client import Counter
+
+from django.conf import settings
+from django.db import connections, router
+from django.db.models import F, FilteredRelation, Q
+from django.utils import timezone
+
+from core.models import Book, ReadingProgress
+
+from book.buffers import BackgroundBuffer, get_process_buffer
+
+PROGRESS_UPDATES = Counter(
+    'reading_progress_updates_total',
+    'Reading progress updates by outcome: accepted, coalesced (replaced '
+    'a pending update), dropped (buffer full), written or failed.',
+    ['result'],
+)
+
+
+class ProgressBuffer(BackgroundBuffer):
+    """
+    Latest `(page number, updated at)` per `(user id, book uuid)`.
+
+    Books are resolved by uuid when the batch is written, with one query
+    for the whole batch, and the rows are written with a single upsert
+    (`INSERT ... ON DUPLICATE KEY UPDATE` on MySQL, which conflicts on the
+    `(user, book)` unique key without naming it).
+    """
+    thread_name = 'reading-progress'
+
+    def __init__(self, capacity, interval, autostart=True):
+        super().__init__(interval, autostart)
+        self.capacity = capacity
+        self.pending = {}
+
+    def add(self, user_id, book_uuid, page_number, updated_at):
+        """Buffer an update, return False if the buffer is full."""
+        key = (user_id, book_uuid)
+        with self.lock:
+            if key in self.pending:
+                PROGRESS_UPDATES.labels('coalesced').inc()
+            elif len(self.pending) >= self.capacity:
+                PROGRESS_UPDATES.labels('dropped').inc()
+                return False
+            self.pending[key] = (page_number, updated_at)
+            PROGRESS_UPDATES.labels('accepted').inc()
+        self.ensure_started()
+        return True
+
+    def take(self):
+        with self.lock:
+            batch, self.pending = self.pending, {}
+        return batch
+
+    def write(self, batch):
+        books = dict(Book.objects.filter(
+            uuid__in={book_uuid for _, book_uuid in batch}
+        ).values_list('uuid', 'id'))
+        progress = [
+            ReadingProgress(
+                user_id=user_id, book_id=books[book_uuid],
+                page_number=page_number, updated_at=updated_at,
+            )
+            for (user_id, book_uuid), (page_number, updated_at)
+            in batch.items()
+            if book_uuid in books
+        ]
+        using = router.db_for_write(ReadingProgress)
+        features = connections[using].features
+        ReadingProgress.objects.using(using).bulk_create(
+            progress, batch_size=500, update_conflicts=True,
+            unique_fields=(
+                ['user', 'book']
+                if features.supports_update_conflicts_with_target else None
+            ),
+            update_fields=['page_number', 'updated_at'],
+        )
+        PROGRESS_UPDATES.labels('written').inc(len(progress))
+        return len(progress)
+
+    def failed(self, batch):
+        PROGRESS_UPDATES.labels('failed').inc(len(batch))
+
+
+def get_buffer():
+    """Return the reading progress buffer of the current process."""
+    return get_process_buffer('reading-progress', lambda: ProgressBuffer(
+        getattr(settings, 'READING_PROGRESS_BUFFER_SIZE', 10000),
+        getattr(settings, 'READING_PROGRESS_FLUSH_INTERVAL', 5.0),
+    ))
+
+
+def record_progress(user_id, book_uuid, page_number):
+    """Buffer the page a user reached, return False if the buffer is full."""
+    return get_buffer().add(
+        user_id, book_uuid, page_number, timezone.now()
+    )
+
+
+def get_continue_reading(user_id, limit=10):
+    """
+    Return the books the user read last with the page they are on, in one
+    query joining the books and the pages.
+    """
+    return ReadingProgress.objects.filter(
+        user_id=user_id, book__deleted_at__isnull=True
+    ).annotate(
+        current_page=FilteredRelation(
+            'book__pages',
+            condition=Q(book__pages__number=F('page_number')),
+        ),
+    ).values(
+        'page_number', 'updated_at',
+        book_uuid=F('book__uuid'), title=F('book__title'),
+        author=F('book__author'), page_uuid=F('current_page__uuid'),
+        content=F('current_page__content'),
+    ).order_by('-updated_at')[:limit]
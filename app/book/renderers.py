@@ -0,0 +1,35 @@
+"""
+Renderers for the book exports.
+"""
+from rest_framework import renderers
+
+
+class NDJSONRenderer(renderers.BaseRenderer):
+    """
+    Newline delimited JSON, one object per line.
+
+    The export views stream their own response, so this renderer is only
+    used for content negotiation and for error responses.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return renderers.JSONRenderer().render(data) + b'\n'
+
+
+class PlainTextRenderer(renderers.BaseRenderer):
+    """
+    Plain text, used by the book exports.
+    """
+    media_type = 'text/plain'
+    format = 'txt'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, dict):
+            data = '\n'.join(
+                f'{key}: {value}' for key, value in data.items()
+            )
+        return str(data).encode(self.charset)
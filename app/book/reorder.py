@@ -0,0 +1,99 @@
+"""
+Insert, move and remove pages of a book, renumbering the others.
+
+Every operation runs in one transaction holding a lock on the book, and
+renumbers with a few set-based UPDATEs whatever the size of the book.
+A range of pages is shifted in two steps, first past the last page
+number and then to its place, because the `(book, number)` uniqueness is
+checked row by row during an UPDATE.
+"""
+from django.db import transaction
+from django.db.models import F, Max
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound, ValidationError
+
+from core.models import Book, Page
+
+from book.signals import suppress_book_touch, touch_books
+
+
+def lock_book(book):
+    """Lock the book for the transaction, return its last page number."""
+    Book.objects.select_for_update().filter(pk=book.pk).values('pk').get()
+    return Page.objects.filter(book=book).aggregate(
+        last=Max('number')
+    )['last'] or 0
+
+
+def shift_pages(book, start, end, delta, last):
+    """Add `delta` to the numbers of the pages from `start` to `end`."""
+    offset = last + abs(delta) + 1
+    pages = Page.objects.filter(book=book, number__gte=start)
+    if end is not None:
+        pages = pages.filter(number__lte=end)
+    pages.update(number=F('number') + offset)
+    Page.objects.filter(book=book, number__gte=start + offset).update(
+        number=F('number') - offset + delta
+    )
+
+
+def get_page(book, number):
+    page = Page.objects.filter(book=book, number=number).first()
+    if page is None:
+        raise NotFound(_('Page %(number)d not found.') % {'number': number})
+    return page
+
+
+def insert_page(book, number, content):
+    """Insert a page at `number`, moving the following pages up."""
+    with transaction.atomic(), suppress_book_touch():
+        last = lock_book(book)
+        if number > last + 1:
+            raise ValidationError({
+                'number': _('Must be at most %(number)d.') % {
+                    'number': last + 1
+                }
+            })
+        shift_pages(book, number, None, 1, last)
+        page = Page.objects.create(book=book, number=number, content=content)
+        touch_books([book.id])
+    return page
+
+
+def move_page(book, number, to):
+    """Move the page `number` to `to`, shifting the pages in between."""
+    with transaction.atomic(), suppress_book_touch():
+        last = lock_book(book)
+        page = get_page(book, number)
+        if to > last:
+            raise ValidationError({
+                'to': _('Must be at most %(number)d.') % {'number': last}
+            })
+        if to != number and not Page.objects.filter(
+            book=book, number=to
+        ).exists():
+            raise ValidationError({'to': _('No page has this number.')})
+        if to == number:
+            return page
+
+        # The moved page is parked past the end while the others shift.
+        Page.objects.filter(pk=page.pk).update(number=last + 1)
+        if number < to:
+            shift_pages(book, number + 1, to, -1, last + 1)
+        else:
+            shift_pages(book, to, number - 1, 1, last + 1)
+        Page.objects.filter(pk=page.pk).update(number=to)
+        page.number = to
+        touch_books([book.id])
+    return page
+
+
+def remove_page(book, number):
+    """Delete the page `number`, moving the following pages down."""
+    with transaction.atomic(), suppress_book_touch():
+        last = lock_book(book)
+        page = get_page(book, number)
+        page.delete()
+        shift_pages(book, number + 1, None, -1, last)
+        touch_books([book.id])
@@ -0,0 +1,174 @@
+"""
+Reading statistics rolled up from the page read events.
+
+`compact_read_events` folds new events into per book hourly and daily
+counts and per page totals, so the statistics are read from a handful of
+small rows instead of counting events.
+"""
+import datetime
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from core.models import (
+    Book,
+    BookReadRollup,
+    Page,
+    PageReadCount,
+    ReadEvent,
+    ReadRollupCursor,
+)
+
+
+def add_book_reads(counts):
+    """Add `{(book id, granularity, period start): reads}` to the rollups."""
+    rollups = BookReadRollup.objects.filter(
+        book_id__in={book_id for book_id, _, _ in counts},
+        granularity__in={granularity for _, granularity, _ in counts},
+        period_start__in={start for _, _, start in counts},
+    )
+    existing = []
+    for rollup in rollups:
+        key = (rollup.book_id, rollup.granularity, rollup.period_start)
+        if key in counts:
+            rollup.reads += counts.pop(key)
+            existing.append(rollup)
+    BookReadRollup.objects.bulk_update(existing, ['reads'])
+    BookReadRollup.objects.bulk_create([
+        BookReadRollup(
+            book_id=book_id, granularity=granularity, period_start=start,
+            reads=reads,
+        )
+        for (book_id, granularity, start), reads in counts.items()
+    ])
+
+
+def add_page_reads(counts):
+    """Add `{(page id, book id): reads}` to the page totals."""
+    existing = list(PageReadCount.objects.filter(
+        page_id__in={page_id for page_id, _ in counts}
+    ))
+    for count in existing:
+        count.reads += counts.pop((count.page_id, count.book_id), 0)
+    PageReadCount.objects.bulk_update(existing, ['reads'])
+    PageReadCount.objects.bulk_create([
+        PageReadCount(page_id=page_id, book_id=book_id, reads=reads)
+        for (page_id, book_id), reads in counts.items()
+    ])
+
+
+def roll_up(after, until):
+    """Add the events with `after < id <= until` to the rollups."""
+    # Events of deleted books and pages are left out.
+    events = ReadEvent.objects.filter(
+        id__gt=after, id__lte=until,
+        book_id__in=Book.objects.values('id'),
+    )
+    book_counts = Counter()
+    compacted = 0
+    hours = events.annotate(
+        hour=TruncHour('read_at', tzinfo=datetime.timezone.utc)
+    ).values_list('book_id', 'hour').annotate(reads=Count('id')).order_by()
+    for book_id, hour, reads in hours:
+        day = hour.replace(hour=0)
+        book_counts[book_id, BookReadRollup.HOUR, hour] += reads
+        book_counts[book_id, BookReadRollup.DAY, day] += reads
+        compacted += reads
+
+    page_counts = dict(
+        ((page_id, book_id), reads)
+        for page_id, book_id, reads in events.filter(
+            page_id__in=Page.objects.values('id')
+        ).values_list('page_id', 'book_id').annotate(
+            reads=Count('id')
+        ).order_by()
+    )
+    add_book_reads(dict(book_counts))
+    add_page_reads(page_counts)
+    return compacted
+
+
+def compact_read_events(batch_size=10000, settle=True):
+    """
+    Fold the new read events into the rollups, return how many.
+
+    Each batch is committed with the cursor, so an interrupted compaction
+    resumes where it stopped. With `settle`, the events written since the
+    previous run are left for the next one.
+    """
+    latest = ReadEvent.objects.aggregate(latest=Max('id'))['latest'] or 0
+    # Created before locking, concurrent first runs then share the row.
+    ReadRollupCursor.objects.get_or_create(pk=1)
+    compacted = 0
+    while True:
+        with transaction.atomic():
+            cursor = ReadRollupCursor.objects.select_for_update().get(pk=1)
+            until = cursor.seen_event_id if settle else latest
+            if cursor.last_event_id >= until:
+                cursor.seen_event_id = max(cursor.seen_event_id, latest)
+                cursor.save(update_fields=['seen_event_id'])
+                return compacted
+            upper = min(cursor.last_event_id + batch_size, until)
+            compacted += roll_up(cursor.last_event_id, upper)
+            cursor.last_event_id = upper
+            cursor.save(update_fields=['last_event_id'])
+
+
+def get_book_stats(book, hours=48, days=30, top_pages=10):
+    """
+    Return the reads of a book: the total, the last `hours` hours, the
+    last `days` days and its most read pages.
+    """
+    now = timezone.now()
+    today = now.astimezone(datetime.timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    rollups = BookReadRollup.objects.filter(book=book).filter(
+        Q(
+            granularity=BookReadRollup.HOUR,
+            period_start__gt=now - datetime.timedelta(hours=hours),
+        ) |
+        Q(
+            granularity=BookReadRollup.DAY,
+            period_start__gt=today - datetime.timedelta(days=days),
+        )
+    ).order_by('period_start').values_list(
+        'granularity', 'period_start', 'reads'
+    )
+    series = {BookReadRollup.HOUR: [], BookReadRollup.DAY: []}
+    for granularity, start, reads in rollups:
+        series[granularity].append({'start': start, 'reads': reads})
+
+    total = BookReadRollup.objects.filter(
+        book=book, granularity=BookReadRollup.DAY
+    ).aggregate(reads=Sum('reads'))['reads'] or 0
+    pages = PageReadCount.objects.filter(book=book).values(
+        'reads', uuid=F('page__uuid'), number=F('page__number'),
+    ).order_by('-reads', 'number')[:top_pages]
+
+    return {
+        'book': book.uuid,
+        'reads': total,
+        'hourly': series[BookReadRollup.HOUR],
+        'daily': series[BookReadRollup.DAY],
+        'top_pages': list(pages),
+    }
+
+
+def get_most_read_books(days=7, limit=10):
+    """Return the books read the most over the last `days` days."""
+    today = timezone.now().astimezone(datetime.timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    books = BookReadRollup.objects.filter(
+        granularity=BookReadRollup.DAY,
+        period_start__gt=today - datetime.timedelta(days=days),
+        book__deleted_at__isnull=True,
+    ).values(
+        uuid=F('book__uuid'), title=F('book__title'),
+        author=F('book__author'),
+    ).annotate(reads=Sum('reads')).order_by('-reads', 'uuid')
+    return list(books[:limit])
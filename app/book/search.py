@@ -0,0 +1,113 @@
+"""
+Full-text search backends for the page content.
+"""
+import re
+from functools import reduce
+from operator import add, and_
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast, Length, Lower, Replace
+from django.utils.module_loading import import_string
+
+from core.models import Page
+
+
+class MySQLFullTextSearchBackend:
+    """
+    Search backed by the MySQL FULLTEXT index on `core_page.content`.
+    """
+    ordering = ('-rank', 'id')
+
+    def search(self, queryset, query):
+        table = connection.ops.quote_name(Page._meta.db_table)
+        column = connection.ops.quote_name('content')
+        rank = RawSQL(
+            f'MATCH ({table}.{column}) AGAINST (%s IN NATURAL LANGUAGE MODE)',
+            (query,),
+            output_field=FloatField(),
+        )
+        return queryset.annotate(rank=rank).filter(rank__gt=0)
+
+
+class SimpleSearchBackend:
+    """
+    Portable search matching every term of the query as a substring.
+
+    Pages are ranked by the number of occurrences of the terms. It scans
+    the table, so it is meant for development and tests.
+    """
+    ordering = ('-rank', 'id')
+
+    def search(self, queryset, query):
+        terms = split_terms(query)
+        if not terms:
+            # Keep the rank, the pagination orders by it.
+            return queryset.annotate(
+                rank=Value(0.0, output_field=FloatField())
+            ).none()
+
+        content = Lower('content')
+        occurrences = [
+            Cast(
+                Length(content) - Length(Replace(content, Value(term))),
+                FloatField(),
+            ) / len(term)
+            for term in terms
+        ]
+        return queryset.filter(
+            reduce(and_, (Q(content__icontains=term) for term in terms))
+        ).annotate(rank=reduce(add, occurrences))
+
+
+def split_terms(query):
+    """Return the lowercase search terms of a query."""
+    return [term.lower() for term in re.findall(r'\w+', query)]
+
+
+def get_search_backend():
+    """
+    Return the search backend for the default database.
+
+    `BOOK_SEARCH_BACKEND` may name a backend class explicitly, otherwise
+    the FULLTEXT backend is used on MySQL and the portable one elsewhere.
+    """
+    backend = getattr(settings, 'BOOK_SEARCH_BACKEND', None)
+    if backend:
+        return import_string(backend)()
+    if connection.vendor == 'mysql':
+        return MySQLFullTextSearchBackend()
+    return SimpleSearchBackend()
+
+
+def search_pages(backend, query, book_uuid=None):
+    """
+    Return the pages matching the query as value rows with their rank.
+    """
+    queryset = Page.objects.filter(book__deleted_at__isnull=True)
+    if book_uuid:
+        queryset = queryset.filter(book__uuid=book_uuid)
+    return backend.search(queryset, query).values(
+        'id', 'number', 'content', 'rank', book_uuid=F('book__uuid')
+    )
+
+
+def make_snippet(content, query, width=160):
+    """
+    Return the part of the content around the first matching term.
+    """
+    lowered = content.lower()
+    positions = [
+        position for position in (
+            lowered.find(term) for term in split_terms(query)
+        ) if position >= 0
+    ]
+    start = max(min(positions, default=0) - width // 4, 0)
+    snippet = content[start:start + width].strip()
+    if start > 0:
+        snippet = '…' + snippet
+    if start + width < len(content):
+        snippet += '…'
+    return snippet
@@ -1,24 +1,97 @@
 """
 Serializer for Book model and Page model.
 """
+from collections import Counter
+
 from rest_framework import serializers
 
+from django.db import transaction
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from core.models import Book, Page
+from core import timing
+from core.models import Book, Page, PageReadCount
+
+from book.search import make_snippet
+from book.summary import SUMMARY_FIELDS
+from book.signals import suppress_book_touch, touch_books
+
+
+class TimedSerializerMixin:
+    """
+    Add the representation time to the `serialize` timing of the request.
+
+    A list is measured once as a whole, not once per row.
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_serializer = super().many_init(*args, **kwargs)
+        list_serializer.to_representation = timing.timed('serialize')(
+            list_serializer.to_representation
+        )
+        return list_serializer
+
+    @property
+    @timing.timed('serialize')
+    def data(self):
+        return super().data
 
 
-class BookSerializer(serializers.ModelSerializer):
+class SparseFieldsSerializerMixin:
+    """
+    Output only the fields listed in the `fields` of the context, or all
+    of them when it is None. Fields added with `include` are kept.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = self.context.get('fields')
+        if fields is not None:
+            kept = {*fields, *self.context.get('include', ())}
+            for name in set(self.fields) - kept:
+                self.fields.pop(name)
+
+
+class BookSerializer(
+    SparseFieldsSerializerMixin,
+    TimedSerializerMixin,
+    serializers.ModelSerializer,
+):
     """
     Serializer for Book model.
+
+    The page summary fields are only output when listed in the `include`
+    of the context, and must then be annotated on the books, see
+    `book.summary`.
     """
+    page_count = serializers.IntegerField(read_only=True)
+    last_page_number = serializers.IntegerField(
+        read_only=True, allow_null=True
+    )
+    preview = serializers.CharField(read_only=True, allow_null=True)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        include = self.context.get('include', ())
+        for name in SUMMARY_FIELDS:
+            if name not in include:
+                self.fields.pop(name, None)
+
     class Meta:
         model = Book
-        fields = ['uuid', 'title', 'author', 'created_at', 'updated_at']
+        fields = [
+            'uuid', 'title', 'author', 'created_at', 'updated_at',
+            'page_count', 'last_page_number', 'preview',
+        ]
         read_only_fields = ['id', 'uuid', 'created_at', 'updated_at',]
 
 
-class PageSerializer(serializers.ModelSerializer):
+class PageSerializer(
+    SparseFieldsSerializerMixin,
+    TimedSerializerMixin,
+    serializers.ModelSerializer,
+):
     """
     Serializer for Page model.
     """
@@ -33,7 +106,83 @@ class PageSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'uuid',]
 
 
-class PageDetailSerializer(serializers.ModelSerializer):
+class ValuesSerializerMixin:
+    """
+    Represent `.values()` rows instead of model instances.
+
+    Each field is read from its source column, or from the lookup given in
+    `values_sources` for related fields, so no instance is built and no
+    relation is resolved per row. The output matches the serializer the
+    mixin is combined with.
+    """
+    values_sources = {}
+
+    @classmethod
+    def values_fields(cls, fields=None):
+        """Return the names to pass to `.values()`, for all or some fields."""
+        if '_values_sources' not in cls.__dict__:
+            cls._values_sources = {
+                name: source for name, source, method in cls().columns
+            }
+        if fields is None:
+            return list(cls._values_sources.values())
+        return [cls._values_sources[name] for name in fields]
+
+    @cached_property
+    def columns(self):
+        return [
+            (
+                field.field_name,
+                self.values_sources.get(field.field_name, field.source),
+                # Related fields read the related value itself.
+                None if isinstance(field, serializers.RelatedField)
+                else field.to_representation,
+            )
+            for field in self._readable_fields
+        ]
+
+    def to_representation(self, row):
+        ret = {}
+        for name, source, to_representation in self.columns:
+            value = row[source]
+            if value is not None and to_representation is not None:
+                value = to_representation(value)
+            ret[name] = value
+        return ret
+
+
+class BookValuesSerializer(ValuesSerializerMixin, BookSerializer):
+    """
+    Serializer for the book list, reading `.values()` rows.
+    """
+
+
+class PageValuesSerializer(ValuesSerializerMixin, PageSerializer):
+    """
+    Serializer for the page list, reading `.values()` rows.
+    """
+    values_sources = {'book': 'book__uuid'}
+
+
+class PageTocSerializer(
+    ValuesSerializerMixin,
+    TimedSerializerMixin,
+    serializers.ModelSerializer,
+):
+    """
+    Serializer for an entry of the table of contents of a book.
+    """
+
+    class Meta:
+        model = Page
+        fields = ['uuid', 'number',]
+
+
+class PageDetailSerializer(
+    SparseFieldsSerializerMixin,
+    TimedSerializerMixin,
+    serializers.ModelSerializer,
+):
     """
     Serializer for Page model with book details.
     """
@@ -58,3 +207,170 @@ class PageDetailSerializer(serializers.ModelSerializer):
                 {"number": _("A page with this number already exists.")}
             )
         return attrs
+
+
+class PageSearchSerializer(TimedSerializerMixin, serializers.Serializer):
+    """
+    Serializer for a page search hit.
+    """
+    book = serializers.UUIDField(source='book_uuid', read_only=True)
+    number = serializers.IntegerField(read_only=True)
+    snippet = serializers.SerializerMethodField()
+    rank = serializers.FloatField(read_only=True)
+
+    def get_snippet(self, obj) -> str:
+        return make_snippet(obj['content'], self.context['query'])
+
+
+class ReadPeriodSerializer(serializers.Serializer):
+    """
+    Serializer for the reads of a book during an hour or a day.
+    """
+    start = serializers.DateTimeField(read_only=True)
+    reads = serializers.IntegerField(read_only=True)
+
+
+class PageReadsSerializer(serializers.Serializer):
+    """
+    Serializer for the reads of a page.
+    """
+    uuid = serializers.UUIDField(read_only=True)
+    number = serializers.IntegerField(read_only=True)
+    reads = serializers.IntegerField(read_only=True)
+
+
+class BookStatsSerializer(TimedSerializerMixin, serializers.Serializer):
+    """
+    Serializer for the reading statistics of a book.
+    """
+    book = serializers.UUIDField(read_only=True)
+    reads = serializers.IntegerField(read_only=True)
+    hourly = ReadPeriodSerializer(many=True, read_only=True)
+    daily = ReadPeriodSerializer(many=True, read_only=True)
+    top_pages = PageReadsSerializer(many=True, read_only=True)
+
+
+class MostReadBookSerializer(TimedSerializerMixin, serializers.Serializer):
+    """
+    Serializer for a book of the most read books.
+    """
+    uuid = serializers.UUIDField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    author = serializers.CharField(read_only=True)
+    reads = serializers.IntegerField(read_only=True)
+
+
+class PageNumberSerializer(serializers.Serializer):
+    """
+    Serializer for the number of a page of a book.
+    """
+    number = serializers.IntegerField(min_value=1)
+
+
+class PageMoveSerializer(PageNumberSerializer):
+    """
+    Serializer for moving a page of a book to another number.
+    """
+    to = serializers.IntegerField(min_value=1)
+
+
+class ReadingProgressSerializer(serializers.Serializer):
+    """
+    Serializer for the page a user reached in a book.
+    """
+    page_number = serializers.IntegerField(min_value=1)
+
+
+class ContinueReadingSerializer(
+    TimedSerializerMixin, serializers.Serializer
+):
+    """
+    Serializer for a book the user is reading, with their current page.
+    """
+    book = serializers.UUIDField(source='book_uuid', read_only=True)
+    title = serializers.CharField(read_only=True)
+    author = serializers.CharField(read_only=True)
+    page_number = serializers.IntegerField(read_only=True)
+    page = serializers.UUIDField(
+        source='page_uuid', read_only=True, allow_null=True
+    )
+    content = serializers.CharField(read_only=True, allow_null=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+
+class PageBulkListSerializer(serializers.ListSerializer):
+    """
+    Validate and write a whole batch of pages for one book.
+
+    The book is taken from the `book` context key. With the `replace`
+    context key set, the existing pages of the book are swapped out.
+    """
+    batch_size = 500
+
+    def validate(self, attrs):
+        numbers = [item['number'] for item in attrs]
+        duplicated = [
+            number for number, count in Counter(numbers).items() if count > 1
+        ]
+        if duplicated:
+            raise serializers.ValidationError(
+                _('Duplicated page numbers: %(numbers)s.') % {
+                    'numbers': ', '.join(map(str, sorted(duplicated)))
+                }
+            )
+
+        return attrs
+
+    def check_existing(self, book, numbers):
+        """Reject numbers already used by pages of the locked book."""
+        existing = sorted(Page.objects.filter(
+            book=book, number__in=numbers
+        ).values_list('number', flat=True))
+        if existing:
+            raise serializers.ValidationError(
+                _('Pages with these numbers already exist: '
+                  '%(numbers)s.') % {
+                    'numbers': ', '.join(map(str, existing))
+                }
+            )
+
+    def delete_pages(self, book):
+        """
+        Delete the pages of the book and their read counts with two plain
+        DELETEs, without collecting the rows or sending signals.
+        """
+        using = Page.objects.db
+        PageReadCount.objects.filter(book=book)._raw_delete(using)
+        Page.objects.filter(book=book)._raw_delete(using)
+
+    def create(self, validated_data):
+        book = self.context['book']
+        pages = [Page(book=book, **item) for item in validated_data]
+
+        with transaction.atomic(), suppress_book_touch():
+            # Concurrent batches for the book wait here, so the numbers
+            # are checked against the pages they committed.
+            Book.objects.select_for_update().filter(
+                pk=book.pk
+            ).values('pk').get()
+            if self.context.get('replace'):
+                self.delete_pages(book)
+            else:
+                self.check_existing(book, [page.number for page in pages])
+            Page.objects.bulk_create(pages, batch_size=self.batch_size)
+            touch_books([book.id])
+
+        return pages
+
+
+class PageBulkSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for a page written through the bulk endpoint.
+    """
+
+    class Meta:
+        model = Page
+        fields = ['uuid', 'number', 'content',]
+        read_only_fields = ['uuid',]
+        extra_kwargs = {'number': {'min_value': 1}}
+        list_serializer_class = PageBulkListSerializer
@@ -1,18 +1,114 @@
 """
 Signals for the Book app.
 """
+import threading
+from contextlib import contextmanager
+from functools import partial
+
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils.timezone import now
 
-from core.models import Page
+from core.models import Book, Page
+
+from book import cache
+
+
+_state = threading.local()
+
+
+def touch_books(book_ids, using=None):
+    """
+    Set updated_at to now for the given books with a single UPDATE.
+
+    The cached payloads of the books are invalidated once the transaction
+    commits.
+    """
+    if not book_ids:
+        return 0
+    book_ids = set(book_ids)
+    updated = Book.objects.using(using).filter(id__in=book_ids).update(
+        updated_at=now()
+    )
+    transaction.on_commit(
+        partial(cache.invalidate_books, book_ids), using=using
+    )
+    return updated
+
+
+class PendingBookTouches:
+    """
+    Book ids waiting to be touched when the current transaction commits.
+    """
+
+    def __init__(self, using):
+        self.using = using
+        self.book_ids = set()
+        self.flushed = False
+
+    def __call__(self):
+        self.flushed = True
+        touch_books(self.book_ids, using=self.using)
+
+
+def queue_book_touch(book_id, using=None):
+    """
+    Queue a touch of the book's updated_at for the end of the transaction.
+
+    All touches queued inside the same transaction are flushed together on
+    commit. Outside a transaction the touch is flushed immediately.
+    """
+    connection = transaction.get_connection(using)
+    pending = getattr(connection, 'pending_book_touches', None)
+    registered = pending is not None and not pending.flushed and any(
+        func is pending for _, func, *_ in connection.run_on_commit
+    )
+    if not registered:
+        # Nothing queued yet, or the previous batch was already flushed or
+        # discarded by a rollback.
+        pending = PendingBookTouches(connection.alias)
+        connection.pending_book_touches = pending
+    pending.book_ids.add(book_id)
+    if not registered:
+        transaction.on_commit(pending, using=connection.alias)
+
+
+@contextmanager
+def suppress_book_touch():
+    """
+    Disable the Page signal touching Book.updated_at inside the block.
+
+    Meant for bulk operations that touch the affected books themselves.
+    """
+    _state.suppressed = getattr(_state, 'suppressed', 0) + 1
+    try:
+        yield
+    finally:
+        _state.suppressed -= 1
+
+
+def book_touch_suppressed():
+    """Return True inside a `suppress_book_touch` block."""
+    return getattr(_state, 'suppressed', 0) > 0
 
 
 @receiver([post_save, post_delete], sender=Page)
-def update_book_timestamp(sender, instance, **kwargs):
+def update_book_timestamp(sender, instance, using=None, **kwargs):
     """
     Update the Book's updated_at timestamp when a Page is saved or deleted.
     """
-    book = instance.book
-    book.updated_at = now()
-    book.save(update_fields=["updated_at"])
+    if book_touch_suppressed():
+        return
+    cache.forget_page_book(instance.uuid)
+    queue_book_touch(instance.book_id, using=using)
+
+
+@receiver([post_save, post_delete], sender=Book)
+def invalidate_book_cache(sender, instance, using=None, **kwargs):
+    """
+    Invalidate the cached payloads of a Book when it is saved or deleted.
+    """
+    transaction.on_commit(
+        partial(cache.bump_book_versions, [instance.uuid]), using=using
+    )
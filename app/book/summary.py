@@ -0,0 +1,63 @@
+"""
+Page summaries of books, computed in the query reading the books.
+
+`page_count`, `last_page_number` and `preview` (the start of the first
+page) are correlated subqueries on the `(book, number)` unique index, so
+a whole page of books is summarized by the one query listing them.
+"""
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Left
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import ValidationError
+
+from core.models import Page
+
+SUMMARY_FIELDS = ('page_count', 'last_page_number', 'preview')
+PREVIEW_LENGTH = 160
+
+
+def get_summary_annotations():
+    """Return the summary expressions by field name."""
+    pages = Page.objects.filter(book=OuterRef('pk')).order_by()
+    return {
+        'page_count': Coalesce(
+            Subquery(
+                pages.values('book').annotate(
+                    count=Count('pk')
+                ).values('count'),
+                output_field=IntegerField(),
+            ),
+            0,
+        ),
+        'last_page_number': Subquery(
+            pages.order_by('-number').values('number')[:1]
+        ),
+        'preview': Subquery(
+            pages.order_by('number').annotate(
+                preview=Left('content', PREVIEW_LENGTH)
+            ).values('preview')[:1]
+        ),
+    }
+
+
+def parse_summary_fields(value):
+    """Return the summary fields listed in an `include` parameter."""
+    names = [name.strip() for name in (value or '').split(',')]
+    names = [name for name in names if name]
+    unknown = set(names) - set(SUMMARY_FIELDS)
+    if unknown:
+        raise ValidationError({
+            'include': _('Unknown fields: %(fields)s.') % {
+                'fields': ', '.join(sorted(unknown))
+            }
+        })
+    return tuple(name for name in SUMMARY_FIELDS if name in names)
+
+
+def annotate_page_summary(queryset, names):
+    """Annotate the books of a queryset with the given summary fields."""
+    if not names:
+        return queryset
+    annotations = get_summary_annotations()
+    return queryset.annotate(**{name: annotations[name] for name in names})
@@ -0,0 +1,144 @@
+"""
+Test the async read views served over ASGI.
+"""
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import AsyncRequestFactory, TestCase
+
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.models import Book, Page
+
+from book import async_views
+from book.serializers import (
+    BookSerializer,
+    PageSerializer,
+    PageDetailSerializer,
+)
+
+
+def as_json(data):
+    """Return serializer data as decoded from a JSON response."""
+    return json.loads(JSONRenderer().render(data))
+
+
+def create_book(**params):
+    """Create and return a book with pages."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    book = Book.objects.create(**default_params)
+    for i in range(1, 21):
+        Page.objects.create(book=book, number=i, content=f"Content {i}")
+    return book
+
+
+class AsyncReadViewTests(TestCase):
+    """Test the async book and page read views."""
+
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        )
+        token = AccessToken.for_user(self.user)
+        self.headers = {"Authorization": f"Bearer {token}"}
+        with self.captureOnCommitCallbacks(execute=True):
+            self.book = create_book()
+        self.book.refresh_from_db()
+
+    async def call(self, view_class, path, data=None, headers=None, **kwargs):
+        request = self.factory.get(
+            path, data,
+            headers=self.headers if headers is None else headers,
+        )
+        return await view_class.as_view()(request, **kwargs)
+
+    async def test_book_list(self):
+        """Test listing books asynchronously."""
+        res = await self.call(async_views.AsyncBookListView, "/")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        body = json.loads(res.content)
+        self.assertEqual(body["count"], 1)
+        self.assertEqual(
+            body["results"],
+            as_json(BookSerializer([self.book], many=True).data)
+        )
+
+    async def test_book_detail_not_modified(self):
+        """Test the async book detail honours its ETag."""
+        view = async_views.AsyncBookDetailView
+        res = await self.call(view, "/", uuid=str(self.book.uuid))
+
+        res = await self.call(
+            view, "/", uuid=str(self.book.uuid),
+            headers={**self.headers, "If-None-Match": res["ETag"]},
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_page_list(self):
+        """Test listing the pages of a book asynchronously."""
+        res = await self.call(
+            async_views.AsyncPageListView, "/",
+            {"book_uuid": str(self.book.uuid), "page": 2},
+        )
+        pages = [
+            page async for page in
+            Page.objects.filter(book=self.book).select_related("book")
+            .order_by("number")[15:20]
+        ]
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        body = json.loads(res.content)
+        self.assertEqual(body["count"], 20)
+        self.assertIsNone(body["next"])
+        self.assertEqual(
+            body["results"],
+            as_json(PageSerializer(pages, many=True).data)
+        )
+
+    async def test_page_detail(self):
+        """Test retrieving a page asynchronously."""
+        page = await self.book.pages.afirst()
+
+        res = await self.call(
+            async_views.AsyncPageDetailView, "/", uuid=str(page.uuid)
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(res.content),
+            as_json(PageDetailSerializer(page).data)
+        )
+
+    async def test_unauthenticated_delegated(self):
+        """Test requests without a token get the viewset answer."""
+        res = await self.call(
+            async_views.AsyncBookListView, "/", headers={}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_missing_book_uuid_delegated(self):
+        """Test the viewset validates the page list parameters."""
+        res = await self.call(async_views.AsyncPageListView, "/")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_msgpack_delegated(self):
+        """Test formats other than JSON get the viewset answer."""
+        res = await self.call(
+            async_views.AsyncBookListView, "/",
+            headers={**self.headers, "Accept": "application/msgpack"},
+        )
+        res.render()
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res["Content-Type"], "application/msgpack")
@@ -358,7 +358,10 @@ class PrivateBookAPITests(TestCase):
 
     def test_create_page_and_validate_book_update_at(self):
         """Test creating a page and validating book updated_at."""
-        book = create_book_and_page()
+        # The book is touched when the transaction commits.
+        with self.captureOnCommitCallbacks(execute=True):
+            book = create_book_and_page()
+        book.refresh_from_db()
         before_created_at = book.updated_at
         before_updated_at = book.updated_at
 
@@ -369,7 +372,8 @@ class PrivateBookAPITests(TestCase):
             "number": 6,
             "content": "Test Content",
         }
-        res = self.client.post(PAGES_URL, payload)
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(PAGES_URL, payload)
         book.refresh_from_db()
 
         page = Page.objects.get(uuid=res.data["uuid"])
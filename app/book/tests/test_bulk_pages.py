@@ -0,0 +1,154 @@
+"""
+Test the bulk page API of the books.
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models.signals import post_delete
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page, PageReadCount
+
+
+def bulk_url(book_uuid):
+    """Return the bulk pages URL of a book."""
+    return reverse("book:book-pages-bulk", args=[book_uuid])
+
+
+def create_book(**params):
+    """Create and return a book."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    return Book.objects.create(**default_params)
+
+
+class BulkPagesAPITests(TestCase):
+    """Test the bulk page API for editors."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_editor_user(
+            email='editor@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+        self.book = create_book()
+
+    def test_bulk_create_pages(self):
+        """Test creating many pages with a constant number of queries."""
+        payload = [
+            {"number": i, "content": f"Content {i}"} for i in range(1, 201)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(
+                bulk_url(self.book.uuid), payload, format="json"
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(res.data), 200)
+        self.assertEqual(self.book.pages.count(), 200)
+        self.assertLess(len(queries), 10)
+
+    def test_bulk_create_existing_number(self):
+        """Test a batch colliding with existing pages is rejected."""
+        Page.objects.create(book=self.book, number=2, content="Existing")
+        payload = [
+            {"number": 1, "content": "One"},
+            {"number": 2, "content": "Two"},
+        ]
+
+        res = self.client.post(
+            bulk_url(self.book.uuid), payload, format="json"
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.book.pages.count(), 1)
+
+    def test_bulk_create_duplicated_number(self):
+        """Test a batch with repeated numbers is rejected."""
+        payload = [
+            {"number": 1, "content": "One"},
+            {"number": 1, "content": "Other one"},
+        ]
+
+        res = self.client.post(
+            bulk_url(self.book.uuid), payload, format="json"
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(self.book.pages.exists())
+
+    def test_bulk_create_number_zero(self):
+        """Test page numbers start at 1."""
+        payload = [{"number": 0, "content": "Zero"}]
+
+        res = self.client.post(
+            bulk_url(self.book.uuid), payload, format="json"
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(self.book.pages.exists())
+
+    def test_bulk_replace_pages(self):
+        """Test replacing all the pages of a book."""
+        for i in range(1, 6):
+            Page.objects.create(book=self.book, number=i, content="Old")
+        payload = [
+            {"number": 1, "content": "New 1"},
+            {"number": 2, "content": "New 2"},
+        ]
+
+        res = self.client.put(
+            bulk_url(self.book.uuid), payload, format="json"
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(self.book.pages.values_list("number", "content")),
+            [(1, "New 1"), (2, "New 2")]
+        )
+
+    def test_bulk_replace_raw_delete(self):
+        """Test the old pages are deleted without per-page signals."""
+        Page.objects.bulk_create([
+            Page(book=self.book, number=i, content="Old")
+            for i in range(1, 51)
+        ])
+        PageReadCount.objects.create(
+            page=self.book.pages.get(number=1), book=self.book, reads=3
+        )
+        payload = [{"number": 1, "content": "New"}]
+
+        with patch.object(post_delete, "send") as send:
+            res = self.client.put(
+                bulk_url(self.book.uuid), payload, format="json"
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        send.assert_not_called()
+        self.assertEqual(self.book.pages.get().content, "New")
+        self.assertFalse(PageReadCount.objects.exists())
+
+    def test_bulk_create_reader_forbidden(self):
+        """Test readers can not use the bulk API."""
+        reader = get_user_model().objects.create_user(
+            email='reader@example.com', password='testpass'
+        )
+        self.client.force_authenticate(reader)
+
+        res = self.client.post(
+            bulk_url(self.book.uuid),
+            [{"number": 1, "content": "One"}],
+            format="json"
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
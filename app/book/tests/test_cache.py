@@ -0,0 +1,134 @@
+"""
+Test the shared cache of the book and page APIs.
+"""
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page
+
+from book import cache
+
+
+PAGES_URL = reverse("book:page-list")
+
+
+def detail_url(book_uuid):
+    """Return book detail URL."""
+    return reverse("book:book-detail", args=[book_uuid])
+
+
+def detail_page_url(page_uuid):
+    """Return page detail URL."""
+    return reverse("book:page-detail", args=[page_uuid])
+
+
+def create_book(**params):
+    """Create and return a book with two pages."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    book = Book.objects.create(**default_params)
+    for i in range(1, 3):
+        Page.objects.create(book=book, number=i, content=f"Content {i}")
+    return book
+
+
+@override_settings(BOOK_CACHE_ALIAS="default")
+class BookCacheAPITests(TestCase):
+    """Test cached reads and their invalidation."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.book = create_book()
+
+    def test_page_list_served_from_cache(self):
+        """Test a repeated page list does not hit the database."""
+        params = {"book_uuid": self.book.uuid}
+        first = self.client.get(PAGES_URL, params)
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(PAGES_URL, params)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, first.data)
+        self.assertEqual(len(queries), 0)
+
+    def test_page_retrieve_served_from_cache(self):
+        """Test a repeated page retrieve does not hit the database."""
+        page = self.book.pages.first()
+        url = detail_page_url(page.uuid)
+        self.client.get(url)
+        first = self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, first.data)
+        self.assertEqual(len(queries), 0)
+
+    def test_page_write_invalidates_cache(self):
+        """Test writing a page invalidates the cached page list."""
+        params = {"book_uuid": self.book.uuid}
+        self.client.get(PAGES_URL, params)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Page.objects.filter(number=1).get().delete()
+        res = self.client.get(PAGES_URL, params)
+
+        self.assertEqual(len(res.data["results"]), 1)
+
+    def test_book_write_invalidates_cache(self):
+        """Test writing a book invalidates its cached payload."""
+        url = detail_url(self.book.uuid)
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.book.title = "Updated Book"
+            self.book.save()
+        res = self.client.get(url)
+
+        self.assertEqual(res.data["title"], "Updated Book")
+
+    def test_bump_book_version(self):
+        """Test bumping the version of a book changes it."""
+        version = cache.get_book_version(self.book.uuid)
+
+        cache.bump_book_versions([self.book.uuid])
+
+        self.assertNotEqual(cache.get_book_version(self.book.uuid), version)
+
+
+class UnsharedCacheTests(TestCase):
+    """Test nothing is cached without a cache shared by the workers."""
+
+    def test_reads_not_cached(self):
+        """Test a repeated page list reads the database again."""
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        ))
+        book = create_book()
+        params = {"book_uuid": book.uuid}
+        client.get(PAGES_URL, params)
+
+        with CaptureQueriesContext(connection) as queries:
+            res = client.get(PAGES_URL, params)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(any(
+            Page._meta.db_table in query["sql"] for query in queries
+        ))
@@ -0,0 +1,123 @@
+"""
+Test the conditional GET support of the book APIs.
+"""
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page
+
+from book import cache
+
+
+PAGES_URL = reverse("book:page-list")
+
+
+def detail_url(book_uuid):
+    """Return book detail URL."""
+    return reverse("book:book-detail", args=[book_uuid])
+
+
+def create_book(**params):
+    """Create and return a book with a page."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    book = Book.objects.create(**default_params)
+    Page.objects.create(book=book, number=1, content="Test Content")
+    return book
+
+
+class ConditionalGetAPITests(TestCase):
+    """Test ETag and Last-Modified handling."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+        # Flush the book touch of the setup pages.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.book = create_book()
+
+    def test_retrieve_book_not_modified(self):
+        """Test a fresh book is answered with 304 in a single query."""
+        res = self.client.get(detail_url(self.book.uuid))
+        etag = res["ETag"]
+        cache.get_cache().clear()
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(
+                detail_url(self.book.uuid), HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res["ETag"], etag)
+        self.assertEqual(len(queries), 1)
+
+    def test_retrieve_book_modified(self):
+        """Test a changed book is served again with a new ETag."""
+        res = self.client.get(detail_url(self.book.uuid))
+        etag = res["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.book.title = "Updated Book"
+            self.book.save()
+
+        res = self.client.get(
+            detail_url(self.book.uuid), HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual(res.data["title"], "Updated Book")
+
+    def test_retrieve_book_if_modified_since(self):
+        """Test Last-Modified is honoured."""
+        res = self.client.get(detail_url(self.book.uuid))
+
+        res = self.client.get(
+            detail_url(self.book.uuid),
+            HTTP_IF_MODIFIED_SINCE=res["Last-Modified"]
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_page_list_not_modified(self):
+        """Test a fresh page list is answered with 304."""
+        params = {"book_uuid": self.book.uuid}
+        res = self.client.get(PAGES_URL, params)
+        etag = res["ETag"]
+
+        res = self.client.get(PAGES_URL, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_page_list_modified_by_page_write(self):
+        """Test writing a page invalidates the page list ETag."""
+        params = {"book_uuid": self.book.uuid}
+        res = self.client.get(PAGES_URL, params)
+        etag = res["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Page.objects.create(book=self.book, number=2, content="New")
+
+        res = self.client.get(PAGES_URL, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["results"]), 2)
+
+    def test_page_list_etag_depends_on_query(self):
+        """Test each page of the list gets its own ETag."""
+        res = self.client.get(PAGES_URL, {"book_uuid": self.book.uuid})
+        other = self.client.get(
+            PAGES_URL, {"book_uuid": self.book.uuid, "pagination": "cursor"}
+        )
+
+        self.assertNotEqual(res["ETag"], other["ETag"])
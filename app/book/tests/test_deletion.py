@@ -0,0 +1,140 @@
+"""
+Test the fast deletion of books.
+"""
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import (
+    Book,
+    BookReadRollup,
+    Page,
+    PageReadCount,
+    ReadingProgress,
+)
+
+from book.deletion import purge_deleted_books
+
+
+BOOKS_URL = reverse("book:book-list")
+PAGES_URL = reverse("book:page-list")
+
+
+def detail_url(book_uuid):
+    """Return book detail URL."""
+    return reverse("book:book-detail", args=[book_uuid])
+
+
+def detail_page_url(page_uuid):
+    """Return page detail URL."""
+    return reverse("book:page-detail", args=[page_uuid])
+
+
+def create_book(title="Book", pages=5):
+    """Create a book with its pages."""
+    book = Book.objects.create(title=title, author="Author")
+    Page.objects.bulk_create([
+        Page(book=book, number=number, content="Content")
+        for number in range(1, pages + 1)
+    ])
+    return book
+
+
+class SoftDeleteApiTests(TestCase):
+    """Test deleting books through the API."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_editor_user(
+            email="editor@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.book = create_book(pages=50)
+
+    def test_delete_without_cascade(self):
+        """Test the delete does not depend on the number of pages."""
+        with self.assertNumQueries(2):
+            res = self.client.delete(detail_url(self.book.uuid))
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertIsNotNone(
+            Book.all_objects.get(pk=self.book.pk).deleted_at
+        )
+        self.assertEqual(Page.objects.filter(book=self.book).count(), 50)
+
+    def test_deleted_book_hidden(self):
+        """Test the book and its pages disappear at once."""
+        page = self.book.pages.first()
+        self.client.get(detail_url(self.book.uuid))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(detail_url(self.book.uuid))
+
+        res = self.client.get(detail_url(self.book.uuid))
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        res = self.client.get(BOOKS_URL)
+        self.assertEqual(res.data["results"], [])
+        res = self.client.get(PAGES_URL, {"book_uuid": self.book.uuid})
+        self.assertEqual(res.data["results"], [])
+        res = self.client.get(detail_page_url(page.uuid))
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_no_pages_added_to_deleted_book(self):
+        """Test pages cannot be created in a deleted book."""
+        self.client.delete(detail_url(self.book.uuid))
+
+        res = self.client.post(PAGES_URL, {
+            "book": str(self.book.uuid), "number": 99, "content": "Late",
+        })
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PurgeTests(TestCase):
+    """Test purging the deleted books."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.book = create_book()
+        self.kept = create_book("Kept")
+        page = self.book.pages.first()
+        PageReadCount.objects.create(page=page, book=self.book, reads=3)
+        BookReadRollup.objects.create(
+            book=self.book, granularity=BookReadRollup.DAY,
+            period_start=timezone.now(), reads=3,
+        )
+        ReadingProgress.objects.create(
+            user=self.user, book=self.book, page_number=1,
+            updated_at=timezone.now(),
+        )
+        Book.objects.filter(pk=self.book.pk).update(
+            deleted_at=timezone.now()
+        )
+
+    def test_purge(self):
+        """Test the deleted books are removed in batches."""
+        self.assertEqual(purge_deleted_books(batch_size=2), (1, 5))
+
+        self.assertFalse(Book.all_objects.filter(pk=self.book.pk).exists())
+        self.assertFalse(Page.objects.filter(book_id=self.book.pk).exists())
+        self.assertFalse(PageReadCount.objects.exists())
+        self.assertFalse(BookReadRollup.objects.exists())
+        self.assertFalse(ReadingProgress.objects.exists())
+        self.assertEqual(self.kept.pages.count(), 5)
+
+    def test_command(self):
+        """Test the command reports the purged rows."""
+        out = StringIO()
+
+        call_command("purge_deleted_books", stdout=out)
+
+        self.assertIn("Purged 1 books and 5 pages", out.getvalue())
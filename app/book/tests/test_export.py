@@ -0,0 +1,95 @@
+"""
+Test the streaming export of the books.
+"""
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page
+
+from book import exports
+
+
+def export_url(book_uuid):
+    """Return the export URL of a book."""
+    return reverse("book:book-export", args=[book_uuid])
+
+
+def create_book(**params):
+    """Create and return a book."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    return Book.objects.create(**default_params)
+
+
+class BookExportAPITests(TestCase):
+    """Test the book export API."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+        self.book = create_book()
+        for i in range(1, 8):
+            Page.objects.create(
+                book=self.book, number=i, content=f"Content {i}"
+            )
+
+    def test_export_ndjson(self):
+        """Test exporting a book as newline delimited JSON."""
+        res = self.client.get(
+            export_url(self.book.uuid), {"format": "ndjson"}
+        )
+        body = b"".join(res.streaming_content).decode()
+        lines = [json.loads(line) for line in body.splitlines()]
+        pages = self.book.pages.order_by("number")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res["Content-Type"].startswith("application/x-ndjson"))
+        self.assertEqual(
+            lines,
+            [
+                {
+                    "uuid": str(page.uuid),
+                    "number": page.number,
+                    "content": page.content,
+                }
+                for page in pages
+            ]
+        )
+
+    def test_export_txt(self):
+        """Test exporting a book as plain text."""
+        res = self.client.get(export_url(self.book.uuid), {"format": "txt"})
+        body = b"".join(res.streaming_content).decode()
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res["Content-Type"].startswith("text/plain"))
+        self.assertIn("[7]\nContent 7", body)
+        self.assertLess(body.index("Content 2"), body.index("Content 3"))
+
+    def test_export_unknown_format(self):
+        """Test exporting with an unknown format."""
+        res = self.client.get(export_url(self.book.uuid), {"format": "pdf"})
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_iter_book_pages_chunks(self):
+        """Test reading the pages in chunks keeps the page order."""
+        pages = list(
+            exports.iter_book_pages(self.book, ["number"], chunk_size=2)
+        )
+
+        self.assertEqual(
+            [page["number"] for page in pages], list(range(1, 8))
+        )
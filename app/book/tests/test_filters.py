@@ -0,0 +1,95 @@
+"""
+Test filtering and ordering the book list.
+"""
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book
+
+
+BOOKS_URL = reverse("book:book-list")
+
+
+def create_book(created_at=None, **params):
+    """Create and return a book."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    book = Book.objects.create(**default_params)
+    if created_at:
+        Book.objects.filter(id=book.id).update(created_at=created_at)
+    return book
+
+
+class BookFilterAPITests(TestCase):
+    """Test the book list filters."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+
+    def titles(self, params):
+        res = self.client.get(BOOKS_URL, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [book["title"] for book in res.data["results"]]
+
+    def test_filter_by_author(self):
+        """Test filtering by exact author."""
+        create_book(title="Moby Dick", author="Herman Melville")
+        create_book(title="Emma", author="Jane Austen")
+
+        titles = self.titles({"author": "Jane Austen"})
+
+        self.assertEqual(titles, ["Emma"])
+
+    def test_filter_by_title_prefix(self):
+        """Test filtering by the start of the title."""
+        create_book(title="Moby Dick")
+        create_book(title="Mobile Games")
+        create_book(title="Emma")
+
+        titles = self.titles({"title": "mob", "ordering": "title"})
+
+        self.assertEqual(titles, ["Mobile Games", "Moby Dick"])
+
+    def test_filter_by_created_range(self):
+        """Test filtering by a creation date range."""
+        now = timezone.now()
+        create_book(
+            title="Old", created_at=now - datetime.timedelta(days=30)
+        )
+        create_book(
+            title="Recent", created_at=now - datetime.timedelta(days=2)
+        )
+
+        after = (now - datetime.timedelta(days=7)).date().isoformat()
+        titles = self.titles({"created_after": after})
+
+        self.assertEqual(titles, ["Recent"])
+
+    def test_filter_invalid_date(self):
+        """Test an invalid date is rejected."""
+        res = self.client.get(BOOKS_URL, {"created_after": "2024-13-45"})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ordering_whitelist(self):
+        """Test ordering by allowed fields only."""
+        create_book(title="B")
+        create_book(title="A")
+
+        self.assertEqual(self.titles({"ordering": "title"}), ["A", "B"])
+        self.assertEqual(self.titles({"ordering": "-title"}), ["B", "A"])
+        self.assertEqual(self.titles({"ordering": "uuid"}), ["A", "B"])
@@ -0,0 +1,67 @@
+"""
+Test the content negotiation of the book and page APIs.
+"""
+import msgpack
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page
+
+
+BOOKS_URL = reverse("book:book-list")
+PAGES_URL = reverse("book:page-list")
+MSGPACK = "application/msgpack"
+
+
+class FormatAPITests(TestCase):
+    """Test the JSON and MessagePack formats."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_editor_user(
+            email='editor@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+        self.book = Book.objects.create(title="Title", author="Author")
+        for i in range(1, 4):
+            Page.objects.create(
+                book=self.book, number=i, content=f"Content {i}"
+            )
+
+    def test_msgpack_page_list(self):
+        """Test the page list is rendered as MessagePack on request."""
+        params = {"book_uuid": self.book.uuid}
+        json_res = self.client.get(PAGES_URL, params)
+
+        res = self.client.get(PAGES_URL, params, HTTP_ACCEPT=MSGPACK)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res["Content-Type"], MSGPACK)
+        self.assertEqual(msgpack.unpackb(res.content), json_res.json())
+        self.assertLess(len(res.content), len(json_res.content))
+
+    def test_msgpack_create(self):
+        """Test a book can be created from a MessagePack body."""
+        res = self.client.post(
+            BOOKS_URL,
+            {"title": "Packed", "author": "Author"},
+            format="msgpack",
+            HTTP_ACCEPT=MSGPACK,
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(msgpack.unpackb(res.content)["title"], "Packed")
+        self.assertTrue(Book.objects.filter(title="Packed").exists())
+
+    def test_json_by_default(self):
+        """Test JSON is still the default format."""
+        res = self.client.get(BOOKS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res["Content-Type"], "application/json")
+        self.assertEqual(res.json()["count"], 1)
@@ -0,0 +1,100 @@
+"""
+Test the cursor pagination mode of the book APIs.
+"""
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page
+
+from book.serializers import BookSerializer, PageSerializer
+
+
+BOOKS_URL = reverse("book:book-list")
+PAGES_URL = reverse("book:page-list")
+
+
+def create_book(**params):
+    """Create and return a book."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    return Book.objects.create(**default_params)
+
+
+class CursorPaginationAPITests(TestCase):
+    """Test cursor pagination for books and pages."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+
+    def walk(self, url, params):
+        """Follow the next links and return every result."""
+        results = []
+        res = self.client.get(url, params)
+        while True:
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", res.data)
+            results.extend(res.data["results"])
+            if not res.data["next"]:
+                return results
+            res = self.client.get(res.data["next"])
+
+    def test_book_list_cursor(self):
+        """Test walking the book list with cursors."""
+        for i in range(1, 26):
+            create_book(title=f"Book {i}")
+
+        results = self.walk(BOOKS_URL, {"pagination": "cursor"})
+        books = Book.objects.all().order_by("-created_at", "id")
+        serializer = BookSerializer(books, many=True)
+
+        self.assertEqual(results, serializer.data)
+
+    def test_page_list_cursor(self):
+        """Test walking the page list of a book with cursors."""
+        book = create_book()
+        other_book = create_book(title="Other Book")
+        for i in range(1, 41):
+            Page.objects.create(book=book, number=i, content=f"Content {i}")
+            Page.objects.create(
+                book=other_book, number=i, content=f"Content {i}"
+            )
+
+        results = self.walk(
+            PAGES_URL, {"book_uuid": book.uuid, "pagination": "cursor"}
+        )
+        pages = Page.objects.filter(book=book).order_by("number")
+        serializer = PageSerializer(pages, many=True)
+
+        self.assertEqual(results, serializer.data)
+
+    def test_cursor_list_skips_count(self):
+        """Test that cursor pagination does not count the rows."""
+        for i in range(1, 4):
+            create_book(title=f"Book {i}")
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(BOOKS_URL, {"pagination": "cursor"})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            any("COUNT(" in query["sql"] for query in queries)
+        )
+
+    def test_invalid_cursor(self):
+        """Test that an invalid cursor is rejected."""
+        res = self.client.get(BOOKS_URL, {"cursor": "invalid"})
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,178 @@
+"""
+Test the reading progress and the continue reading list.
+"""
+import datetime
+import uuid
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page, ReadingProgress
+
+from book.progress import ProgressBuffer
+
+
+CONTINUE_READING_URL = reverse("book:continue-reading")
+
+
+def progress_url(book_uuid):
+    """Return the progress URL of a book."""
+    return reverse("book:book-progress", args=[book_uuid])
+
+
+def create_book(title="Book", pages=3):
+    """Create a book with its pages."""
+    book = Book.objects.create(title=title, author="Author")
+    for number in range(1, pages + 1):
+        Page.objects.create(
+            book=book, number=number, content=f"Page {number}"
+        )
+    return book
+
+
+class ProgressBufferTests(TestCase):
+    """Test the debounced progress writes."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.book = create_book()
+        self.buffer = ProgressBuffer(10, 1.0, autostart=False)
+
+    def test_updates_coalesced(self):
+        """Test rapid updates of a book write only the latest page."""
+        for number in (1, 2, 3):
+            self.buffer.add(self.user.id, self.book.uuid, number,
+                            timezone.now())
+
+        with self.assertNumQueries(2):
+            self.assertEqual(self.buffer.flush(), 1)
+
+        self.assertEqual(ReadingProgress.objects.get().page_number, 3)
+
+    def test_upsert(self):
+        """Test a later flush updates the existing row."""
+        self.buffer.add(self.user.id, self.book.uuid, 1, timezone.now())
+        self.buffer.flush()
+        self.buffer.add(self.user.id, self.book.uuid, 2, timezone.now())
+
+        self.buffer.flush()
+
+        self.assertEqual(ReadingProgress.objects.get().page_number, 2)
+
+    def test_upsert_without_conflict_target(self):
+        """Test rows are written on backends like MySQL that upsert on
+        any unique key and refuse a conflict target."""
+        self.buffer.add(self.user.id, self.book.uuid, 2, timezone.now())
+
+        with patch.object(
+            connection.features, "supports_update_conflicts_with_target",
+            False,
+        ):
+            self.assertEqual(self.buffer.flush(), 1)
+
+        self.assertEqual(ReadingProgress.objects.get().page_number, 2)
+
+    def test_unknown_books_skipped(self):
+        """Test updates of unknown books are not written."""
+        self.buffer.add(self.user.id, uuid.uuid4(), 1, timezone.now())
+
+        self.assertEqual(self.buffer.flush(), 0)
+
+    def test_full_buffer_drops(self):
+        """Test new keys are refused once the buffer is full."""
+        buffer = ProgressBuffer(1, 1.0, autostart=False)
+        other = create_book("Other")
+
+        self.assertTrue(buffer.add(self.user.id, self.book.uuid, 1, None))
+        self.assertTrue(buffer.add(self.user.id, self.book.uuid, 2, None))
+        self.assertFalse(buffer.add(self.user.id, other.uuid, 1, None))
+
+
+class ReadingProgressApiTests(TestCase):
+    """Test the reading progress endpoints."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.buffer = ProgressBuffer(10, 1.0, autostart=False)
+        patcher = patch(
+            "book.progress.get_buffer", return_value=self.buffer
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_auth_required(self):
+        """Test authentication is required."""
+        res = APIClient().get(CONTINUE_READING_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_progress_buffered(self):
+        """Test progress is accepted without touching the database."""
+        book = create_book()
+
+        with self.assertNumQueries(0):
+            res = self.client.put(
+                progress_url(book.uuid), {"page_number": 2}, format="json"
+            )
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.buffer.flush()
+        progress = ReadingProgress.objects.get()
+        self.assertEqual(progress.user, self.user)
+        self.assertEqual(progress.page_number, 2)
+
+    def test_invalid_page_number(self):
+        """Test page numbers start at 1."""
+        res = self.client.put(
+            progress_url(uuid.uuid4()), {"page_number": 0}, format="json"
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_continue_reading(self):
+        """Test the recent books come with their page in one query."""
+        now = timezone.now()
+        older, newer = create_book("Older"), create_book("Newer")
+        other_user = get_user_model().objects.create_user(
+            email="other@example.com", password="password123"
+        )
+        ReadingProgress.objects.bulk_create([
+            ReadingProgress(
+                user=self.user, book=older, page_number=2,
+                updated_at=now - datetime.timedelta(hours=1),
+            ),
+            ReadingProgress(
+                user=self.user, book=newer, page_number=9, updated_at=now,
+            ),
+            ReadingProgress(
+                user=other_user, book=older, page_number=1, updated_at=now,
+            ),
+        ])
+
+        with self.assertNumQueries(1):
+            res = self.client.get(CONTINUE_READING_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(item["title"], item["page_number"]) for item in res.data],
+            [("Newer", 9), ("Older", 2)],
+        )
+        # The page may have been removed since it was reached.
+        self.assertIsNone(res.data[0]["page"])
+        self.assertEqual(
+            res.data[1]["page"], str(older.pages.get(number=2).uuid)
+        )
+        self.assertEqual(res.data[1]["content"], "Page 2")
@@ -0,0 +1,173 @@
+"""
+Test the page read events.
+"""
+import threading
+import uuid
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import InterfaceError
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page, ReadEvent
+
+from book.events import ReadEventBuffer
+
+
+def read_url(page_uuid):
+    """Return the read event URL of a page."""
+    return reverse("book:page-read", args=[page_uuid])
+
+
+def create_pages(count):
+    """Create a book with `count` pages."""
+    book = Book.objects.create(title="Book", author="Author")
+    return [
+        Page.objects.create(book=book, number=number, content="Content")
+        for number in range(1, count + 1)
+    ]
+
+
+class ReadEventBufferTests(TestCase):
+    """Test the buffer of read events."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.pages = create_pages(3)
+
+    def test_flush_in_batches(self):
+        """Test the events are written in batches with one page lookup."""
+        buffer = ReadEventBuffer(100, 2, 1.0, autostart=False)
+        for page in self.pages:
+            buffer.add(self.user.id, page.uuid, timezone.now())
+
+        with self.assertNumQueries(4):
+            self.assertEqual(buffer.flush(), 3)
+
+        events = ReadEvent.objects.order_by("id")
+        self.assertEqual(
+            [(event.page_id, event.book_id) for event in events],
+            [(page.id, page.book_id) for page in self.pages],
+        )
+        self.assertEqual(buffer.counts["written"], 3)
+
+    def test_unknown_pages_skipped(self):
+        """Test events of unknown pages are counted and not written."""
+        buffer = ReadEventBuffer(100, 10, 1.0, autostart=False)
+        buffer.add(self.user.id, self.pages[0].uuid, timezone.now())
+        buffer.add(self.user.id, uuid.uuid4(), timezone.now())
+
+        buffer.flush()
+
+        self.assertEqual(ReadEvent.objects.count(), 1)
+        self.assertEqual(buffer.counts["invalid"], 1)
+
+    def test_full_buffer_drops(self):
+        """Test events are refused and counted once the buffer is full."""
+        buffer = ReadEventBuffer(2, 10, 1.0, autostart=False)
+
+        results = [
+            buffer.add(self.user.id, page.uuid, timezone.now())
+            for page in self.pages
+        ]
+
+        self.assertEqual(results, [True, True, False])
+        self.assertEqual(buffer.counts["dropped"], 1)
+
+    def test_write_error_counted(self):
+        """Test errors other than DatabaseError fail the batch only."""
+        buffer = ReadEventBuffer(100, 10, 1.0, autostart=False)
+        buffer.add(self.user.id, self.pages[0].uuid, timezone.now())
+
+        with patch.object(buffer, "write", side_effect=InterfaceError):
+            with self.assertLogs("book.buffers", "ERROR"):
+                self.assertEqual(buffer.flush(), 0)
+
+        self.assertEqual(buffer.counts["failed"], 1)
+
+
+class ReadEventThreadTests(TransactionTestCase):
+    """Test the background writes of the buffer."""
+
+    def test_close_writes_pending_events(self):
+        """Test the thread writes the events and close flushes the rest."""
+        user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        page = create_pages(1)[0]
+        buffer = ReadEventBuffer(100, 1, 0.05)
+
+        buffer.add(user.id, page.uuid, timezone.now())
+        buffer.add(user.id, page.uuid, timezone.now())
+        buffer.close()
+
+        self.assertFalse(buffer.thread.is_alive())
+        self.assertEqual(ReadEvent.objects.count(), 2)
+
+    def test_dead_thread_restarted(self):
+        """Test adding to a buffer whose thread died starts a new one."""
+        user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        page = create_pages(1)[0]
+        buffer = ReadEventBuffer(100, 10, 0.05)
+        dead = buffer.thread = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+
+        buffer.add(user.id, page.uuid, timezone.now())
+        buffer.close()
+
+        self.assertIsNot(buffer.thread, dead)
+        self.assertEqual(ReadEvent.objects.count(), 1)
+
+
+class PageReadApiTests(TestCase):
+    """Test the read event endpoint."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.page = create_pages(1)[0]
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.buffer = ReadEventBuffer(1, 10, 1.0, autostart=False)
+        patcher = patch("book.events.get_buffer", return_value=self.buffer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_auth_required(self):
+        """Test authentication is required to report reads."""
+        res = APIClient().post(read_url(self.page.uuid))
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_read_buffered(self):
+        """Test a read is accepted without writing to the database."""
+        with self.assertNumQueries(0):
+            res = self.client.post(read_url(self.page.uuid))
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.buffer.flush()
+        event = ReadEvent.objects.get()
+        self.assertEqual(event.user_id, self.user.id)
+        self.assertEqual(event.page_id, self.page.id)
+
+    def test_full_buffer_backpressure(self):
+        """Test clients are asked to retry when the buffer is full."""
+        self.client.post(read_url(self.page.uuid))
+
+        res = self.client.post(read_url(self.page.uuid))
+
+        self.assertEqual(
+            res.status_code, status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        self.assertEqual(res["Retry-After"], "1")
@@ -0,0 +1,182 @@
+"""
+Test inserting, moving and removing pages of a book.
+"""
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page
+
+
+def pages_url(book_uuid, operation):
+    """Return the URL of a page operation of a book."""
+    return reverse(f"book:book-pages-{operation}", args=[book_uuid])
+
+
+def create_book(title="Book", pages=5):
+    """Create a book whose pages hold their original number."""
+    book = Book.objects.create(title=title, author="Author")
+    Page.objects.bulk_create([
+        Page(book=book, number=number, content=str(number))
+        for number in range(1, pages + 1)
+    ])
+    return book
+
+
+class ReorderApiTests(TestCase):
+    """Test the page renumbering endpoints."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_editor_user(
+            email="editor@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.book = create_book()
+
+    def contents(self, book=None):
+        """Return the contents of the pages in page order."""
+        return list(Page.objects.filter(
+            book=book or self.book
+        ).order_by("number").values_list("number", "content"))
+
+    def test_editor_required(self):
+        """Test readers cannot renumber pages."""
+        reader = get_user_model().objects.create_user(
+            email="reader@example.com", password="password123"
+        )
+        self.client.force_authenticate(reader)
+
+        res = self.client.post(
+            pages_url(self.book.uuid, "remove"), {"number": 1}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_insert_page(self):
+        """Test inserting a page moves the following pages up."""
+        res = self.client.post(
+            pages_url(self.book.uuid, "insert"),
+            {"number": 2, "content": "new"},
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data["number"], 2)
+        self.assertEqual(self.contents(), [
+            (1, "1"), (2, "new"), (3, "2"), (4, "3"), (5, "4"), (6, "5"),
+        ])
+
+    def test_append_page(self):
+        """Test a page can be inserted right after the last one."""
+        self.client.post(
+            pages_url(self.book.uuid, "insert"),
+            {"number": 6, "content": "new"},
+        )
+
+        self.assertEqual(self.contents()[-1], (6, "new"))
+
+    def test_insert_past_end(self):
+        """Test pages cannot be inserted after a gap."""
+        res = self.client.post(
+            pages_url(self.book.uuid, "insert"),
+            {"number": 7, "content": "new"},
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(self.contents()), 5)
+
+    def test_insert_before_first(self):
+        """Test page numbers start at 1."""
+        res = self.client.post(
+            pages_url(self.book.uuid, "insert"),
+            {"number": 0, "content": "new"},
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.contents()[0], (1, "1"))
+
+    def test_move_page_down(self):
+        """Test moving a page to a later number."""
+        res = self.client.post(
+            pages_url(self.book.uuid, "move"), {"number": 2, "to": 4}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["number"], 4)
+        self.assertEqual(self.contents(), [
+            (1, "1"), (2, "3"), (3, "4"), (4, "2"), (5, "5"),
+        ])
+
+    def test_move_page_up(self):
+        """Test moving a page to an earlier number."""
+        self.client.post(
+            pages_url(self.book.uuid, "move"), {"number": 5, "to": 1}
+        )
+
+        self.assertEqual(self.contents(), [
+            (1, "5"), (2, "1"), (3, "2"), (4, "3"), (5, "4"),
+        ])
+
+    def test_move_to_missing_number(self):
+        """Test pages can only be moved onto existing numbers."""
+        res = self.client.post(
+            pages_url(self.book.uuid, "move"), {"number": 2, "to": 9}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_move_out_of_range(self):
+        """Test pages cannot be moved before the first or past the last."""
+        for to in (0, 6):
+            res = self.client.post(
+                pages_url(self.book.uuid, "move"), {"number": 2, "to": to}
+            )
+
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.contents(), [
+            (number, str(number)) for number in range(1, 6)
+        ])
+
+    def test_remove_page(self):
+        """Test removing a page moves the following pages down."""
+        res = self.client.post(
+            pages_url(self.book.uuid, "remove"), {"number": 2}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.contents(), [
+            (1, "1"), (2, "3"), (3, "4"), (4, "5"),
+        ])
+
+    def test_remove_missing_page(self):
+        """Test removing a missing page returns 404."""
+        res = self.client.post(
+            pages_url(self.book.uuid, "remove"), {"number": 9}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_other_books_untouched(self):
+        """Test only the pages of the book are renumbered."""
+        other = create_book("Other")
+
+        self.client.post(
+            pages_url(self.book.uuid, "move"), {"number": 1, "to": 5}
+        )
+
+        self.assertEqual(self.contents(other), [
+            (number, str(number)) for number in range(1, 6)
+        ])
+
+    def test_constant_queries(self):
+        """Test renumbering does not depend on the number of pages."""
+        large = create_book("Large", pages=60)
+
+        for book in (self.book, large):
+            with self.assertNumQueries(12):
+                self.client.post(
+                    pages_url(book.uuid, "move"), {"number": 1, "to": 4}
+                )
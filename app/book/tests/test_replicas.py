@@ -0,0 +1,105 @@
+"""
+Test the read replica routing of the book and page APIs.
+"""
+import time
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import router
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.db import routers
+from core.models import Book
+
+
+BOOKS_URL = reverse("book:book-list")
+
+
+def detail_url(book_uuid):
+    """Return book detail URL."""
+    return reverse("book:book-detail", args=[book_uuid])
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRouterTests(SimpleTestCase):
+    """Test the routing decisions."""
+
+    def test_reads_on_primary_by_default(self):
+        """Test reads outside replica_reads() use the primary."""
+        self.assertEqual(router.db_for_read(Book), 'default')
+
+    def test_reads_on_replica(self):
+        """Test reads inside replica_reads() use a replica."""
+        with routers.replica_reads():
+            self.assertEqual(router.db_for_read(Book), 'replica')
+        self.assertEqual(router.db_for_read(Book), 'default')
+
+    def test_writes_on_primary(self):
+        """Test writes of instances read from a replica use the primary."""
+        book = Book(title='Title', author='Author')
+        book._state.db = 'replica'
+
+        with routers.replica_reads():
+            self.assertEqual(
+                router.db_for_write(Book, instance=book), 'default'
+            )
+
+    def test_no_migrations_on_replicas(self):
+        """Test the replicas are not migrated."""
+        self.assertFalse(router.allow_migrate('replica', 'core'))
+        self.assertTrue(router.allow_migrate('default', 'core'))
+
+
+# The replica is the test database itself, the spy records the routing.
+@override_settings(DATABASE_REPLICAS=['default'])
+@patch('core.db.routers.choose_replica', wraps=routers.choose_replica)
+class ReplicaReadAPITests(TestCase):
+    """Test the views read from the replicas unless pinned."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_editor_user(
+            email='editor@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+        self.book = Book.objects.create(title='Title', author='Author')
+
+    def test_safe_request_reads_replica(self, choose_replica):
+        """Test a GET reads from a replica."""
+        res = self.client.get(detail_url(self.book.uuid))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(choose_replica.called)
+
+    def test_write_pins_client_to_primary(self, choose_replica):
+        """Test the reads following a write use the primary."""
+        res = self.client.patch(
+            detail_url(self.book.uuid), {'title': 'New'}, format='json'
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn(routers.PIN_COOKIE, res.cookies)
+        choose_replica.reset_mock()
+
+        res = self.client.get(detail_url(self.book.uuid))
+
+        self.assertEqual(res.data['title'], 'New')
+        self.assertFalse(choose_replica.called)
+
+    def test_expired_pin_reads_replica(self, choose_replica):
+        """Test the pin only lasts for the pin window."""
+        self.client.cookies[routers.PIN_COOKIE] = str(int(time.time()) - 1)
+
+        self.client.get(BOOKS_URL)
+
+        self.assertTrue(choose_replica.called)
+
+    def test_failed_write_does_not_pin(self, choose_replica):
+        """Test a rejected write leaves the client on the replicas."""
+        res = self.client.post(BOOKS_URL, {'title': ''}, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn(routers.PIN_COOKIE, res.cookies)
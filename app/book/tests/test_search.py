@@ -0,0 +1,119 @@
+"""
+Test the page search API.
+"""
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page
+
+from book.search import make_snippet
+
+
+SEARCH_URL = reverse("book:search")
+
+
+def create_book(**params):
+    """Create and return a book."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    return Book.objects.create(**default_params)
+
+
+class PageSearchAPITests(TestCase):
+    """Test searching the content of the pages."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+        self.book = create_book()
+        self.other_book = create_book(title="Other Book")
+        Page.objects.create(
+            book=self.book, number=1, content="A whale in the sea."
+        )
+        Page.objects.create(
+            book=self.book, number=2, content="Whale after whale after whale."
+        )
+        Page.objects.create(
+            book=self.other_book, number=1, content="The whale sings."
+        )
+        Page.objects.create(
+            book=self.other_book, number=2, content="Nothing to see here."
+        )
+
+    def test_search_ranked(self):
+        """Test searching returns ranked hits."""
+        res = self.client.get(SEARCH_URL, {"q": "whale"})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        hits = res.data["results"]
+        self.assertEqual(len(hits), 3)
+        self.assertEqual(
+            (hits[0]["book"], hits[0]["number"]), (str(self.book.uuid), 2)
+        )
+        self.assertIn("whale", hits[0]["snippet"].lower())
+
+    def test_search_in_book(self):
+        """Test restricting the search to a book."""
+        res = self.client.get(
+            SEARCH_URL, {"q": "whale", "book_uuid": self.other_book.uuid}
+        )
+
+        self.assertEqual(
+            [(hit["book"], hit["number"]) for hit in res.data["results"]],
+            [(str(self.other_book.uuid), 1)]
+        )
+
+    def test_search_cursor_pagination(self):
+        """Test walking the hits with cursors."""
+        for i in range(3, 30):
+            Page.objects.create(book=self.book, number=i, content="whale")
+
+        res = self.client.get(SEARCH_URL, {"q": "whale"})
+        hits = list(res.data["results"])
+        while res.data["next"]:
+            res = self.client.get(res.data["next"])
+            hits.extend(res.data["results"])
+
+        self.assertEqual(len(hits), 30)
+        self.assertEqual(
+            len({(hit["book"], hit["number"]) for hit in hits}), 30
+        )
+
+    def test_search_query_required(self):
+        """Test the query parameter is required."""
+        res = self.client.get(SEARCH_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_without_terms(self):
+        """Test a query with no words finds nothing."""
+        res = self.client.get(SEARCH_URL, {"q": "!!!"})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["results"], [])
+
+    def test_search_invalid_book_uuid(self):
+        """Test a malformed book UUID is rejected."""
+        res = self.client.get(SEARCH_URL, {"q": "whale", "book_uuid": "42"})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_make_snippet(self):
+        """Test the snippet is centered on the first match."""
+        content = "x" * 300 + " whale " + "y" * 300
+
+        snippet = make_snippet(content, "whale", width=60)
+
+        self.assertIn("whale", snippet)
+        self.assertTrue(snippet.startswith("…"))
+        self.assertTrue(snippet.endswith("…"))
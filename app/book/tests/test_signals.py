@@ -0,0 +1,110 @@
+"""
+Test the Book.updated_at touch done by the Page signals.
+"""
+import datetime
+
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from core.models import Book, Page
+
+from book.signals import PendingBookTouches, suppress_book_touch
+
+
+def pending_touches(callbacks):
+    """Return the pending book touches among on_commit callbacks."""
+    return [
+        callback for callback in callbacks
+        if isinstance(callback, PendingBookTouches)
+    ]
+
+
+def create_book(**params):
+    """Create and return a book with an old updated_at."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    book = Book.objects.create(**default_params)
+    Book.objects.filter(id=book.id).update(
+        updated_at=now() - datetime.timedelta(days=1)
+    )
+    book.refresh_from_db()
+    return book
+
+
+class BookTouchSignalTests(TestCase):
+    """Test the coalesced Book.updated_at touch."""
+
+    def test_page_save_touches_book(self):
+        """Test saving a page touches the book without loading it."""
+        book = create_book()
+        before = book.updated_at
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                Page.objects.create(book_id=book.id, number=1, content="A")
+        book.refresh_from_db()
+
+        self.assertGreater(book.updated_at, before)
+        # Insert, touch, and the uuid lookup of the cache invalidation.
+        self.assertEqual(len(queries), 3)
+        self.assertFalse(any(
+            "title" in query["sql"] for query in queries
+        ))
+
+    def test_touches_coalesced_in_transaction(self):
+        """Test many page writes in a transaction touch books once."""
+        book = create_book()
+        other_book = create_book(title="Other Book")
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                for i in range(1, 11):
+                    Page.objects.create(book=book, number=i, content="A")
+                    Page.objects.create(
+                        book=other_book, number=i, content="B"
+                    )
+                book.pages.filter(number=1).get().delete()
+
+        touches = pending_touches(callbacks)
+        self.assertEqual(len(touches), 1)
+        with CaptureQueriesContext(connection) as queries:
+            touches[0]()
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith("UPDATE"))
+
+    def test_rollback_discards_pending_touches(self):
+        """Test that touches queued in a rolled back block are dropped."""
+        book = create_book()
+        other_book = create_book(title="Other Book")
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        Page.objects.create(book=book, number=1, content="A")
+                        raise ValueError
+                except ValueError:
+                    pass
+                Page.objects.create(book=other_book, number=1, content="B")
+
+        touches = pending_touches(callbacks)
+        self.assertEqual(len(touches), 1)
+        self.assertEqual(touches[0].book_ids, {other_book.id})
+
+    def test_suppress_book_touch(self):
+        """Test that the touch can be suppressed for bulk operations."""
+        book = create_book()
+        before = book.updated_at
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with suppress_book_touch():
+                Page.objects.create(book=book, number=1, content="A")
+        book.refresh_from_db()
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(book.updated_at, before)
@@ -0,0 +1,189 @@
+"""
+Test the sparse fieldsets and the table of contents.
+"""
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page
+
+
+BOOKS_URL = reverse("book:book-list")
+PAGES_URL = reverse("book:page-list")
+
+
+def detail_url(book_uuid):
+    """Return book detail URL."""
+    return reverse("book:book-detail", args=[book_uuid])
+
+
+def detail_page_url(page_uuid):
+    """Return page detail URL."""
+    return reverse("book:page-detail", args=[page_uuid])
+
+
+def toc_url(book_uuid):
+    """Return the table of contents URL of a book."""
+    return reverse("book:book-toc", args=[book_uuid])
+
+
+def create_book(title="Book", pages=3):
+    """Create a book with its pages."""
+    book = Book.objects.create(title=title, author="Author")
+    Page.objects.bulk_create([
+        Page(book=book, number=number, content=f"Content {number}")
+        for number in range(1, pages + 1)
+    ])
+    return book
+
+
+class SparseFieldsApiTests(TestCase):
+    """Test the `fields` parameter of the book and page endpoints."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.book = create_book()
+
+    def assertContentNotRead(self, queries):
+        """Assert the page content column was not selected."""
+        for query in queries:
+            self.assertNotIn('"content"', query["sql"])
+
+    def test_page_list_fields(self):
+        """Test the page list reads only the requested columns."""
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(PAGES_URL, {
+                "book_uuid": self.book.uuid, "fields": "uuid,number",
+            })
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [list(page) for page in res.data["results"]],
+            [["uuid", "number"]] * 3,
+        )
+        self.assertContentNotRead(queries)
+
+    def test_page_list_cursor_fields(self):
+        """Test the cursor pagination works without the number field."""
+        create_book("Long", pages=20)
+        book = Book.objects.get(title="Long")
+
+        res = self.client.get(PAGES_URL, {
+            "book_uuid": book.uuid, "fields": "uuid",
+            "pagination": "cursor",
+        })
+        res = self.client.get(res.data["next"])
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["results"]), 5)
+        self.assertEqual(list(res.data["results"][0]), ["uuid"])
+
+    def test_page_detail_fields(self):
+        """Test the page detail defers the columns not requested."""
+        page = self.book.pages.first()
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(
+                detail_page_url(page.uuid), {"fields": "number"}
+            )
+
+        self.assertEqual(res.data, {"number": 1})
+        self.assertContentNotRead(queries)
+
+    def test_book_fields(self):
+        """Test the book endpoints return only the requested fields."""
+        res = self.client.get(BOOKS_URL, {
+            "fields": "uuid,title", "include": "page_count",
+        })
+
+        self.assertEqual(res.data["results"], [{
+            "uuid": str(self.book.uuid), "title": "Book", "page_count": 3,
+        }])
+
+        res = self.client.get(
+            detail_url(self.book.uuid), {"fields": "author"}
+        )
+
+        self.assertEqual(res.data, {"author": "Author"})
+
+    def test_book_list_ordered_by_missing_field(self):
+        """Test the books can be ordered by a field not returned."""
+        create_book("Another")
+
+        res = self.client.get(BOOKS_URL, {
+            "fields": "uuid", "ordering": "title", "pagination": "cursor",
+        })
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["results"]), 2)
+
+    def test_unknown_field(self):
+        """Test unknown fields are rejected."""
+        res = self.client.get(PAGES_URL, {
+            "book_uuid": self.book.uuid, "fields": "uuid,secret",
+        })
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TableOfContentsApiTests(TestCase):
+    """Test the table of contents of a book."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_toc_unpaginated(self):
+        """Test every page is listed without content in one response."""
+        book = create_book(pages=40)
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(toc_url(book.uuid))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data,
+            [
+                {"uuid": str(page.uuid), "number": page.number}
+                for page in book.pages.order_by("number")
+            ],
+        )
+        for query in queries:
+            self.assertNotIn('"content"', query["sql"])
+
+    def test_toc_cached(self):
+        """Test the table of contents is cached until the book changes."""
+        book = create_book()
+        res = self.client.get(toc_url(book.uuid))
+
+        res = self.client.get(
+            toc_url(book.uuid), HTTP_IF_NONE_MATCH=res["ETag"]
+        )
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Page.objects.create(book=book, number=4, content="New")
+        res = self.client.get(toc_url(book.uuid))
+
+        self.assertEqual(len(res.data), 4)
+
+    def test_toc_missing_book(self):
+        """Test the table of contents of an unknown book is a 404."""
+        book = create_book()
+        Book.objects.filter(pk=book.pk).delete()
+
+        res = self.client.get(toc_url(book.uuid))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
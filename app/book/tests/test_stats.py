@@ -0,0 +1,191 @@
+"""
+Test the reading statistics rolled up from the read events.
+"""
+import datetime
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import (
+    Book,
+    BookReadRollup,
+    Page,
+    PageReadCount,
+    ReadEvent,
+)
+
+from book.rollups import compact_read_events
+
+
+MOST_READ_URL = reverse("book:book-most-read")
+
+
+def stats_url(book_uuid):
+    """Return the statistics URL of a book."""
+    return reverse("book:book-stats", args=[book_uuid])
+
+
+def create_book(title="Book", pages=2):
+    """Create a book with its pages."""
+    book = Book.objects.create(title=title, author="Author")
+    for number in range(1, pages + 1):
+        Page.objects.create(book=book, number=number, content="Content")
+    return book
+
+
+def read(user, page, read_at, times=1):
+    """Write `times` read events of a page."""
+    ReadEvent.objects.bulk_create([
+        ReadEvent(user=user, book_id=page.book_id, page=page, read_at=read_at)
+        for _ in range(times)
+    ])
+
+
+def hour_start(moment):
+    """Return the start of the hour of a moment, in UTC."""
+    return moment.astimezone(datetime.timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
+class CompactionTests(TestCase):
+    """Test the compaction of the read events."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.book = create_book()
+        self.first, self.second = self.book.pages.all()
+        self.now = timezone.now()
+
+    def test_rollups(self):
+        """Test events are counted per hour, day and page."""
+        earlier = self.now - datetime.timedelta(hours=1)
+        read(self.user, self.first, self.now, times=2)
+        read(self.user, self.second, earlier)
+
+        self.assertEqual(compact_read_events(settle=False), 3)
+
+        hours = dict(BookReadRollup.objects.filter(
+            granularity=BookReadRollup.HOUR
+        ).values_list("period_start", "reads"))
+        self.assertEqual(
+            hours, {hour_start(self.now): 2, hour_start(earlier): 1}
+        )
+        days = BookReadRollup.objects.filter(granularity=BookReadRollup.DAY)
+        self.assertEqual(sum(day.reads for day in days), 3)
+        pages = dict(PageReadCount.objects.values_list("page_id", "reads"))
+        self.assertEqual(pages, {self.first.id: 2, self.second.id: 1})
+
+    def test_incremental(self):
+        """Test a later compaction adds to the existing rollups."""
+        read(self.user, self.first, self.now)
+        compact_read_events(settle=False)
+        read(self.user, self.first, self.now, times=2)
+
+        self.assertEqual(compact_read_events(settle=False, batch_size=1), 2)
+
+        rollup = BookReadRollup.objects.get(granularity=BookReadRollup.HOUR)
+        self.assertEqual(rollup.reads, 3)
+        self.assertEqual(PageReadCount.objects.get().reads, 3)
+
+    def test_settle(self):
+        """Test events are left for the run after the one that saw them."""
+        read(self.user, self.first, self.now)
+
+        self.assertEqual(compact_read_events(), 0)
+        self.assertEqual(compact_read_events(), 1)
+        self.assertEqual(compact_read_events(), 0)
+
+    def test_deleted_pages_skipped(self):
+        """Test events of deleted pages only count for the book."""
+        read(self.user, self.second, self.now)
+        self.second.delete()
+
+        compact_read_events(settle=False)
+
+        self.assertFalse(PageReadCount.objects.exists())
+        self.assertEqual(
+            BookReadRollup.objects.get(granularity=BookReadRollup.DAY).reads,
+            1,
+        )
+
+    def test_command(self):
+        """Test the command reports the compacted events."""
+        read(self.user, self.first, self.now)
+        out = StringIO()
+
+        call_command("compact_read_events", "--no-settle", stdout=out)
+
+        self.assertIn("Compacted 1 read events", out.getvalue())
+
+
+class ReadStatsApiTests(TestCase):
+    """Test the reading statistics endpoints."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.book = create_book("Popular")
+        self.first, self.second = self.book.pages.all()
+        self.other = create_book("Other", pages=1)
+        now = timezone.now()
+        read(self.user, self.first, now, times=3)
+        read(self.user, self.second, now)
+        read(self.user, self.other.pages.get(), now, times=2)
+        read(
+            self.user, self.other.pages.get(),
+            now - datetime.timedelta(days=10), times=5,
+        )
+        compact_read_events(settle=False)
+
+    def test_book_stats(self):
+        """Test the statistics of a book are read in constant queries."""
+        with self.assertNumQueries(4):
+            res = self.client.get(stats_url(self.book.uuid))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["reads"], 4)
+        self.assertEqual(len(res.data["hourly"]), 1)
+        self.assertEqual(res.data["daily"][0]["reads"], 4)
+        self.assertEqual(
+            [(page["number"], page["reads"])
+             for page in res.data["top_pages"]],
+            [(1, 3), (2, 1)],
+        )
+
+    def test_most_read(self):
+        """Test the books are ranked by reads over the window."""
+        with self.assertNumQueries(1):
+            res = self.client.get(MOST_READ_URL)
+
+        self.assertEqual(
+            [(book["title"], book["reads"]) for book in res.data],
+            [("Popular", 4), ("Other", 2)],
+        )
+
+        res = self.client.get(MOST_READ_URL, {"days": 30, "limit": 1})
+
+        self.assertEqual(
+            [(book["title"], book["reads"]) for book in res.data],
+            [("Other", 7)],
+        )
+
+    def test_most_read_invalid_params(self):
+        """Test the window and the limit are validated."""
+        res = self.client.get(MOST_READ_URL, {"days": 0})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        res = self.client.get(MOST_READ_URL, {"limit": "many"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,111 @@
+"""
+Test the page summaries of the books.
+"""
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Book, Page
+
+from book.summary import PREVIEW_LENGTH
+
+
+BOOKS_URL = reverse("book:book-list")
+SUMMARY = "page_count,last_page_number,preview"
+
+
+def detail_url(book_uuid):
+    """Return book detail URL."""
+    return reverse("book:book-detail", args=[book_uuid])
+
+
+def create_book(title="Book", pages=3):
+    """Create a book with its pages."""
+    book = Book.objects.create(title=title, author="Author")
+    Page.objects.bulk_create([
+        Page(book=book, number=number, content=f"Page {number} " * 50)
+        for number in range(1, pages + 1)
+    ])
+    return book
+
+
+class PageSummaryApiTests(TestCase):
+    """Test the page summary fields of the book endpoints."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_summary_not_included_by_default(self):
+        """Test the summary fields are only output on request."""
+        book = create_book()
+
+        res = self.client.get(detail_url(book.uuid))
+
+        self.assertNotIn("page_count", res.data)
+        self.assertNotIn("preview", res.data)
+
+    def test_retrieve_with_summary(self):
+        """Test the summary of a book."""
+        book = create_book(pages=4)
+
+        res = self.client.get(detail_url(book.uuid), {"include": SUMMARY})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["page_count"], 4)
+        self.assertEqual(res.data["last_page_number"], 4)
+        self.assertEqual(
+            res.data["preview"], ("Page 1 " * 50)[:PREVIEW_LENGTH]
+        )
+
+    def test_list_selected_fields(self):
+        """Test only the requested summary fields are output."""
+        create_book()
+
+        res = self.client.get(BOOKS_URL, {"include": "page_count"})
+
+        book = res.data["results"][0]
+        self.assertEqual(book["page_count"], 3)
+        self.assertNotIn("last_page_number", book)
+
+    def test_book_without_pages(self):
+        """Test the summary of a book without pages."""
+        create_book(pages=0)
+
+        res = self.client.get(BOOKS_URL, {"include": SUMMARY})
+
+        book = res.data["results"][0]
+        self.assertEqual(book["page_count"], 0)
+        self.assertIsNone(book["last_page_number"])
+        self.assertIsNone(book["preview"])
+
+    def test_unknown_field(self):
+        """Test unknown summary fields are rejected."""
+        res = self.client.get(BOOKS_URL, {"include": "words"})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_constant_queries(self):
+        """Test the summaries are read by the query listing the books."""
+        create_book("First")
+
+        with self.assertNumQueries(2):
+            res = self.client.get(BOOKS_URL, {"include": SUMMARY})
+        self.assertEqual(len(res.data["results"]), 1)
+
+        for number in range(9):
+            create_book(f"Book {number}", pages=number + 1)
+
+        with self.assertNumQueries(2):
+            res = self.client.get(BOOKS_URL, {"include": SUMMARY})
+        self.assertEqual(len(res.data["results"]), 10)
+        self.assertEqual(
+            sorted(book["page_count"] for book in res.data["results"]),
+            [1, 2, 3, 3, 4, 5, 6, 7, 8, 9],
+        )
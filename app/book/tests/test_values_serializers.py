@@ -0,0 +1,125 @@
+"""
+Test the values() serialization of the book and page lists.
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core import timing
+from core.models import Book, Page
+
+from book import serializers
+
+
+BOOKS_URL = reverse("book:book-list")
+PAGES_URL = reverse("book:page-list")
+
+
+def create_book(**params):
+    """Create and return a book with three pages."""
+    default_params = {
+        "title": "Test Book",
+        "author": "Test Author",
+    }
+    default_params.update(params)
+    book = Book.objects.create(**default_params)
+    for i in range(1, 4):
+        Page.objects.create(book=book, number=i, content=f"Content {i}")
+    return book
+
+
+class ValuesSerializerTests(TestCase):
+    """Test the values serializers match the model serializers."""
+
+    def setUp(self):
+        self.book = create_book()
+
+    def test_book_representation(self):
+        """Test a book row is represented like the book instance."""
+        serializer_class = serializers.BookValuesSerializer
+        rows = Book.objects.values(*serializer_class.values_fields())
+
+        self.assertEqual(
+            serializer_class(rows, many=True).data,
+            serializers.BookSerializer(Book.objects.all(), many=True).data,
+        )
+
+    def test_page_representation(self):
+        """Test a page row is represented like the page instance."""
+        serializer_class = serializers.PageValuesSerializer
+        rows = Page.objects.order_by('number').values(
+            *serializer_class.values_fields()
+        )
+
+        self.assertEqual(
+            serializer_class(rows, many=True).data,
+            serializers.PageSerializer(
+                Page.objects.order_by('number'), many=True
+            ).data,
+        )
+
+    def test_list_timed_once(self):
+        """Test a list is added to the serialize timing once, not per row."""
+        serializer_class = serializers.PageValuesSerializer
+        rows = Page.objects.values(*serializer_class.values_fields())
+
+        with timing.start() as request_timing, patch.object(
+            request_timing, 'measure', wraps=request_timing.measure
+        ) as measure:
+            data = serializer_class(rows, many=True).data
+
+        self.assertEqual(len(data), 3)
+        measure.assert_called_once_with('serialize')
+
+
+class ValuesListAPITests(TestCase):
+    """Test the list endpoints read values rows."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        )
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.book = create_book()
+
+    def test_page_list_single_query(self):
+        """Test the page rows and their book uuid come from one query."""
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(PAGES_URL, {
+                "book_uuid": self.book.uuid, "pagination": "cursor"
+            })
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [page["book"] for page in res.data["results"]],
+            [self.book.uuid] * 3,
+        )
+        page_queries = [
+            query for query in queries
+            if Page._meta.db_table in query["sql"]
+        ]
+        self.assertEqual(len(page_queries), 1)
+
+    def test_book_list_cursor_pagination(self):
+        """Test the cursor pagination reads its position from the rows."""
+        for i in range(12):
+            Book.objects.create(title=f"Book {i}", author="Author")
+
+        first = self.client.get(BOOKS_URL, {"pagination": "cursor"})
+        second = self.client.get(first.data["next"])
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        uuids = [
+            book["uuid"]
+            for res in (first, second) for book in res.data["results"]
+        ]
+        self.assertEqual(len(set(uuids)), Book.objects.count())
@@ -1,7 +1,8 @@
 """
 Url mapping for book and page APIs.
 """
-from django.urls import path, include
+from django.conf import settings
+from django.urls import path, include, re_path
 
 from rest_framework.routers import DefaultRouter
 
@@ -15,5 +16,49 @@ router.register('pages', views.PageViewSet)
 app_name = 'book'
 
 urlpatterns = [
+    path('search/', views.PageSearchView.as_view(), name='search'),
+    path(
+        'pages/<uuid:uuid>/read/',
+        views.PageReadView.as_view(),
+        name='page-read'
+    ),
+    path(
+        'books/<uuid:uuid>/progress/',
+        views.BookProgressView.as_view(),
+        name='book-progress'
+    ),
+    path(
+        'continue-reading/',
+        views.ContinueReadingView.as_view(),
+        name='continue-reading'
+    ),
     path('', include(router.urls)),
 ]
+
+if settings.ASYNC_READ_VIEWS:
+    from book import async_views
+
+    # Same routes and names as the router, matched first. Lookups must
+    # look like uuids so routes such as books/most-read/ reach the router.
+    urlpatterns = [
+        re_path(
+            r'^books/$',
+            async_views.AsyncBookListView.as_view(),
+            name='book-list'
+        ),
+        re_path(
+            r'^books/(?P<uuid>[0-9a-fA-F-]+)/$',
+            async_views.AsyncBookDetailView.as_view(),
+            name='book-detail'
+        ),
+        re_path(
+            r'^pages/$',
+            async_views.AsyncPageListView.as_view(),
+            name='page-list'
+        ),
+        re_path(
+            r'^pages/(?P<uuid>[0-9a-fA-F-]+)/$',
+            async_views.AsyncPageDetailView.as_view(),
+            name='page-detail'
+        ),
+    ] + urlpatterns
@@ -1,39 +1,356 @@
 """
 Views for the book APIs.
 """
-from drf_spectacular.utils import extend_schema, OpenApiParameter
+import math
+from functools import partial
+from uuid import UUID
 
-from rest_framework import viewsets
-from rest_framework.filters import SearchFilter
-from rest_framework.pagination import PageNumberPagination
+from drf_spectacular.utils import (
+    extend_schema,
+    extend_schema_view,
+    OpenApiParameter,
+)
+from rest_framework import generics, permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
+from rest_framework.views import APIView
 
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 
 from core.models import Book, Page
 
-from book import serializers, permisions
+from book import (
+    events,
+    filters, serializers, permisions, pagination, renderers
+)
+from book.deletion import soft_delete_book
+from book.exports import EXPORTERS
+from book.reorder import insert_page, move_page, remove_page
+from book.progress import get_continue_reading, record_progress
+from book.rollups import get_book_stats, get_most_read_books
+from book.search import get_search_backend, search_pages
+from book.summary import annotate_page_summary, parse_summary_fields
+from book.cache import get_page_book, set_page_book
+from book.mixins import (
+    CachedReadMixin,
+    ConditionalGetMixin,
+    ReplicaReadMixin,
+    SparseFieldsMixin,
+    ValuesListMixin,
+)
 
 
-class BookPagination(PageNumberPagination):
-    page_size = 10
+def get_int_param(request, name, default, maximum):
+    """
+    Return an integer query parameter between 1 and `maximum`.
+    """
+    value = request.query_params.get(name, default)
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        value = 0
+    if not 1 <= value <= maximum:
+        raise ValidationError({
+            name: _('Must be an integer from 1 to %(maximum)d.') % {
+                'maximum': maximum
+            }
+        })
+    return value
 
 
-class BookViewSet(viewsets.ModelViewSet):
+def retry_later(detail, interval):
+    """
+    Return a 503 asking the client to retry after a buffer flush.
+    """
+    return Response(
+        {'detail': detail},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={'Retry-After': str(max(math.ceil(interval), 1))},
+    )
+
+
+INCLUDE_PARAMETER = OpenApiParameter(
+    name='include', type=str, location=OpenApiParameter.QUERY,
+    description=_(
+        'Comma separated page summary fields to add: page_count, '
+        'last_page_number, preview.'
+    ),
+)
+FIELDS_PARAMETER = OpenApiParameter(
+    name='fields', type=str, location=OpenApiParameter.QUERY,
+    description=_(
+        'Comma separated fields to return, the others are not read.'
+    ),
+)
+
+
+@extend_schema_view(
+    list=extend_schema(parameters=[INCLUDE_PARAMETER, FIELDS_PARAMETER]),
+    retrieve=extend_schema(
+        parameters=[INCLUDE_PARAMETER, FIELDS_PARAMETER]
+    ),
+)
+class BookViewSet(
+    ReplicaReadMixin,
+    ConditionalGetMixin,
+    CachedReadMixin,
+    SparseFieldsMixin,
+    ValuesListMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for Book model.
     """
     serializer_class = serializers.BookSerializer
     queryset = Book.objects.all().order_by('-created_at')
-    pagination_class = BookPagination
+    pagination_class = pagination.BookListPagination
     permission_classes = [permisions.IsEditorOrReadOnly]
+    filter_backends = [filters.BookFilterBackend, OrderingFilter]
+    ordering_fields = ['created_at', 'updated_at', 'title', 'author']
+    ordering = ['-created_at', 'id']
     lookup_field = 'uuid'
+    max_bulk_pages = 5000
+    summary_actions = ('list', 'retrieve')
+    conditional_actions = ('retrieve', 'toc')
+    cached_actions = ('retrieve', 'toc')
+
+    def get_sparse_required_fields(self):
+        """
+        Return the ordering columns, read by the cursor pagination.
+        """
+        if self.action != 'list':
+            return []
+        return [
+            field.lstrip('-') for field in OrderingFilter().get_ordering(
+                self.request, self.queryset, self
+            )
+        ]
+
+    def get_summary_fields(self):
+        """
+        Return the page summary fields requested with `?include=`.
+        """
+        if self.action not in self.summary_actions:
+            return ()
+        return parse_summary_fields(self.request.query_params.get('include'))
+
+    def get_queryset(self):
+        """
+        Annotate the requested page summaries in the query of the books.
+        """
+        return annotate_page_summary(
+            super().get_queryset(), self.get_summary_fields()
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['include'] = self.get_summary_fields()
+        return context
+
+    def get_serializer_class(self):
+        """
+        Return the serializer class based on the action.
+        """
+        if self.action == 'list':
+            return serializers.BookValuesSerializer
+        if self.action in ('pages_bulk', 'pages_insert'):
+            return serializers.PageBulkSerializer
+        if self.action == 'pages_move':
+            return serializers.PageMoveSerializer
+        if self.action == 'pages_remove':
+            return serializers.PageNumberSerializer
+
+        return self.serializer_class
+
+    def perform_destroy(self, instance):
+        """
+        Hide the book at once, its pages are purged later.
+        """
+        soft_delete_book(instance)
+
+    @extend_schema(
+        request=serializers.PageBulkSerializer(many=True),
+        responses=serializers.PageBulkSerializer(many=True),
+        description=_(
+            'POST adds the pages to the book, PUT replaces all its pages.'
+        ),
+    )
+    @action(
+        detail=True, methods=['post', 'put'],
+        url_path='pages/bulk', url_name='pages-bulk'
+    )
+    def pages_bulk(self, request, uuid=None):
+        """
+        Create or replace the pages of a book in a single transaction.
+        """
+        book = self.get_object()
+        replace = request.method == 'PUT'
+        context = self.get_serializer_context()
+        context.update({'book': book, 'replace': replace})
+
+        serializer = self.get_serializer_class()(
+            data=request.data, many=True, context=context,
+            max_length=self.max_bulk_pages,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(
+            serializer.data,
+            status=status.HTTP_200_OK if replace else status.HTTP_201_CREATED
+        )
+
+    @action(
+        detail=True, methods=['post'],
+        url_path='pages/insert', url_name='pages-insert'
+    )
+    def pages_insert(self, request, uuid=None):
+        """
+        Insert a page at a number, moving the following pages up.
+        """
+        book = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        page = insert_page(
+            book, serializer.validated_data['number'],
+            serializer.validated_data['content'],
+        )
+        return Response(
+            self.get_serializer(page).data, status=status.HTTP_201_CREATED
+        )
+
+    @extend_schema(responses=serializers.PageBulkSerializer)
+    @action(
+        detail=True, methods=['post'],
+        url_path='pages/move', url_name='pages-move'
+    )
+    def pages_move(self, request, uuid=None):
+        """
+        Move a page to another number, shifting the pages in between.
+        """
+        book = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        page = move_page(
+            book, serializer.validated_data['number'],
+            serializer.validated_data['to'],
+        )
+        return Response(serializers.PageBulkSerializer(page).data)
 
+    @extend_schema(responses={204: None})
+    @action(
+        detail=True, methods=['post'],
+        url_path='pages/remove', url_name='pages-remove'
+    )
+    def pages_remove(self, request, uuid=None):
+        """
+        Delete a page, moving the following pages down to close the gap.
+        """
+        book = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        remove_page(book, serializer.validated_data['number'])
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
-class PagePagination(PageNumberPagination):
-    page_size = 15
-    invalid_page_message = _('Invalid page number.')
-    invalid_page_message_detail = _('Please provide a valid page number.')
+    @extend_schema(
+        responses=serializers.PageTocSerializer(many=True),
+        description=_(
+            'The uuid and number of every page of the book, unpaginated.'
+        ),
+    )
+    @action(detail=True, methods=['get'])
+    def toc(self, request, uuid=None):
+        """
+        Return the table of contents of the book, cached per book version.
+        """
+        return self.conditional_response(
+            partial(self.cached_response, self.read_toc), request, uuid=uuid
+        )
+
+    def read_toc(self, request, uuid=None):
+        """
+        Read the table of contents of the book with a single page query.
+        """
+        book = self.get_object()
+        serializer_class = serializers.PageTocSerializer
+        pages = Page.objects.filter(book=book).order_by('number').values(
+            *serializer_class.values_fields()
+        )
+        return Response(serializer_class(pages, many=True).data)
+
+    @extend_schema(responses=serializers.BookStatsSerializer)
+    @action(detail=True, methods=['get'])
+    def stats(self, request, uuid=None):
+        """
+        Return the reads of the book from the rollups.
+        """
+        book = self.get_object()
+        return Response(
+            serializers.BookStatsSerializer(get_book_stats(book)).data
+        )
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='days', type=int, location=OpenApiParameter.QUERY,
+                description=_('Number of days counted, 1 to 365.'),
+            ),
+            OpenApiParameter(
+                name='limit', type=int, location=OpenApiParameter.QUERY,
+                description=_('Number of books, 1 to 100.'),
+            ),
+        ],
+        responses=serializers.MostReadBookSerializer(many=True),
+    )
+    @action(
+        detail=False, methods=['get'],
+        url_path='most-read', url_name='most-read'
+    )
+    def most_read(self, request):
+        """
+        Return the books read the most over the last days.
+        """
+        days = get_int_param(request, 'days', 7, 365)
+        limit = get_int_param(request, 'limit', 10, 100)
+        return Response(serializers.MostReadBookSerializer(
+            get_most_read_books(days, limit), many=True
+        ).data)
+
+    @extend_schema(
+        responses={
+            (200, 'application/x-ndjson'): str,
+            (200, 'text/plain'): str,
+        },
+        description=_(
+            'Stream all the pages of the book. Use `?format=ndjson` or '
+            '`?format=txt`.'
+        ),
+    )
+    @action(
+        detail=True, methods=['get'],
+        renderer_classes=[
+            renderers.NDJSONRenderer, renderers.PlainTextRenderer
+        ],
+    )
+    def export(self, request, uuid=None):
+        """
+        Stream every page of the book in the negotiated format.
+        """
+        book = self.get_object()
+        renderer = request.accepted_renderer
+        export_format = renderer.format
+        response = StreamingHttpResponse(
+            EXPORTERS[export_format](book),
+            content_type=f'{renderer.media_type}; charset={renderer.charset}',
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{book.uuid}.{export_format}"'
+        )
+        return response
 
 
 @extend_schema(
@@ -47,23 +364,66 @@ class PagePagination(PageNumberPagination):
         )
     ]
 )
-class PageViewSet(viewsets.ModelViewSet):
+@extend_schema_view(
+    retrieve=extend_schema(parameters=[FIELDS_PARAMETER]),
+    list=extend_schema(parameters=[FIELDS_PARAMETER]),
+)
+class PageViewSet(
+    ReplicaReadMixin,
+    ConditionalGetMixin,
+    CachedReadMixin,
+    SparseFieldsMixin,
+    ValuesListMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for Page model.
     """
     serializer_class = serializers.PageDetailSerializer
     queryset = Page.objects.all()
-    pagination_class = PagePagination
+    pagination_class = pagination.PageListPagination
     permission_classes = [permisions.IsEditorOrReadOnly]
     filter_backends = [SearchFilter]
     search_fields = ['book__uuid']
     lookup_field = 'uuid'
+    conditional_actions = ('list',)
+    cached_actions = ('list', 'retrieve')
+
+    def get_sparse_required_fields(self):
+        """
+        Return the number read by the cursor pagination of the list, and
+        the uuids cached by the detail.
+        """
+        if self.action == "retrieve":
+            return ["uuid", "book__uuid"]
+        return ["number"]
+
+    def get_request_book_uuid(self):
+        """
+        Return the uuid of the book the pages are read from.
+        """
+        if self.action == "retrieve":
+            return get_page_book(self.kwargs[self.lookup_field])
+
+        return self.request.query_params.get("book_uuid")
+
+    def get_object(self):
+        """
+        Return the page, remembering its book for the cache.
+        """
+        page = super().get_object()
+        if self.action == "retrieve":
+            set_page_book(page.uuid, page.book.uuid)
+
+        return page
 
     def get_serializer_class(self):
         """
         Return the serializer class based on the action.
         """
-        if self.action in ['list', 'create']:
+        if self.action == 'list':
+            return serializers.PageValuesSerializer
+        if self.action == 'create':
             return serializers.PageSerializer
 
         return self.serializer_class
@@ -72,7 +432,9 @@ class PageViewSet(viewsets.ModelViewSet):
         """
         Return the queryset for the Page model.
         """
-        queryset = self.queryset
+        queryset = super().get_queryset().filter(
+            book__deleted_at__isnull=True
+        )
 
         if self.action == "list":
             book_uuid = self.request.query_params.get("book_uuid")
@@ -81,5 +443,143 @@ class PageViewSet(viewsets.ModelViewSet):
                     {"book_uuid": _("This field is required.")}
                 )
             queryset = queryset.filter(book__uuid=book_uuid)
+        elif self.action == "retrieve":
+            queryset = queryset.select_related("book")
 
         return queryset.order_by("number")
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name='q',
+            description=_('Text to search for in the pages.'),
+            required=True,
+            type=str,
+            location=OpenApiParameter.QUERY
+        ),
+        OpenApiParameter(
+            name='book_uuid',
+            description=_('UUID of the book to restrict the search to.'),
+            required=False,
+            type=str,
+            location=OpenApiParameter.QUERY
+        ),
+    ]
+)
+class PageSearchView(generics.ListAPIView):
+    """
+    Full-text search over the content of the pages.
+    """
+    serializer_class = serializers.PageSearchSerializer
+    pagination_class = pagination.SearchCursorPagination
+    permission_classes = [permisions.IsEditorOrReadOnly]
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.search_backend = get_search_backend()
+
+    def get_search_query(self):
+        """
+        Return the search query of the request.
+        """
+        query = self.request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": _("This field is required.")})
+
+        return query
+
+    def get_search_book_uuid(self):
+        """
+        Return the UUID of the book to restrict the search to, if any.
+        """
+        book_uuid = self.request.query_params.get("book_uuid")
+        if not book_uuid:
+            return None
+        try:
+            return UUID(book_uuid)
+        except ValueError:
+            raise ValidationError({"book_uuid": _("Must be a valid UUID.")})
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["query"] = self.request.query_params.get("q", "")
+
+        return context
+
+    def get_queryset(self):
+        """
+        Return the ranked pages matching the query.
+        """
+        return search_pages(
+            self.search_backend,
+            self.get_search_query(),
+            self.get_search_book_uuid(),
+        )
+
+
+class PageReadView(APIView):
+    """
+    Report that the user read a page.
+
+    The event is buffered and written in batches, see `book.events`. When
+    the buffer is full the event is dropped and the client is asked to
+    retry later.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(request=None, responses={202: None, 503: None})
+    def post(self, request, uuid):
+        if not events.record_read(request.user.id, uuid):
+            return retry_later(
+                _('Too many read events, retry later.'),
+                getattr(settings, 'READ_EVENTS_FLUSH_INTERVAL', 1.0),
+            )
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+
+class BookProgressView(APIView):
+    """
+    Save the page the user reached in a book.
+
+    Updates are debounced and written in batches, see `book.progress`, so
+    they show up in the continue reading list within
+    `READING_PROGRESS_FLUSH_INTERVAL` seconds.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = serializers.ReadingProgressSerializer
+
+    @extend_schema(responses={202: None, 503: None})
+    def put(self, request, uuid):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if not record_progress(
+            request.user.id, uuid, serializer.validated_data['page_number']
+        ):
+            return retry_later(
+                _('Too many progress updates, retry later.'),
+                getattr(settings, 'READING_PROGRESS_FLUSH_INTERVAL', 5.0),
+            )
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+
+class ContinueReadingView(APIView):
+    """
+    The books the user read last, with the page they are on.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name='limit', type=int, location=OpenApiParameter.QUERY,
+                description=_('Number of books, 1 to 50.'),
+            ),
+        ],
+        responses=serializers.ContinueReadingSerializer(many=True),
+    )
+    def get(self, request):
+        limit = get_int_param(request, 'limit', 10, 50)
+        return Response(serializers.ContinueReadingSerializer(
+            get_continue_reading(request.user.id, limit), many=True
+        ).data)
@@ -7,6 +7,8 @@ from django.utils.translation import gettext_lazy as _
 
 from core.models import User, Page, Book
 
+from book.deletion import soft_delete_book
+
 
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
@@ -53,6 +55,13 @@ class BookAdmin(admin.ModelAdmin):
 
     readonly_fields = ['created_at', 'updated_at', 'uuid']
 
+    def delete_model(self, request, obj):
+        soft_delete_book(obj)
+
+    def delete_queryset(self, request, queryset):
+        for book in queryset:
+            soft_delete_book(book)
+
 
 @admin.register(Page)
 class PageAdmin(admin.ModelAdmin):
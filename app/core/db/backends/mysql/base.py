@@ -0,0 +1,12 @@
+"""
+MySQL backend drawing its connections from a per-process pool.
+"""
+from django.db.backends.mysql import base
+
+from core.db.pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+
+    def ping_connection(self, connection):
+        connection.ping()
@@ -0,0 +1,232 @@
+"""
+Bounded pool of database connections, shared by the threads of a process.
+"""
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    """No connection became available in time."""
+
+
+class ConnectionPool:
+    """
+    Keep up to `size` idle connections for reuse.
+
+    Up to `max_overflow` more connections are opened under load, they are
+    closed when returned. Connections older than `recycle` seconds are
+    replaced, idle ones are pinged before being handed out.
+    """
+
+    def __init__(
+        self, connect, ping=None, size=5, max_overflow=10, recycle=3600,
+        timeout=30,
+    ):
+        self.connect = connect
+        self.ping = ping
+        self.size = size
+        self.max_overflow = max_overflow
+        self.recycle = recycle
+        self.timeout = timeout
+        self._idle = deque()
+        self._opened_at = {}
+        self._checked_out = 0
+        self._condition = threading.Condition()
+        self.counters = dict.fromkeys(
+            ('connects', 'checkouts', 'recycled', 'failed_pings', 'waits',
+             'timeouts'),
+            0,
+        )
+
+    def acquire(self):
+        """Return an idle connection or a new one, waiting for a slot."""
+        with self._condition:
+            if not self._idle and not self._has_room():
+                self.counters['waits'] += 1
+                available = self._condition.wait_for(
+                    lambda: self._idle or self._has_room(), self.timeout
+                )
+                if not available:
+                    self.counters['timeouts'] += 1
+                    raise PoolTimeout(
+                        f'No connection available within {self.timeout}s '
+                        f'({self.size + self.max_overflow} in use).'
+                    )
+            connection = self._idle.pop() if self._idle else None
+            self._checked_out += 1
+            self.counters['checkouts'] += 1
+
+        try:
+            if connection is not None and not self._reusable(connection):
+                connection = None
+            if connection is None:
+                connection = self.connect()
+                with self._condition:
+                    self._opened_at[id(connection)] = time.monotonic()
+                    self.counters['connects'] += 1
+        except BaseException:
+            with self._condition:
+                self._checked_out -= 1
+                self._condition.notify()
+            raise
+        return connection
+
+    def release(self, connection):
+        """Return a connection, closing it if the pool is full or stale."""
+        with self._condition:
+            self._checked_out -= 1
+            keep = len(self._idle) < self.size and not self._expired(
+                connection
+            )
+            if keep:
+                self._idle.append(connection)
+            self._condition.notify()
+        if not keep:
+            self._close(connection)
+
+    def discard(self, connection):
+        """Close a checked out connection that cannot be reused."""
+        with self._condition:
+            self._checked_out -= 1
+            self._condition.notify()
+        self._close(connection)
+
+    def close(self):
+        """Close the idle connections."""
+        with self._condition:
+            idle, self._idle = list(self._idle), deque()
+        for connection in idle:
+            self._close(connection)
+
+    def stats(self):
+        with self._condition:
+            return {
+                'size': self.size,
+                'max_overflow': self.max_overflow,
+                'checked_out': self._checked_out,
+                'idle': len(self._idle),
+                'overflow': max(
+                    self._checked_out + len(self._idle) - self.size, 0
+                ),
+                **self.counters,
+            }
+
+    def _has_room(self):
+        return self._checked_out + len(self._idle) < (
+            self.size + self.max_overflow
+        )
+
+    def _expired(self, connection):
+        opened_at = self._opened_at.get(id(connection), 0)
+        return time.monotonic() - opened_at >= self.recycle
+
+    def _reusable(self, connection):
+        if self._expired(connection):
+            with self._condition:
+                self.counters['recycled'] += 1
+            self._close(connection)
+            return False
+        if self.ping is not None:
+            try:
+                self.ping(connection)
+            except Exception:
+                with self._condition:
+                    self.counters['failed_pings'] += 1
+                self._close(connection)
+                return False
+        return True
+
+    def _close(self, connection):
+        with self._condition:
+            self._opened_at.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(name, factory):
+    """Return the pool with this name, creating it with `factory`."""
+    with _pools_lock:
+        if name not in _pools:
+            _pools[name] = factory()
+        return _pools[name]
+
+
+def get_pool_stats():
+    """Return the statistics of the pools of this process by name."""
+    with _pools_lock:
+        pools = dict(_pools)
+    return {alias: pool.stats() for alias, pool in pools.items()}
+
+
+def close_pools():
+    """Close the idle connections of every pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    Database wrapper returning its connection to a pool when closed.
+
+    Configured with the `POOL` dict of the database settings (`SIZE`,
+    `MAX_OVERFLOW`, `RECYCLE`, `TIMEOUT`). `CONN_MAX_AGE` should be 0 so
+    that the connection goes back to the pool at the end of each request.
+    """
+    pool_defaults = {
+        'SIZE': 5,
+        'MAX_OVERFLOW': 10,
+        'RECYCLE': 3600,
+        'TIMEOUT': 30,
+    }
+
+    def ping_connection(self, connection):
+        """Raise if a pooled connection does not respond."""
+        raise NotImplementedError
+
+    def get_pool(self, conn_params):
+        options = {**self.pool_defaults, **self.settings_dict.get('POOL', {})}
+        ping = (
+            self.ping_connection
+            if self.settings_dict['CONN_HEALTH_CHECKS'] else None
+        )
+        # The test runner switches the database of an alias.
+        name = f"{self.alias}:{self.settings_dict['NAME']}"
+        return get_pool(name, lambda: ConnectionPool(
+            lambda: super(PooledDatabaseWrapperMixin, self).get_new_connection(
+                conn_params
+            ),
+            ping=ping,
+            size=options['SIZE'],
+            max_overflow=options['MAX_OVERFLOW'],
+            recycle=options['RECYCLE'],
+            timeout=options['TIMEOUT'],
+        ))
+
+    def get_new_connection(self, conn_params):
+        self.pool = self.get_pool(conn_params)
+        try:
+            return self.pool.acquire()
+        except PoolTimeout as exc:
+            raise self.Database.OperationalError(str(exc)) from exc
+
+    def _close(self):
+        if self.connection is None:
+            return
+        connection = self.connection
+        try:
+            if self.in_atomic_block or not self.autocommit:
+                with self.wrap_database_errors:
+                    connection.rollback()
+        except Exception:
+            self.pool.discard(connection)
+            raise
+        self.pool.release(connection)
@@ -0,0 +1,91 @@
+"""
+Route the reads of selected views to the read replicas.
+
+Reads go to the primary unless they run inside `replica_reads()`, which
+the book and page views enter for safe requests. A client that has just
+written is pinned to the primary by a cookie for
+`DATABASE_REPLICA_PIN_SECONDS`, so it never reads its own write from a
+replica that has not caught up.
+"""
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+PIN_COOKIE = 'db_primary_until'
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def get_replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def get_pin_seconds():
+    return getattr(settings, 'DATABASE_REPLICA_PIN_SECONDS', 10)
+
+
+def choose_replica(replicas):
+    """Return the replica alias to read from."""
+    return random.choice(replicas)
+
+
+@contextmanager
+def replica_reads():
+    """Send the reads of the enclosed code to the replicas."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def reads_from_replicas():
+    """Return True if reads currently go to a replica."""
+    return bool(get_replicas()) and _replica_reads.get()
+
+
+def primary_pinned(request):
+    """Return True if the client wrote recently."""
+    try:
+        return float(request.COOKIES[PIN_COOKIE]) > time.time()
+    except (KeyError, ValueError):
+        return False
+
+
+def pin_to_primary(response):
+    """Keep the client on the primary until the replicas caught up."""
+    seconds = get_pin_seconds()
+    response.set_cookie(
+        PIN_COOKIE, str(int(time.time() + seconds)),
+        max_age=seconds, httponly=True, samesite='Lax',
+    )
+
+
+class ReplicaRouter:
+    """
+    Send writes to the primary and `replica_reads()` reads to a replica.
+    """
+
+    def db_for_read(self, model, **hints):
+        if reads_from_replicas():
+            return choose_replica(get_replicas())
+        return None
+
+    def db_for_write(self, model, **hints):
+        # Instances read from a replica are saved to the primary.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if {obj1._state.db, obj2._state.db} <= aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replicas():
+            return False
+        return None
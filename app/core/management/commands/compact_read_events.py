@@ -0,0 +1,34 @@
+"""
+Django command to fold the page read events into the reading statistics.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from book.rollups import compact_read_events
+
+
+class Command(BaseCommand):
+    """
+    Add the read events written since the previous run to the hourly and
+    daily reads of the books and the reads of the pages. Run it
+    periodically, for instance every minute from cron.
+    """
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000)
+        parser.add_argument(
+            '--no-settle', action='store_false', dest='settle',
+            help='Also compact the events written since the previous run.',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        compacted = compact_read_events(
+            options['batch_size'], settle=options['settle']
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Compacted {compacted} read events in '
+            f'{time.perf_counter() - started:.1f}s.'
+        ))
@@ -0,0 +1,28 @@
+"""
+Django command to remove the deleted books and their pages.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from book.deletion import purge_deleted_books
+
+
+class Command(BaseCommand):
+    """
+    Remove the books marked deleted with their pages and statistics, in
+    short batches of raw deletes. Run it periodically or after deleting
+    large books.
+    """
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        books, pages = purge_deleted_books(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Purged {books} books and {pages} pages in '
+            f'{time.perf_counter() - started:.1f}s.'
+        ))
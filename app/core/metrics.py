@@ -0,0 +1,87 @@
+"""
+Prometheus metrics of the API.
+
+When `PROMETHEUS_MULTIPROC_DIR` is set, as `scripts/run.sh` does, every
+worker process writes its values to files in that directory and
+`/metrics` aggregates them, so any worker can answer the scrape.
+"""
+import os
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+    multiprocess,
+)
+
+METHODS = frozenset(
+    ['GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS']
+)
+UNMATCHED = '<unmatched>'
+
+REQUESTS = Counter(
+    'http_requests_total',
+    'Requests by URL name, method and status code.',
+    ['view', 'method', 'status'],
+)
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Request latency by URL name and method.',
+    ['view', 'method'],
+)
+REQUEST_QUERIES = Histogram(
+    'http_request_db_queries',
+    'SQL queries per request by URL name and method.',
+    ['view', 'method'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, float('inf')),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight',
+    'Requests being processed.',
+    multiprocess_mode='livesum',
+)
+BOOK_CACHE = Counter(
+    'book_cache_requests_total',
+    'Lookups of the book cache by kind and result (hit or miss).',
+    ['kind', 'result'],
+)
+
+
+def request_labels(request):
+    """Return the URL name and method labels of a request."""
+    match = request.resolver_match
+    # Unresolved paths and unknown methods are folded so that a client
+    # cannot create series at will.
+    view = match.view_name if match and match.view_name else UNMATCHED
+    method = request.method if request.method in METHODS else 'other'
+    return view, method
+
+
+def observe_request(request, response, duration, queries):
+    """Record a served request."""
+    view, method = request_labels(request)
+    REQUESTS.labels(view, method, response.status_code).inc()
+    REQUEST_LATENCY.labels(view, method).observe(duration)
+    REQUEST_QUERIES.labels(view, method).observe(queries)
+
+
+def observe_cache(kind, hit):
+    """Record a lookup of the book cache."""
+    BOOK_CACHE.labels(kind, 'hit' if hit else 'miss').inc()
+
+
+def get_registry():
+    """Return the registry holding the metrics of every worker."""
+    if not os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render():
+    """Return the metrics in the Prometheus text format."""
+    return generate_latest(get_registry())
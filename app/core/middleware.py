@@ -0,0 +1,311 @@
+"""
+Middleware shared by the APIs.
+"""
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from core import metrics, timing
+
+logger = logging.getLogger(__name__)
+
+
+def parse_accept_encoding(header):
+    """Return the weight of every coding of an Accept-Encoding header."""
+    weights = {}
+    for item in header.split(','):
+        coding, *params = (part.strip() for part in item.split(';'))
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.lower()] = weight
+    return weights
+
+
+def negotiate_encoding(header, encodings):
+    """
+    Return the coding of `encodings` the client prefers, or None.
+
+    Ties are broken by the order of `encodings`.
+    """
+    weights = parse_accept_encoding(header)
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress_sequence_br(sequence, quality):
+    """Compress a sequence of chunks, flushing after each one."""
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def compress_async_sequence_br(sequence, quality):
+    """Compress an async sequence of chunks, flushing after each one."""
+    compressor = brotli.Compressor(quality=quality)
+    async for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def compress_async_sequence_gzip(sequence, max_random_bytes):
+    """Compress each chunk of an async sequence as a gzip member."""
+    async for chunk in sequence:
+        yield compress_string(chunk, max_random_bytes=max_random_bytes)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress responses with brotli or gzip, as the client prefers.
+
+    Responses shorter than `COMPRESSION_MIN_LENGTH` are sent as they are.
+    Like `GZipMiddleware`, gzip output is padded with random bytes against
+    BREACH, and strong ETags are made weak, which keeps the conditional
+    requests of the book and page APIs matching.
+    """
+    max_random_bytes = 100
+
+    def brotli_quality(self):
+        return getattr(settings, 'BROTLI_QUALITY', 4)
+
+    def get_encodings(self):
+        return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+    def compress(self, encoding, content):
+        if encoding == 'br':
+            return brotli.compress(
+                content, quality=self.brotli_quality()
+            )
+        return compress_string(
+            content, max_random_bytes=self.max_random_bytes
+        )
+
+    def compress_streaming(self, encoding, response):
+        content = response.streaming_content
+        if encoding == 'br':
+            if response.is_async:
+                return compress_async_sequence_br(
+                    content, self.brotli_quality()
+                )
+            return compress_sequence_br(content, self.brotli_quality())
+        if response.is_async:
+            return compress_async_sequence_gzip(
+                content, self.max_random_bytes
+            )
+        return compress_sequence(
+            content, max_random_bytes=self.max_random_bytes
+        )
+
+    def process_response(self, request, response):
+        if (
+            not response.streaming and
+            len(response.content) <
+            getattr(settings, 'COMPRESSION_MIN_LENGTH', 200)
+        ):
+            return response
+        if response.has_header('Content-Encoding'):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING', ''),
+            self.get_encodings(),
+        )
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = self.compress_streaming(
+                encoding, response
+            )
+            # The compressed size is only known once streamed.
+            del response.headers['Content-Length']
+        else:
+            compressed_content = self.compress(encoding, response.content)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers['Content-Length'] = str(len(response.content))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Record the count, latency and SQL queries of the requests by URL name
+    and method, and the requests in flight, see `core.metrics`.
+
+    Set `METRICS_ENABLED` to false to leave it out.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics.REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            with timing.start() as request_timing:
+                response = self.get_response(request)
+        finally:
+            metrics.REQUESTS_IN_FLIGHT.dec()
+        metrics.observe_request(
+            request, response, time.perf_counter() - started,
+            request_timing.queries,
+        )
+        return response
+
+    async def __acall__(self, request):
+        metrics.REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            with timing.start() as request_timing:
+                response = await self.get_response(request)
+        finally:
+            metrics.REQUESTS_IN_FLIGHT.dec()
+        metrics.observe_request(
+            request, response, time.perf_counter() - started,
+            request_timing.queries,
+        )
+        return response
+
+
+class ServerTimingMiddleware:
+    """
+    Measure the SQL queries, serialization and rendering of each request.
+
+    `SERVER_TIMING` sends the measures in a `Server-Timing` header to
+    everyone (`all`), to staff users only (`staff`) or to nobody (`off`).
+    `SERVER_TIMING_LOG` also logs them, one line per request. With both
+    off the middleware is not loaded at all.
+    """
+    sync_capable = True
+    async_capable = True
+    modes = ('all', 'staff', 'off')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.mode = getattr(settings, 'SERVER_TIMING', 'staff')
+        self.log = getattr(settings, 'SERVER_TIMING_LOG', False)
+        if self.mode not in self.modes:
+            raise ImproperlyConfigured(
+                f'SERVER_TIMING must be one of {", ".join(self.modes)}.'
+            )
+        if self.mode == 'off' and not self.log:
+            raise MiddlewareNotUsed
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with timing.start() as request_timing:
+            started = time.perf_counter()
+            response = self.get_response(request)
+            request_timing.add('view', time.perf_counter() - started)
+        return self.process_timing(request, response, request_timing)
+
+    async def __acall__(self, request):
+        with timing.start() as request_timing:
+            started = time.perf_counter()
+            response = await self.get_response(request)
+            request_timing.add('view', time.perf_counter() - started)
+        return self.process_timing(request, response, request_timing)
+
+    def process_timing(self, request, response, request_timing):
+        if self.send_header(request):
+            self.patch_header(response, request_timing)
+        if self.log:
+            self.log_timing(request, response, request_timing)
+        return response
+
+    def process_template_response(self, request, response):
+        request_timing = timing.current()
+        started = time.perf_counter()
+
+        def rendered(response):
+            request_timing.add('render', time.perf_counter() - started)
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    def send_header(self, request):
+        if self.mode == 'staff':
+            user = getattr(request, 'user', None)
+            return getattr(user, 'is_staff', False)
+        return self.mode == 'all'
+
+    def patch_header(self, response, request_timing):
+        durations = request_timing.durations
+        metrics = [
+            f'db;dur={durations.get("db", 0) * 1000:.2f};'
+            f'desc="{request_timing.queries} queries"'
+        ]
+        metrics.extend(
+            f'{name};dur={durations.get(name, 0) * 1000:.2f}'
+            for name in ('serialize', 'render', 'view')
+        )
+        if response.has_header('Server-Timing'):
+            metrics.insert(0, response.headers['Server-Timing'])
+        response.headers['Server-Timing'] = ', '.join(metrics)
+
+    def log_timing(self, request, response, request_timing):
+        match = request.resolver_match
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name if match else None,
+            'status': response.status_code,
+            'queries': request_timing.queries,
+        }
+        for name in ('db', 'serialize', 'render', 'view'):
+            record[f'{name}_ms'] = round(
+                request_timing.durations.get(name, 0) * 1000, 2
+            )
+        logger.info(
+            ' '.join(f'{key}=%s' for key in record),
+            *record.values(),
+            extra={'server_timing': record},
+        )
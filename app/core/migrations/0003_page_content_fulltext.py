@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:00
+
+from django.db import migrations
+
+
+def add_fulltext_index(apps, schema_editor):
+    """Add the FULLTEXT index used by the page search on MySQL."""
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    schema_editor.execute(
+        'ALTER TABLE core_page ADD FULLTEXT INDEX core_page_content_ft '
+        '(content)'
+    )
+
+
+def remove_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    schema_editor.execute(
+        'ALTER TABLE core_page DROP INDEX core_page_content_ft'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_book_page'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_fulltext_index, remove_fulltext_index),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_book_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('read_at', models.DateTimeField(help_text='When the page was read.', verbose_name='Read date')),
+                ('book', models.ForeignKey(db_constraint=False, db_index=False, help_text='Book of the page.', on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.book', verbose_name='Book')),
+                ('page', models.ForeignKey(db_constraint=False, db_index=False, help_text='Page read.', on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.page', verbose_name='Page')),
+                ('user', models.ForeignKey(db_constraint=False, db_index=False, help_text='User who read the page.', on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+        ),
+    ]
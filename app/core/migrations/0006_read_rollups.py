@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_read_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadRollupCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_event_id', models.BigIntegerField(default=0)),
+                ('seen_event_id', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='BookReadRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], help_text='Length of the period.', max_length=4, verbose_name='Granularity')),
+                ('period_start', models.DateTimeField(help_text='Start of the period, in UTC.', verbose_name='Period start')),
+                ('reads', models.PositiveBigIntegerField(default=0, help_text='Pages of the book read during the period.', verbose_name='Reads')),
+                ('book', models.ForeignKey(help_text='Book read.', on_delete=django.db.models.deletion.CASCADE, related_name='read_rollups', to='core.book', verbose_name='Book')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['granularity', 'period_start'], name='book_read_rollup_period_idx')],
+                'constraints': [models.UniqueConstraint(fields=('book', 'granularity', 'period_start'), name='book_read_rollup_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PageReadCount',
+            fields=[
+                ('page', models.OneToOneField(help_text='Page read.', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='read_count', serialize=False, to='core.page', verbose_name='Page')),
+                ('reads', models.PositiveBigIntegerField(default=0, help_text='Times the page was read.', verbose_name='Reads')),
+                ('book', models.ForeignKey(db_index=False, help_text='Book of the page.', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.book', verbose_name='Book')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['book', '-reads'], name='page_read_count_book_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_read_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadingProgress',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('page_number', models.PositiveIntegerField(help_text='Number of the last page read.', verbose_name='Page number')),
+                ('updated_at', models.DateTimeField(help_text='When the page was reached.', verbose_name='Modification date')),
+                ('book', models.ForeignKey(help_text='Book being read.', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.book', verbose_name='Book')),
+                ('user', models.ForeignKey(db_index=False, help_text='User reading the book.', on_delete=django.db.models.deletion.CASCADE, related_name='reading_progress', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-updated_at'], name='reading_progress_recent_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'book'), name='reading_progress_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_reading_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='When the book was deleted, pending purge.', null=True, verbose_name='Deletion date'),
+        ),
+    ]
@@ -1,2 +1,9 @@
 from .user import User # noqa
 from .book import Book, Page # noqa
+from .reading import ( # noqa
+    BookReadRollup,
+    PageReadCount,
+    ReadEvent,
+    ReadingProgress,
+    ReadRollupCursor,
+)
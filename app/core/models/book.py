@@ -7,8 +7,20 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 
+class BookManager(models.Manager):
+    """Manager of the books that are not deleted."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class Book(models.Model):
-    """Book in the system."""
+    """
+    Book in the system.
+
+    Deleted books are only marked with `deleted_at` and hidden from
+    `Book.objects`; `purge_deleted_books` removes them with their pages.
+    """
     uuid = models.UUIDField(
         default=uuid.uuid4, editable=False,
         unique=True, help_text=_('Unique identifier for the book.')
@@ -29,11 +41,34 @@ class Book(models.Model):
         auto_now=True,
         verbose_name=_("Modification date")
     )
+    deleted_at = models.DateTimeField(
+        null=True, blank=True, editable=False, db_index=True,
+        verbose_name=_("Deletion date"),
+        help_text=_('When the book was deleted, pending purge.')
+    )
+
+    objects = BookManager()
+    all_objects = models.Manager()
 
     def __str__(self):
         """Return string representation of book."""
         return self.title
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['-created_at', 'id'], name='book_created_idx'
+            ),
+            models.Index(
+                fields=['-updated_at', 'id'], name='book_updated_idx'
+            ),
+            models.Index(
+                fields=['author', '-created_at'],
+                name='book_author_created_idx'
+            ),
+            models.Index(fields=['title'], name='book_title_idx'),
+        ]
+
 
 class Page(models.Model):
     """Page in the book."""
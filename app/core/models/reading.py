@@ -0,0 +1,175 @@
+"""
+Reading models.
+"""
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ReadEvent(models.Model):
+    """
+    A page read by a user.
+
+    The table is append only and written in batches. It has no foreign
+    key constraints or secondary indexes so that inserts stay cheap and
+    deleting books, pages or users never cascades through it.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.DO_NOTHING,
+        db_constraint=False, db_index=False, related_name='+',
+        verbose_name=_('User'), help_text=_('User who read the page.')
+    )
+    book = models.ForeignKey(
+        'core.Book', on_delete=models.DO_NOTHING,
+        db_constraint=False, db_index=False, related_name='+',
+        verbose_name=_('Book'), help_text=_('Book of the page.')
+    )
+    page = models.ForeignKey(
+        'core.Page', on_delete=models.DO_NOTHING,
+        db_constraint=False, db_index=False, related_name='+',
+        verbose_name=_('Page'), help_text=_('Page read.')
+    )
+    read_at = models.DateTimeField(
+        verbose_name=_('Read date'),
+        help_text=_('When the page was read.')
+    )
+
+    def __str__(self):
+        """Return string representation of read event."""
+        return f"User {self.user_id} read page {self.page_id}"
+
+
+class BookReadRollup(models.Model):
+    """
+    Reads of a book during an hour or a day, compacted from the events.
+    """
+    HOUR = 'hour'
+    DAY = 'day'
+    GRANULARITIES = [(HOUR, _('Hour')), (DAY, _('Day'))]
+
+    book = models.ForeignKey(
+        'core.Book', on_delete=models.CASCADE,
+        related_name='read_rollups', verbose_name=_('Book'),
+        help_text=_('Book read.')
+    )
+    granularity = models.CharField(
+        verbose_name=_('Granularity'), max_length=4, choices=GRANULARITIES,
+        help_text=_('Length of the period.')
+    )
+    period_start = models.DateTimeField(
+        verbose_name=_('Period start'),
+        help_text=_('Start of the period, in UTC.')
+    )
+    reads = models.PositiveBigIntegerField(
+        verbose_name=_('Reads'), default=0,
+        help_text=_('Pages of the book read during the period.')
+    )
+
+    def __str__(self):
+        """Return string representation of book read rollup."""
+        return (
+            f"{self.reads} reads of book {self.book_id} "
+            f"for the {self.granularity} of {self.period_start}"
+        )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['book', 'granularity', 'period_start'],
+                name='book_read_rollup_unique'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['granularity', 'period_start'],
+                name='book_read_rollup_period_idx'
+            ),
+        ]
+
+
+class PageReadCount(models.Model):
+    """
+    Reads of a page, compacted from the events.
+    """
+    page = models.OneToOneField(
+        'core.Page', on_delete=models.CASCADE, primary_key=True,
+        related_name='read_count', verbose_name=_('Page'),
+        help_text=_('Page read.')
+    )
+    book = models.ForeignKey(
+        'core.Book', on_delete=models.CASCADE, db_index=False,
+        related_name='+', verbose_name=_('Book'),
+        help_text=_('Book of the page.')
+    )
+    reads = models.PositiveBigIntegerField(
+        verbose_name=_('Reads'), default=0,
+        help_text=_('Times the page was read.')
+    )
+
+    def __str__(self):
+        """Return string representation of page read count."""
+        return f"{self.reads} reads of page {self.page_id}"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['book', '-reads'], name='page_read_count_book_idx'
+            ),
+        ]
+
+
+class ReadRollupCursor(models.Model):
+    """
+    Progress of the compaction of the read events, a single row.
+
+    Events up to `last_event_id` are in the rollups. `seen_event_id` is
+    the latest event when the compaction last ran; the next run stops
+    there, giving the batch inserts in flight at the time one run to
+    commit before their ids are passed.
+    """
+    last_event_id = models.BigIntegerField(default=0)
+    seen_event_id = models.BigIntegerField(default=0)
+
+
+class ReadingProgress(models.Model):
+    """
+    Where a user is in a book.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        db_index=False, related_name='reading_progress',
+        verbose_name=_('User'),
+        help_text=_('User reading the book.')
+    )
+    book = models.ForeignKey(
+        'core.Book', on_delete=models.CASCADE, related_name='+',
+        verbose_name=_('Book'), help_text=_('Book being read.')
+    )
+    page_number = models.PositiveIntegerField(
+        verbose_name=_('Page number'),
+        help_text=_('Number of the last page read.')
+    )
+    updated_at = models.DateTimeField(
+        verbose_name=_('Modification date'),
+        help_text=_('When the page was reached.')
+    )
+
+    def __str__(self):
+        """Return string representation of reading progress."""
+        return (
+            f"User {self.user_id} at page {self.page_number} "
+            f"of book {self.book_id}"
+        )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'book'], name='reading_progress_unique'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['user', '-updated_at'],
+                name='reading_progress_recent_idx'
+            ),
+        ]
@@ -76,11 +76,35 @@ class User(AbstractBaseUser, PermissionsMixin):
     objects = UserManager()
 
     USERNAME_FIELD = 'email'
+    # Fields copied into the access token claims, see `user.signals`.
+    TOKEN_CLAIM_FIELDS = ('role', 'is_active')
 
     def __str__(self):
         """Return string representation of user."""
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        user.remember_token_claims()
+        return user
+
+    def remember_token_claims(self):
+        """Keep the stored values of the token claim fields."""
+        deferred = self.get_deferred_fields()
+        self._token_claims = {
+            field: getattr(self, field)
+            for field in self.TOKEN_CLAIM_FIELDS if field not in deferred
+        }
+
+    def token_claims_changed(self, fields=None):
+        """Return True if a token claim field differs from its stored value."""
+        return any(
+            getattr(self, field) != value
+            for field, value in getattr(self, '_token_claims', {}).items()
+            if fields is None or field in fields
+        )
+
     def is_editor(self):
         """Check if the user is an editor."""
         return self.role == Roles.EDITOR
@@ -0,0 +1,33 @@
+"""
+Parsers shared by the APIs.
+"""
+import msgpack
+import orjson
+
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+
+class ORJSONParser(parsers.JSONParser):
+    """
+    JSON parser backed by orjson. The body must be UTF-8.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
+
+
+class MessagePackParser(parsers.BaseParser):
+    """
+    MessagePack parser.
+    """
+    media_type = 'application/msgpack'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read())
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f'MessagePack parse error - {exc}')
@@ -0,0 +1,52 @@
+"""
+Renderers shared by the APIs.
+"""
+import msgpack
+import orjson
+
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def default(obj):
+    """Convert the values the encoders do not support natively."""
+    return JSONEncoder().default(obj)
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Produces the same documents as the DRF renderer. Datetimes are passed
+    to the DRF encoder so they keep its millisecond precision.
+    """
+    options = (
+        orjson.OPT_NON_STR_KEYS |
+        orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=options)
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """
+    MessagePack renderer, a compact binary alternative to JSON.
+
+    Values without a MessagePack type (uuids, datetimes, decimals) are
+    rendered as in JSON.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=default, datetime=False)
@@ -0,0 +1,39 @@
+"""
+Storage of the collected static files.
+"""
+import gzip
+
+from django.contrib.staticfiles.storage import StaticFilesStorage
+from django.core.files.base import ContentFile
+
+
+class GzipStaticFilesStorage(StaticFilesStorage):
+    """
+    Write a gzip copy of the text assets at `collectstatic` time.
+
+    nginx serves the `.gz` files with `gzip_static` instead of compressing
+    on every request.
+    """
+    extensions = (
+        '.css', '.js', '.map', '.svg', '.json', '.html', '.txt', '.xml',
+    )
+    min_length = 512
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+        for name in paths:
+            if not name.endswith(self.extensions):
+                continue
+            with self.open(name) as original:
+                content = original.read()
+            if len(content) < self.min_length:
+                continue
+            compressed = gzip.compress(content, compresslevel=9, mtime=0)
+            if len(compressed) >= len(content):
+                continue
+            compressed_name = f'{name}.gz'
+            if self.exists(compressed_name):
+                self.delete(compressed_name)
+            self.save(compressed_name, ContentFile(compressed))
+            yield name, compressed_name, True
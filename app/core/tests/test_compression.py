@@ -0,0 +1,158 @@
+"""
+Tests for the response compression and the compressed static files.
+"""
+import gzip
+import tempfile
+from pathlib import Path
+
+import brotli
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.test import override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.middleware import CompressionMiddleware, negotiate_encoding
+from core.models import Book, Page
+from core.storage import GzipStaticFilesStorage
+
+
+CONTENT = b'The content of the page. ' * 100
+
+
+def compress(response, accept_encoding):
+    """Return the response as processed by the middleware."""
+    request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+    return CompressionMiddleware(lambda request: response)(request)
+
+
+class NegotiationTests(SimpleTestCase):
+    """Tests for the Accept-Encoding negotiation."""
+
+    def test_server_preference_on_tie(self):
+        """Test brotli is chosen when both codings weigh the same."""
+        self.assertEqual(negotiate_encoding('gzip, br', ('br', 'gzip')), 'br')
+
+    def test_weights(self):
+        """Test the client weights are honoured."""
+        self.assertEqual(
+            negotiate_encoding('br;q=0.5, gzip', ('br', 'gzip')), 'gzip'
+        )
+
+    def test_refused(self):
+        """Test codings with a zero weight are not used."""
+        self.assertIsNone(
+            negotiate_encoding('gzip;q=0, *;q=0', ('br', 'gzip'))
+        )
+        self.assertEqual(negotiate_encoding('*', ('br', 'gzip')), 'br')
+
+
+@override_settings(COMPRESSION_MIN_LENGTH=512)
+class CompressionMiddlewareTests(SimpleTestCase):
+    """Tests for the compression middleware."""
+
+    def test_brotli(self):
+        """Test responses are compressed with brotli when preferred."""
+        response = compress(HttpResponse(CONTENT), 'gzip, br')
+
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), CONTENT)
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+    def test_gzip(self):
+        """Test responses are compressed with gzip when preferred."""
+        response = compress(HttpResponse(CONTENT), 'gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), CONTENT)
+
+    def test_below_threshold(self):
+        """Test short responses are not compressed."""
+        response = compress(HttpResponse(CONTENT[:100]), 'br')
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_streaming(self):
+        """Test streaming responses are compressed chunk by chunk."""
+        response = compress(
+            StreamingHttpResponse(iter([CONTENT, CONTENT])), 'br'
+        )
+
+        self.assertEqual(
+            brotli.decompress(b''.join(response.streaming_content)),
+            CONTENT * 2,
+        )
+
+    def test_etag_made_weak(self):
+        """Test a strong ETag becomes weak once compressed."""
+        response = HttpResponse(CONTENT)
+        response['ETag'] = '"abc"'
+
+        self.assertEqual(compress(response, 'br')['ETag'], 'W/"abc"')
+
+
+class CompressedAPITests(TestCase):
+    """Test compressed API responses keep answering conditional GETs."""
+
+    def setUp(self):
+        self.client = APIClient()
+        user = get_user_model().objects.create_user(
+            email='user@example.com', password='testpass'
+        )
+        self.client.force_authenticate(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.book = Book.objects.create(title='Title', author='Author')
+            for i in range(1, 16):
+                Page.objects.create(
+                    book=self.book, number=i, content='Lorem ipsum ' * 100
+                )
+
+    def test_page_list_not_modified(self):
+        """Test the weak ETag of a compressed page list still matches."""
+        params = {'book_uuid': self.book.uuid}
+        res = self.client.get(
+            reverse('book:page-list'), params, HTTP_ACCEPT_ENCODING='br'
+        )
+        self.assertEqual(res['Content-Encoding'], 'br')
+        self.assertTrue(res['ETag'].startswith('W/'))
+
+        res = self.client.get(
+            reverse('book:page-list'), params,
+            HTTP_ACCEPT_ENCODING='br', HTTP_IF_NONE_MATCH=res['ETag'],
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class GzipStaticFilesStorageTests(SimpleTestCase):
+    """Tests for the compressed static files."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        self.storage = GzipStaticFilesStorage(location=directory.name)
+
+    def test_text_assets_compressed(self):
+        """Test a .gz copy is written next to the text assets."""
+        self.storage.save('app.css', ContentFile(CONTENT))
+        self.storage.save('small.js', ContentFile(b'var a = 1;'))
+        self.storage.save('logo.png', ContentFile(CONTENT))
+
+        processed = list(self.storage.post_process(
+            {name: (self.storage, name)
+             for name in ('app.css', 'small.js', 'logo.png')}
+        ))
+
+        self.assertEqual(processed, [('app.css', 'app.css.gz', True)])
+        self.assertEqual(
+            gzip.decompress((self.root / 'app.css.gz').read_bytes()),
+            CONTENT,
+        )
+        self.assertFalse((self.root / 'small.js.gz').exists())
+        self.assertFalse((self.root / 'logo.png.gz').exists())
@@ -0,0 +1,146 @@
+"""
+Tests for the Prometheus metrics.
+"""
+import tempfile
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from core import metrics
+from core.models import Book
+
+
+BOOKS_URL = reverse('book:book-list')
+METRICS_URL = reverse('metrics')
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class MetricsMiddlewareTests(TestCase):
+    """Tests for the request metrics."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='password123'
+        )
+        self.book = Book.objects.create(title='Book', author='Author')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_request_recorded(self):
+        """Test the count, latency and queries are labelled by URL name."""
+        labels = {'view': 'book:book-list', 'method': 'GET'}
+        requests = sample(
+            'http_requests_total', status='200', **labels
+        )
+        latencies = sample('http_request_duration_seconds_count', **labels)
+        queries = sample('http_request_db_queries_sum', **labels)
+
+        self.client.get(BOOKS_URL)
+
+        self.assertEqual(
+            sample('http_requests_total', status='200', **labels),
+            requests + 1,
+        )
+        self.assertEqual(
+            sample('http_request_duration_seconds_count', **labels),
+            latencies + 1,
+        )
+        self.assertGreater(
+            sample('http_request_db_queries_sum', **labels), queries
+        )
+        self.assertEqual(sample('http_requests_in_flight'), 0)
+
+    def test_unmatched_paths_folded(self):
+        """Test unknown paths share one label."""
+        before = sample(
+            'http_requests_total', view=metrics.UNMATCHED, method='GET',
+            status='404',
+        )
+
+        self.client.get('/no/such/path/')
+
+        self.assertEqual(
+            sample(
+                'http_requests_total', view=metrics.UNMATCHED, method='GET',
+                status='404',
+            ),
+            before + 1,
+        )
+
+    @override_settings(BOOK_CACHE_ALIAS='default')
+    def test_book_cache_hits(self):
+        """Test the book cache lookups are counted as hits and misses."""
+        url = reverse('book:book-detail', args=[self.book.uuid])
+        hits = sample('book_cache_requests_total', kind='payload',
+                      result='hit')
+        misses = sample('book_cache_requests_total', kind='payload',
+                        result='miss')
+
+        self.client.get(url)
+        self.client.get(url)
+
+        self.assertEqual(
+            sample('book_cache_requests_total', kind='payload',
+                   result='miss'),
+            misses + 1,
+        )
+        self.assertEqual(
+            sample('book_cache_requests_total', kind='payload',
+                   result='hit'),
+            hits + 1,
+        )
+
+
+@override_settings(METRICS_TOKEN='secret')
+class MetricsViewTests(TestCase):
+    """Tests for the metrics endpoint."""
+
+    def test_exposition(self):
+        """Test the metrics are served in the Prometheus text format."""
+        res = self.client.get(
+            METRICS_URL, headers={'Authorization': 'Bearer secret'}
+        )
+
+        self.assertEqual(res.status_code, 200)
+        self.assertIn(b'http_requests_total', res.content)
+
+    def test_token_required(self):
+        """Test scrapes without the token are refused."""
+        res = self.client.get(METRICS_URL)
+        self.assertEqual(res.status_code, 401)
+
+        res = self.client.get(
+            METRICS_URL, headers={'Authorization': 'Bearer wrong'}
+        )
+        self.assertEqual(res.status_code, 401)
+
+    @override_settings(METRICS_TOKEN='')
+    def test_disabled_without_token(self):
+        """Test the endpoint is disabled when no token is configured."""
+        res = self.client.get(METRICS_URL)
+
+        self.assertEqual(res.status_code, 404)
+
+
+class MultiProcessRegistryTests(SimpleTestCase):
+    """Tests for the aggregation across worker processes."""
+
+    def test_multiprocess_collector(self):
+        """Test the registry reads the shared directory when set."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        with patch.dict(
+            'os.environ', {'PROMETHEUS_MULTIPROC_DIR': directory.name}
+        ):
+            registry = metrics.get_registry()
+
+        self.assertIsNot(registry, REGISTRY)
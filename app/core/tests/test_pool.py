@@ -0,0 +1,224 @@
+"""
+Tests for the database connection pool.
+"""
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.backends.sqlite3 import base as sqlite_base
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from core.db import pool
+from core.db.pool import (
+    ConnectionPool,
+    PooledDatabaseWrapperMixin,
+    PoolTimeout,
+)
+
+
+POOL_STATS_URL = reverse('db-pool-stats')
+
+
+class FakeConnection:
+    """Connection recording whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class PooledSQLiteWrapper(
+    PooledDatabaseWrapperMixin, sqlite_base.DatabaseWrapper
+):
+
+    def ping_connection(self, connection):
+        connection.execute('SELECT 1')
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    """Tests for the pool itself."""
+
+    def make_pool(self, **kwargs):
+        kwargs.setdefault('timeout', 0.05)
+        return ConnectionPool(FakeConnection, **kwargs)
+
+    def test_released_connection_reused(self):
+        """Test a released connection is handed out again."""
+        connection_pool = self.make_pool()
+        connection = connection_pool.acquire()
+        connection_pool.release(connection)
+
+        self.assertIs(connection_pool.acquire(), connection)
+        self.assertEqual(connection_pool.stats()['connects'], 1)
+        self.assertEqual(connection_pool.stats()['checkouts'], 2)
+
+    def test_overflow_closed_on_release(self):
+        """Test connections beyond the size are closed when returned."""
+        connection_pool = self.make_pool(size=1, max_overflow=1)
+        first = connection_pool.acquire()
+        second = connection_pool.acquire()
+        self.assertEqual(connection_pool.stats()['overflow'], 1)
+
+        connection_pool.release(first)
+        connection_pool.release(second)
+
+        self.assertFalse(first.closed)
+        self.assertTrue(second.closed)
+        self.assertEqual(connection_pool.stats()['idle'], 1)
+
+    def test_exhausted_pool_times_out(self):
+        """Test acquiring beyond size and overflow fails after the timeout."""
+        connection_pool = self.make_pool(size=1, max_overflow=0)
+        connection_pool.acquire()
+
+        with self.assertRaises(PoolTimeout):
+            connection_pool.acquire()
+        self.assertEqual(connection_pool.stats()['timeouts'], 1)
+
+    def test_waiter_gets_released_connection(self):
+        """Test a waiting thread gets the connection another releases."""
+        connection_pool = self.make_pool(size=1, max_overflow=0, timeout=5)
+        connection = connection_pool.acquire()
+        acquired = []
+        waiter = threading.Thread(
+            target=lambda: acquired.append(connection_pool.acquire())
+        )
+        waiter.start()
+        connection_pool.release(connection)
+        waiter.join()
+
+        self.assertEqual(acquired, [connection])
+        self.assertEqual(connection_pool.stats()['connects'], 1)
+
+    def test_old_connection_recycled(self):
+        """Test connections older than recycle are replaced."""
+        connection_pool = self.make_pool(recycle=60)
+        connection = connection_pool.acquire()
+        connection_pool.release(connection)
+
+        with patch('time.monotonic', return_value=10 ** 9):
+            replacement = connection_pool.acquire()
+
+        self.assertIsNot(replacement, connection)
+        self.assertTrue(connection.closed)
+        self.assertEqual(connection_pool.stats()['recycled'], 1)
+
+    def test_dead_connection_replaced(self):
+        """Test an idle connection failing the ping is replaced."""
+        def ping(connection):
+            raise OSError('gone')
+
+        connection_pool = self.make_pool(ping=ping)
+        connection = connection_pool.acquire()
+        connection_pool.release(connection)
+
+        self.assertIsNot(connection_pool.acquire(), connection)
+        self.assertEqual(connection_pool.stats()['failed_pings'], 1)
+
+    def test_failed_connect_frees_slot(self):
+        """Test a failing connect does not leak a slot."""
+        connection_pool = ConnectionPool(
+            lambda: 1 / 0, size=1, max_overflow=0, timeout=0.05
+        )
+
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                connection_pool.acquire()
+        self.assertEqual(connection_pool.stats()['checked_out'], 0)
+
+
+class PooledDatabaseWrapperTests(SimpleTestCase):
+    """Tests for the pooled database wrapper."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = patch.dict(pool._pools, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(pool.close_pools)
+        self.settings_dict = {
+            **connections['default'].settings_dict,
+            'NAME': str(Path(directory.name) / 'pool.sqlite3'),
+            'CONN_MAX_AGE': 0,
+            'POOL': {'SIZE': 1, 'MAX_OVERFLOW': 0},
+        }
+
+    def make_wrapper(self):
+        wrapper = PooledSQLiteWrapper(self.settings_dict, alias='pooled')
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def query(self, wrapper):
+        with wrapper.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        wrapper.close_if_unusable_or_obsolete()
+
+    def test_requests_share_connection(self):
+        """Test the connection is returned at the end of each request."""
+        wrapper = self.make_wrapper()
+        for _ in range(3):
+            self.query(wrapper)
+
+        stats = pool.get_pool_stats()[f"pooled:{self.settings_dict['NAME']}"]
+        self.assertEqual(stats['connects'], 1)
+        self.assertEqual(stats['checkouts'], 3)
+        self.assertEqual(stats['checked_out'], 0)
+        self.assertIsNone(wrapper.connection)
+
+    def test_open_transaction_rolled_back(self):
+        """Test a connection is returned without its transaction."""
+        wrapper = self.make_wrapper()
+        with wrapper.cursor() as cursor:
+            cursor.execute('CREATE TABLE item (id integer)')
+        wrapper.set_autocommit(False)
+        with wrapper.cursor() as cursor:
+            cursor.execute('INSERT INTO item VALUES (1)')
+        wrapper.close()
+
+        other = self.make_wrapper()
+        with other.cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM item')
+            self.assertEqual(cursor.fetchone(), (0,))
+
+
+class DatabasePoolStatsApiTests(TestCase):
+    """Tests for the pool statistics endpoint."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_staff_only(self):
+        """Test the statistics are restricted to staff users."""
+        user = get_user_model().objects.create_user(
+            email='user@example.com', password='password123'
+        )
+        self.client.force_authenticate(user)
+
+        res = self.client.get(POOL_STATS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_stats_by_pool(self):
+        """Test the statistics of each pool are returned."""
+        admin = get_user_model().objects.create_superuser(
+            email='admin@example.com', password='password123'
+        )
+        self.client.force_authenticate(admin)
+        connection_pool = ConnectionPool(FakeConnection)
+        connection_pool.acquire()
+
+        with patch.dict(pool._pools, {'default:books': connection_pool}):
+            res = self.client.get(POOL_STATS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['default:books']['checked_out'], 1)
@@ -0,0 +1,99 @@
+"""
+Tests for the shared renderers and parsers.
+"""
+import datetime
+import decimal
+import io
+import uuid
+
+import msgpack
+
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from core.parsers import MessagePackParser, ORJSONParser
+from core.renderers import MessagePackRenderer, ORJSONRenderer
+
+
+DATA = {
+    'uuid': uuid.uuid4(),
+    'created_at': datetime.datetime(
+        2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc
+    ),
+    'day': datetime.date(2024, 5, 1),
+    'price': decimal.Decimal('1.50'),
+    'message': _('This field is required.'),
+    'pages': [{'number': 1, 'content': 'Ünïcode text'}],
+    'missing': None,
+}
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """Tests for the orjson renderer and parser."""
+
+    def test_same_values_as_drf(self):
+        """Test the document decodes to the same values as DRF's one."""
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(ORJSONRenderer().render(DATA))),
+            ORJSONParser().parse(io.BytesIO(JSONRenderer().render(DATA))),
+        )
+
+    def test_datetime_precision(self):
+        """Test datetimes are rendered like the DRF encoder does."""
+        value = timezone.now()
+
+        self.assertEqual(
+            ORJSONRenderer().render({'at': value}),
+            JSONRenderer().render({'at': value}),
+        )
+
+    def test_indent(self):
+        """Test the indent parameter of the media type is honoured."""
+        rendered = ORJSONRenderer().render(
+            {'number': 1}, 'application/json; indent=4'
+        )
+
+        self.assertIn(b'\n', rendered)
+
+    def test_invalid_json(self):
+        """Test invalid JSON raises a parse error."""
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"number": }'))
+
+
+class MessagePackRendererTests(SimpleTestCase):
+    """Tests for the MessagePack renderer and parser."""
+
+    def test_round_trip(self):
+        """Test rendered data parses back to its JSON values."""
+        rendered = MessagePackRenderer().render(DATA)
+
+        self.assertEqual(
+            MessagePackParser().parse(io.BytesIO(rendered)),
+            ORJSONParser().parse(io.BytesIO(ORJSONRenderer().render(DATA))),
+        )
+
+    def test_smaller_than_json(self):
+        """Test the payload is smaller than the JSON one."""
+        data = [{'number': i, 'content': 'x' * 10} for i in range(100)]
+
+        self.assertLess(
+            len(MessagePackRenderer().render(data)),
+            len(ORJSONRenderer().render(data)),
+        )
+
+    def test_invalid_payload(self):
+        """Test an invalid payload raises a parse error."""
+        with self.assertRaises(ParseError):
+            MessagePackParser().parse(io.BytesIO(b'\xc1'))
+
+    def test_trailing_data(self):
+        """Test trailing bytes raise a parse error."""
+        with self.assertRaises(ParseError):
+            MessagePackParser().parse(
+                io.BytesIO(msgpack.packb({'number': 1}) + b'\x01')
+            )
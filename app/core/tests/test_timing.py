@@ -0,0 +1,143 @@
+"""
+Tests for the request timing and the Server-Timing header.
+"""
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from django.contrib.auth import get_user_model
+from django.core.handlers.base import BaseHandler
+from django.test import (
+    AsyncRequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.urls import reverse
+
+from core import timing
+from core.middleware import MetricsMiddleware, ServerTimingMiddleware
+from core.models import Book
+
+from book import async_views
+
+
+BOOKS_URL = reverse('book:book-list')
+
+
+class RequestTimingTests(SimpleTestCase):
+    """Tests for the timing recorder."""
+
+    def test_nested_measures_count_once(self):
+        """Test a measure nested in the same measure is not added twice."""
+        with timing.start() as request_timing:
+            with request_timing.measure('serialize'):
+                with request_timing.measure('serialize'):
+                    pass
+
+        self.assertEqual(list(request_timing.durations), ['serialize'])
+        self.assertIsNone(timing.current())
+
+    def test_timed_without_request(self):
+        """Test timed functions run as they are outside a request."""
+        function = timing.timed('serialize')(lambda value: value * 2)
+
+        self.assertEqual(function(2), 4)
+
+
+class ServerTimingMiddlewareTests(TestCase):
+    """Tests for the Server-Timing middleware."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='password123'
+        )
+        self.admin = get_user_model().objects.create_superuser(
+            email='admin@example.com', password='password123'
+        )
+        Book.objects.create(title='Book', author='Author')
+        self.client = APIClient()
+
+    def get_timing(self, user):
+        self.client.force_authenticate(user)
+        res = self.client.get(BOOKS_URL)
+        return res.headers.get('Server-Timing')
+
+    @override_settings(SERVER_TIMING='staff')
+    def test_header_for_staff(self):
+        """Test staff users get the query count and the durations."""
+        header = self.get_timing(self.admin)
+
+        metrics = dict(
+            metric.split(';', 1)[0:2] for metric in header.split(', ')
+        )
+        self.assertEqual(
+            set(metrics), {'db', 'serialize', 'render', 'view'}
+        )
+        self.assertRegex(metrics['db'], r'dur=[\d.]+;desc="[1-9]\d* queries"')
+
+    @override_settings(SERVER_TIMING='staff')
+    def test_no_header_for_users(self):
+        """Test other users do not get the header in staff mode."""
+        self.assertIsNone(self.get_timing(self.user))
+
+    @override_settings(SERVER_TIMING='all')
+    def test_header_for_all(self):
+        """Test every user gets the header in all mode."""
+        self.assertIsNotNone(self.get_timing(self.user))
+
+    @override_settings(SERVER_TIMING='off', SERVER_TIMING_LOG=False)
+    def test_off(self):
+        """Test the header is not sent to anyone when off."""
+        self.assertIsNone(self.get_timing(self.admin))
+
+    @override_settings(SERVER_TIMING='off', SERVER_TIMING_LOG=True)
+    def test_log_line(self):
+        """Test the times are logged when enabled."""
+        with self.assertLogs('core.middleware', 'INFO') as logs:
+            header = self.get_timing(self.user)
+
+        self.assertIsNone(header)
+        record = logs.records[0].server_timing
+        self.assertEqual(record['view'], 'book:book-list')
+        self.assertEqual(record['status'], 200)
+        self.assertGreater(record['queries'], 0)
+        self.assertIn('serialize_ms', record)
+
+
+@override_settings(SERVER_TIMING='all')
+class AsyncMiddlewareTests(TestCase):
+    """Tests for the timing middleware under ASGI."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='user@example.com', password='password123'
+        )
+        token = AccessToken.for_user(self.user)
+        self.headers = {'Authorization': f'Bearer {token}'}
+        Book.objects.create(title='Book', author='Author')
+
+    def test_no_sync_adapter(self):
+        """Test the async middleware chain is not adapted to sync."""
+        with patch(
+            'django.core.handlers.base.async_to_sync', wraps=async_to_sync
+        ) as adapter:
+            BaseHandler().load_middleware(is_async=True)
+
+        adapter.assert_not_called()
+
+    async def test_async_view(self):
+        """Test the async views are awaited and timed by the middleware."""
+        middleware = MetricsMiddleware(
+            ServerTimingMiddleware(async_views.AsyncBookListView.as_view())
+        )
+        request = AsyncRequestFactory().get('/', headers=self.headers)
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        res = await middleware(request)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertIn('serialize', res.headers['Server-Timing'])
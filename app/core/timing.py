@@ -0,0 +1,96 @@
+"""
+Per-request timing of the database, serialization and rendering.
+
+`ServerTimingMiddleware` starts a `RequestTiming` for each request. Code
+that wants to be measured looks it up with `current()`, which is a single
+context variable read when timing is disabled.
+"""
+import functools
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+
+_current = ContextVar('request_timing', default=None)
+
+
+def current():
+    """Return the timing of the current request, or None."""
+    return _current.get()
+
+
+class RequestTiming:
+    """
+    Durations in seconds and counts of the measured parts of a request.
+    """
+
+    def __init__(self):
+        self.durations = {}
+        self.queries = 0
+        self._active = set()
+
+    @contextmanager
+    def measure(self, name):
+        """Add the enclosed time to `name`, nested measures count once."""
+        if name in self._active:
+            yield
+            return
+        self._active.add(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._active.discard(name)
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name, duration):
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+
+    def record_query(self, execute, sql, params, many, context):
+        """Execute wrapper counting and timing the queries."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.add('db', time.perf_counter() - started)
+
+
+def timed(name):
+    """Decorate a function to add its time to `name` of the request."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            timing = _current.get()
+            if timing is None:
+                return function(*args, **kwargs)
+            with timing.measure(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def start():
+    """
+    Time the enclosed request, yielding its `RequestTiming`.
+
+    The queries of every connection are recorded. Within a timed request,
+    the running timing is yielded so the middleware can share it.
+    """
+    timing = _current.get()
+    if timing is not None:
+        yield timing
+        return
+    timing = RequestTiming()
+    token = _current.set(timing)
+    try:
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(
+                    connections[alias].execute_wrapper(timing.record_query)
+                )
+            yield timing
+    finally:
+        _current.reset(token)
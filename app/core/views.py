@@ -0,0 +1,51 @@
+"""
+Views for the operational endpoints.
+"""
+import hmac
+
+from drf_spectacular.utils import extend_schema
+from prometheus_client import CONTENT_TYPE_LATEST
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views import View
+
+from core import metrics
+from core.db.pool import get_pool_stats
+
+
+class DatabasePoolStatsView(APIView):
+    """Usage of the database connection pools of the serving process."""
+    # Staff status is only known from the user row.
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [permissions.IsAdminUser]
+
+    @extend_schema(responses={200: dict})
+    def get(self, request):
+        return Response(get_pool_stats())
+
+
+class MetricsView(View):
+    """
+    Prometheus metrics of all the worker processes.
+
+    Scrapes must send `METRICS_TOKEN` as a bearer token. Without a token
+    configured the endpoint is disabled.
+    """
+
+    def get(self, request):
+        token = getattr(settings, 'METRICS_TOKEN', '')
+        if not token:
+            raise Http404
+        if not hmac.compare_digest(
+            request.headers.get('Authorization', ''), f'Bearer {token}'
+        ):
+            return HttpResponse(status=401)
+        return HttpResponse(
+            metrics.render(), content_type=CONTENT_TYPE_LATEST
+        )
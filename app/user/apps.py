@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class UserConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'user'
+
+    def ready(self):
+        """
+        Import signals when the app is ready.
+        This ensures that the signals are registered and ready to use.
+        """
+        import user.signals # noqa
+        from user.authentication import check_revocation_cache
+        check_revocation_cache()
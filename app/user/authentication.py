@@ -0,0 +1,127 @@
+"""
+Stateless JWT authentication for the APIs.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework_simplejwt.authentication import (
+    JWTStatelessUserAuthentication,
+)
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from core.constants.roles_enum import Roles
+
+
+def get_revocation_cache():
+    """Return the cache holding the token revocations."""
+    return caches[getattr(settings, 'JWT_REVOCATION_CACHE_ALIAS', 'default')]
+
+
+def check_revocation_cache():
+    """
+    Refuse to check revocations in a cache the workers do not share, a
+    revocation would only be seen by the worker that made it.
+    """
+    if not getattr(settings, 'JWT_REVOCATION_CHECK', False):
+        return
+    if isinstance(get_revocation_cache(), (LocMemCache, DummyCache)):
+        raise ImproperlyConfigured(
+            'JWT_REVOCATION_CHECK needs JWT_REVOCATION_CACHE_ALIAS to name '
+            'a cache shared by the workers, such as Redis.'
+        )
+
+
+def revocation_key(user_id):
+    return f'user:{user_id}:token_revision'
+
+
+def revoke_user_tokens(user_id):
+    """
+    Revoke the access tokens issued to the user until now.
+
+    Each revocation stores a new revision of the user's tokens, and only
+    tokens carrying the latest revision in their `revision` claim are
+    accepted. The revision only has to outlive the access tokens,
+    refreshing reloads the claims from the database.
+    """
+    lifetime = api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+    get_revocation_cache().set(
+        revocation_key(user_id), time.time_ns(), int(lifetime) + 1,
+    )
+
+
+def get_token_revision(user_id):
+    """Return the current revision of the user's tokens, or None."""
+    return get_revocation_cache().get(revocation_key(user_id))
+
+
+def add_revision_claim(token, user_id):
+    """Stamp the token with the current revision, when checked."""
+    if getattr(settings, 'JWT_REVOCATION_CHECK', False):
+        token['revision'] = get_token_revision(user_id)
+
+
+def token_revoked(token):
+    """Return True if the user's tokens were revoked since it was issued."""
+    revision = get_token_revision(token[api_settings.USER_ID_CLAIM])
+    return revision is not None and token.get('revision') != revision
+
+
+class RoleTokenUser(TokenUser):
+    """
+    User built from the claims of an access token.
+
+    Exposes the `role` and `is_active` claims added by
+    `CustomTokenObtainPairSerializer`, which is all the permissions need.
+    """
+
+    @cached_property
+    def role(self):
+        return self.token.get('role', Roles.READER)
+
+    @cached_property
+    def is_active(self):
+        return self.token.get('is_active', True)
+
+    def is_editor(self):
+        """Check if the user is an editor."""
+        return self.role == Roles.EDITOR
+
+    def is_reader(self):
+        """Check if the user is a reader."""
+        return self.role == Roles.READER
+
+
+class StatelessJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    JWT authentication that trusts the token claims instead of loading
+    the user from the database.
+
+    Role changes and deactivations are seen once the access token expires
+    (`ACCESS_TOKEN_LIFETIME`). With `JWT_REVOCATION_CHECK` enabled, they
+    are seen immediately through a cache lookup.
+    """
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        if not user.is_active:
+            raise AuthenticationFailed(
+                _('User is inactive'), code='user_inactive'
+            )
+        if (
+            getattr(settings, 'JWT_REVOCATION_CHECK', False) and
+            token_revoked(validated_token)
+        ):
+            raise AuthenticationFailed(
+                _('Token has been revoked'), code='token_revoked'
+            )
+        return user
@@ -2,11 +2,19 @@
 Serializers for the user API View.
 """
 from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
 
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
 
 from rest_framework import serializers
 
+from user.authentication import add_revision_claim
+
 
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for the user object."""
@@ -45,4 +53,29 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def get_token(cls, user):
         token = super().get_token(user)
         token['role'] = user.role
+        token['is_active'] = user.is_active
+        add_revision_claim(token, user.pk)
         return token
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """Token refresh serializer reloading the user claims."""
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        user = get_user_model().objects.filter(**{
+            api_settings.USER_ID_FIELD:
+                refresh.payload.get(api_settings.USER_ID_CLAIM),
+        }).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                _('No active account found for the given token.'),
+                'no_active_account',
+            )
+
+        # The access token copies the claims of the refresh token, which
+        # may be older than the last role change.
+        refresh['role'] = user.role
+        refresh['is_active'] = user.is_active
+        add_revision_claim(refresh, user.pk)
+        return {'access': str(refresh.access_token)}
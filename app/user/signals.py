@@ -0,0 +1,30 @@
+"""
+Signals for the User app.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from user.authentication import revoke_user_tokens
+
+
+@receiver(post_save, sender=get_user_model())
+def revoke_stale_tokens(sender, instance, created, update_fields=None,
+                        **kwargs):
+    """
+    Revoke the access tokens of a user whose role or active state changed.
+
+    The saved values are compared with the ones the user was loaded or
+    last saved with, so no query is needed.
+    """
+    if not created and instance.token_claims_changed(update_fields):
+        revoke_user_tokens(instance.pk)
+    instance.remember_token_claims()
+
+
+@receiver(post_delete, sender=get_user_model())
+def revoke_deleted_user_tokens(sender, instance, **kwargs):
+    """
+    Revoke the access tokens of a deleted user.
+    """
+    revoke_user_tokens(instance.pk)
@@ -0,0 +1,147 @@
+"""
+Tests for the stateless JWT authentication.
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from book.views import BookViewSet
+from core.constants.roles_enum import Roles
+from user.authentication import (
+    StatelessJWTAuthentication,
+    check_revocation_cache,
+)
+
+
+TOKEN_URL = reverse('user:token')
+TOKEN_REFRESH_URL = reverse('user:token_refresh')
+BOOKS_URL = reverse('book:book-list')
+
+
+@patch.object(
+    BookViewSet, 'authentication_classes', [StatelessJWTAuthentication]
+)
+class StatelessJWTAuthenticationTests(TestCase):
+    """Test authenticating from the token claims."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.password = 'test-user-password123'
+        self.user = get_user_model().objects.create_editor_user(
+            email='editor@example.com', password=self.password
+        )
+
+    def authenticate(self):
+        """Obtain a token pair and use its access token."""
+        res = self.client.post(
+            TOKEN_URL,
+            {'email': self.user.email, 'password': self.password}
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {res.data['access']}"
+        )
+        return res.data
+
+    def test_read_without_user_query(self):
+        """Test a read request does not load the user."""
+        self.authenticate()
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(BOOKS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(any(
+            'core_user' in query['sql'] for query in queries
+        ))
+
+    def test_role_claim_allows_write(self):
+        """Test the role claim is enough to authorize editors."""
+        self.authenticate()
+
+        res = self.client.post(
+            BOOKS_URL, {'title': 'Test Book', 'author': 'Test Author'}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+    @override_settings(JWT_REVOCATION_CHECK=True)
+    def test_role_change_revokes_tokens(self):
+        """Test a role change revokes the issued tokens."""
+        tokens = self.authenticate()
+        self.user.role = Roles.READER
+        self.user.save()
+
+        res = self.client.get(BOOKS_URL)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        # Refreshed right away, within the second of the revocation.
+        res = self.client.post(
+            TOKEN_REFRESH_URL, {'refresh': tokens['refresh']}
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {res.data['access']}"
+        )
+        res = self.client.post(
+            BOOKS_URL, {'title': 'Test Book', 'author': 'Test Author'}
+        )
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(JWT_REVOCATION_CHECK=True)
+    def test_token_after_revocation_accepted(self):
+        """Test a token obtained right after a revocation is accepted."""
+        self.user.is_active = False
+        self.user.save()
+        self.user.is_active = True
+        self.user.save()
+
+        self.authenticate()
+        res = self.client.get(BOOKS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_claim_change_detected_without_query(self):
+        """Test saving a user does not reload it to detect claim changes."""
+        user = get_user_model().objects.get(pk=self.user.pk)
+        user.role = Roles.READER
+
+        with patch('user.signals.revoke_user_tokens') as revoke:
+            with self.assertNumQueries(1):
+                user.save()
+            user.save()
+
+        revoke.assert_called_once_with(user.pk)
+
+    def test_refresh_rejects_inactive_user(self):
+        """Test refreshing the token of a deactivated user fails."""
+        tokens = self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        res = self.client.post(
+            TOKEN_REFRESH_URL, {'refresh': tokens['refresh']}
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class RevocationCacheCheckTests(SimpleTestCase):
+    """Test the revocation check requires a shared cache."""
+
+    @override_settings(JWT_REVOCATION_CHECK=True)
+    def test_local_cache_refused(self):
+        """Test a per-process cache is refused when checking."""
+        with self.assertRaises(ImproperlyConfigured):
+            check_revocation_cache()
+
+    @override_settings(JWT_REVOCATION_CHECK=False)
+    def test_local_cache_without_check(self):
+        """Test any cache is accepted when revocations are not checked."""
+        check_revocation_cache()
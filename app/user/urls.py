@@ -3,8 +3,6 @@ URL mappings for the user API.
 """
 from django.urls import path
 
-from rest_framework_simplejwt.views import TokenRefreshView
-
 from user import views
 
 
@@ -13,6 +11,10 @@ app_name = 'user'
 urlpatterns = [
     path('create/', views.CreateUserView.as_view(), name='create'),
     path('token/', views.CustomTokenObtainPairView.as_view(), name='token'),
-    path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path(
+        'token/refresh/',
+        views.CustomTokenRefreshView.as_view(),
+        name='token_refresh'
+    ),
     path('me/', views.ManageUserView.as_view(), name='me'),
 ]
@@ -3,8 +3,16 @@ Views for user API.
 """
 from rest_framework import generics, permissions
 
-from rest_framework_simplejwt.views import TokenObtainPairView
-from user.serializers import UserSerializer, CustomTokenObtainPairSerializer
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.views import (
+    TokenObtainPairView,
+    TokenRefreshView,
+)
+from user.serializers import (
+    UserSerializer,
+    CustomTokenObtainPairSerializer,
+    CustomTokenRefreshSerializer,
+)
 
 
 class CreateUserView(generics.CreateAPIView):
@@ -17,12 +25,19 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
 
+class CustomTokenRefreshView(TokenRefreshView):
+    """Token refresh view reloading the user role into the token."""
+    serializer_class = CustomTokenRefreshSerializer
+
+
 class ManageUserView(
     generics.RetrieveUpdateAPIView,
     generics.DestroyAPIView,
 ):
     """Manage the authenticated user."""
     serializer_class = UserSerializer
+    # Managing the account needs the user row, not only the token claims.
+    authentication_classes = [JWTAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self):
@@ -3,6 +3,9 @@ server {
 
     location /static {
         alias /vol/static;
+        # Serve the .gz copies written by collectstatic.
+        gzip_static             on;
+        gzip_vary               on;
     }
 
     location / {
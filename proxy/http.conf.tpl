@@ -0,0 +1,18 @@
+server {
+    listen ${LISTEN_PORT};
+
+    location /static {
+        alias /vol/static;
+        # Serve the .gz copies written by collectstatic.
+        gzip_static             on;
+        gzip_vary               on;
+    }
+
+    location / {
+        proxy_pass              http://${APP_HOST}:${APP_PORT};
+        proxy_http_version      1.1;
+        proxy_set_header        Host $host;
+        proxy_set_header        X-Forwarded-For $proxy_add_x_forwarded_for;
+        proxy_set_header        X-Forwarded-Proto $scheme;
+    }
+}
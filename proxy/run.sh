@@ -2,5 +2,11 @@
 
 set -e
 
-envsubst < /etc/nginx/default.conf.tpl > /etc/nginx/conf.d/default.conf
-nginx -g 'daemon off;'
\ No newline at end of file
+if [ "$APP_PROTOCOL" = "http" ]; then
+    template=/etc/nginx/http.conf.tpl
+else
+    template=/etc/nginx/default.conf.tpl
+fi
+
+envsubst '${LISTEN_PORT} ${APP_HOST} ${APP_PORT}' < $template > /etc/nginx/conf.d/default.conf
+nginx -g 'daemon off;'
@@ -6,4 +6,15 @@ python manage.py wait_for_db
 python manage.py collectstatic --noinput
 python manage.py migrate
 
-uwsgi --socket :9000 --workers 4 --master --enable-threads --module app.wsgi
+# The workers share their Prometheus metrics through this directory,
+# emptied on start so counters do not carry over from a previous run.
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+if [ "$SERVER_MODE" = "asgi" ]; then
+    uvicorn app.asgi:application --host 0.0.0.0 --port 9000 \
+        --workers "${SERVER_WORKERS:-4}" --no-access-log
+else
+    uwsgi --socket :9000 --workers 4 --master --enable-threads --module app.wsgi
+fi